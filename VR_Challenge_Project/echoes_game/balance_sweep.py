@@ -0,0 +1,211 @@
+# balance_sweep.py
+"""
+Headless combat balance sweep across a process pool.
+
+Every run steps a combat scene's sim.story chapter on its own (no display,
+Surface or font), applies one set of parameter overrides, lets a bot play it
+on the simulated clock (as fast as the CPU allows) and records how long the
+intro took, time-to-kill from the first combat tick, damage taken and whether
+the player died. Runs are spread over all cores and aggregated per scene and
+parameter set:
+
+    python balance_sweep.py --runs 200
+    python balance_sweep.py --scenes RiftZoneScene --grid contact_damage=8,10,12 enemy_speed=2,3
+    python balance_sweep.py --bot random --csv sweep.csv
+
+Overridable parameters: contact_damage (chapter world), enemy_speed, patrol_width,
+enemy_health (every enemy in the chapter) and attack_damage (player).
+"""
+import os
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse
+import csv
+import itertools
+import random
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from config import settings
+from core.bot import BotInput
+from core.clock import SimulatedClock
+from sim.story import CHAPTERS
+
+# Scenes with an Enemy roster and contact damage
+COMBAT_SCENES = [
+    "AshfallCityScene",
+    "RiftZoneScene",
+    "AscendantSpireScene",
+    "RuinedArchiveScene",
+    "MirrorWalkScene",
+]
+
+PARAMETERS = ("contact_damage", "enemy_speed", "patrol_width", "enemy_health", "attack_damage")
+
+
+# -------------------------------------------------------------
+# Worker side
+# -------------------------------------------------------------
+def apply_overrides(chapter, params):
+    """Overrides go into the chapter's sim.world state (what the combat rules read)."""
+    world = chapter.world
+    if "contact_damage" in params:
+        world.contact_damage = params["contact_damage"]
+    if "attack_damage" in params:
+        world.player.attack_damage = params["attack_damage"]
+    for enemy in world.roster:
+        if "enemy_speed" in params:
+            enemy.speed = params["enemy_speed"]
+        if "patrol_width" in params:
+            enemy.patrol_width = params["patrol_width"]
+        if "enemy_health" in params:
+            enemy.max_health = params["enemy_health"]
+            enemy.health = enemy.max_health
+
+
+def run_one(job):
+    """One headless fight on the scene's chapter -> dict of results."""
+    scene_name, params, policy, seed, max_seconds = job
+
+    # Fresh clock / chapter / input per run so every run starts from t = 0
+    clock = SimulatedClock()
+    chapter = CHAPTERS[scene_name](clock=clock)
+    apply_overrides(chapter, params)
+    bot = BotInput(policy, random.Random(seed))
+    bot.chapter = chapter
+
+    dt = 1.0 / settings.TICK_RATE
+    max_ticks = int(max_seconds * settings.TICK_RATE)
+    outcome = "timeout"
+    ticks = 0
+    combat_start = None   # first tick the world steps (intro dialogue closed)
+    while ticks < max_ticks:
+        # Same order as Game.step: game time, input, events, update
+        clock.advance(dt)
+        bot.begin_tick()
+        target = chapter.handle_events(bot.events)
+        if target is None:
+            if combat_start is None and chapter.active_dialogue() is None:
+                combat_start = ticks
+            target = chapter.step(bot.keys, dt)
+        ticks += 1
+        if target is not None:
+            outcome = "left"
+            break
+        if chapter.player_dead:
+            outcome = "died"
+            break
+        if chapter.world.cleared:
+            outcome = "cleared"
+            break
+
+    return {
+        "scene": scene_name,
+        "params": params,
+        "outcome": outcome,
+        "seconds": ticks / settings.TICK_RATE,
+        "intro_seconds": None if combat_start is None else combat_start / settings.TICK_RATE,
+        "ttk": (ticks - combat_start) / settings.TICK_RATE if outcome == "cleared" else None,
+        "damage_taken": chapter.player.max_health - chapter.player.health,
+    }
+
+
+# -------------------------------------------------------------
+# Sweep
+# -------------------------------------------------------------
+def parse_grid(items):
+    """["contact_damage=8,10", "enemy_speed=2,3"] -> list of param dicts (cartesian product)."""
+    axes = []
+    for item in items or []:
+        name, _, values = item.partition("=")
+        if name not in PARAMETERS or not values:
+            raise SystemExit(f"bad --grid entry {item!r} (parameters: {', '.join(PARAMETERS)})")
+        axes.append([(name, int(v)) for v in values.split(",")])
+    return [dict(combo) for combo in itertools.product(*axes)] or [{}]
+
+
+def mean(values):
+    return sum(values) / len(values) if values else float("nan")
+
+
+def median(values):
+    return statistics.median(values) if values else float("nan")
+
+
+def aggregate(results):
+    groups = {}
+    for r in results:
+        key = (r["scene"], tuple(sorted(r["params"].items())))
+        groups.setdefault(key, []).append(r)
+
+    rows = []
+    for (scene_name, params), runs in groups.items():
+        ttk = [r["ttk"] for r in runs if r["ttk"] is not None]
+        intro = [r["intro_seconds"] for r in runs if r["intro_seconds"] is not None]
+        rows.append({
+            "scene": scene_name,
+            "params": " ".join(f"{k}={v}" for k, v in params) or "(defaults)",
+            "runs": len(runs),
+            "death_rate": sum(r["outcome"] == "died" for r in runs) / len(runs),
+            "timeout_rate": sum(r["outcome"] == "timeout" for r in runs) / len(runs),
+            "intro_mean": mean(intro),
+            "ttk_mean": mean(ttk),
+            "ttk_p50": median(ttk),
+            "damage_mean": mean([r["damage_taken"] for r in runs]),
+        })
+    return rows
+
+
+def format_table(rows):
+    header = f"{'scene':<22}{'params':<44}{'runs':>6}{'death%':>8}{'timeout%':>10}{'intro s':>9}{'ttk s':>8}{'ttk p50':>9}{'dmg':>7}"
+    lines = [header, "-" * len(header)]
+    for r in rows:
+        lines.append(
+            f"{r['scene']:<22}{r['params']:<44}{r['runs']:>6}{r['death_rate'] * 100:>8.1f}"
+            f"{r['timeout_rate'] * 100:>10.1f}{r['intro_mean']:>9.2f}{r['ttk_mean']:>8.2f}{r['ttk_p50']:>9.2f}"
+            f"{r['damage_mean']:>7.1f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless multiprocess combat balance sweep")
+    parser.add_argument("--scenes", nargs="*", default=COMBAT_SCENES, help="combat scenes to run")
+    parser.add_argument("--grid", nargs="*", help="overrides, e.g. contact_damage=8,10,12 enemy_speed=2,3")
+    parser.add_argument("--runs", type=int, default=100, help="runs per scene and parameter set")
+    parser.add_argument("--bot", choices=("chase", "random"), default="chase", help="bot input policy")
+    parser.add_argument("--max-seconds", type=float, default=120.0, help="game-time cap per run")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="processes (default: all cores)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--csv", help="also write the aggregated table here")
+    args = parser.parse_args(argv)
+
+    jobs = [
+        (scene_name, params, args.bot, args.seed * 1_000_003 + i, args.max_seconds)
+        for scene_name in args.scenes
+        for params in parse_grid(args.grid)
+        for i in range(args.runs)
+    ]
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        results = list(pool.map(run_one, jobs, chunksize=max(1, len(jobs) // (args.workers * 8))))
+    elapsed = time.perf_counter() - start
+
+    rows = aggregate(results)
+    print(format_table(rows))
+    print(f"\n{len(jobs)} runs on {args.workers} processes in {elapsed:.1f} s")
+
+    if args.csv:
+        with open(args.csv, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+# benchmark.py
+"""
+Headless frame-cost benchmark for every story scene.
+
+Boots Game on SDL's dummy video driver and plays each scene for N frames
+through the real tick path (the two halves of Game.step) with a seeded bot
+(core.bot) that taps through dialogues, moves, dashes and attacks. Fights
+restart when the player dies or the roster is cleared, so combat keeps running
+for the whole measurement. Reports per-phase timings as JSON:
+
+    python benchmark.py --frames 600 --output bench.json
+    python benchmark.py --scenes RiftZoneScene OriginCoreScene
+    python benchmark.py --bot random --seed 3
+"""
+import os
+
+# لازم قبل import pygame علشان يشتغل على CI من غير شاشة
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")  # stdout = JSON only
+
+import argparse
+import json
+import random
+import sys
+import time
+
+import pygame
+
+import scenes
+from core.bot import BotInput
+from core.clock import SimulatedClock
+from core.game import Game
+
+# Every registered scene except the menu, in chapter order (stress test last)
+SCENES = [name for name in scenes.SCENES if name != "MainMenu"]
+
+# handle_events = Game.step_events() (game time + bot input + scene.handle_events),
+# update = Game.step_update()
+PHASES = ("handle_events", "update", "draw", "frame")
+
+
+def percentile(sorted_values, q):
+    index = min(len(sorted_values) - 1, int(round(q * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def summarize(samples):
+    """ms stats for one phase."""
+    values = sorted(s * 1000.0 for s in samples)
+    return {
+        "mean": round(sum(values) / len(values), 4),
+        "p50": round(percentile(values, 0.50), 4),
+        "p95": round(percentile(values, 0.95), 4),
+        "p99": round(percentile(values, 0.99), 4),
+    }
+
+
+def bench_scene(game, scene_class, frames, warmup, seed, policy="chase"):
+    # Every scene starts the same way: game time at 0, same bot decisions
+    game.clock = SimulatedClock()
+    bot = game.input = BotInput(policy, random.Random(seed))
+    scene = scene_class(game)
+    game.change_scene(scene)
+    chapter = bot.chapter = scene.chapter
+
+    # Story chapters without enemies start out cleared; only fights end that way
+    fight = not chapter.world.cleared
+
+    timings = {phase: [] for phase in PHASES}
+    clock = time.perf_counter
+
+    for frame in range(warmup + frames):
+        t0 = clock()
+        game.step_events()
+        t1 = clock()
+        game.step_update()
+        t2 = clock()
+        scene.draw(game.screen)
+        t3 = clock()
+
+        # Keep measuring this scene: restart it after a death, a cleared fight
+        # or a transition (not timed)
+        if (
+            game.current_scene is not scene
+            or chapter.player_dead
+            or (fight and chapter.world.cleared)
+        ):
+            game.change_scene(scene)
+            scene.reset()
+
+        if frame >= warmup:
+            timings["handle_events"].append(t1 - t0)
+            timings["update"].append(t2 - t1)
+            timings["draw"].append(t3 - t2)
+            timings["frame"].append(t3 - t0)
+
+    return {phase: summarize(samples) for phase, samples in timings.items()}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless per-scene frame benchmark")
+    parser.add_argument("--frames", type=int, default=600, help="measured frames per scene")
+    parser.add_argument("--warmup", type=int, default=10, help="unmeasured frames per scene")
+    parser.add_argument("--scenes", nargs="*", help="only these scene class names")
+    parser.add_argument("--output", help="write JSON here instead of stdout")
+    parser.add_argument("--bot", choices=("chase", "random"), default="chase", help="bot input policy")
+    parser.add_argument("--seed", type=int, default=0, help="bot seed")
+    args = parser.parse_args(argv)
+
+    game = Game("MainMenu")
+
+    results = {}
+    for class_name in SCENES:
+        if args.scenes and class_name not in args.scenes:
+            continue
+        scene_class = scenes.get(class_name)
+        results[class_name] = bench_scene(game, scene_class, args.frames, args.warmup, args.seed, args.bot)
+
+    report = {
+        "frames": args.frames,
+        "warmup": args.warmup,
+        "bot": args.bot,
+        "seed": args.seed,
+        "unit": "ms",
+        "driver": pygame.display.get_driver(),
+        "scenes": results,
+    }
+    text = json.dumps(report, indent=2)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -41,3 +41,59 @@ COLOR_PLAYER_ACCENT = (255, 170, 80)
 COLOR_PLAYER_SUIT_TOP = (70, 230, 190)     # أعلى الجسم (أفتح = إضاءة)
 COLOR_PLAYER_SUIT_FRONT = (25, 140, 110)   # الواجهة الأمامية (أغمق = ظل)
 COLOR_PLAYER_SUIT_SIDE = (35, 180, 140)    # الجانب (متوسط)
+
+# كاش النصوص المرسومة (core.ui)
+TEXT_CACHE_MAX_BYTES = 4 * 1024 * 1024
+
+# Dirty-rect rendering (اختياري): المشاهد اللي بترجع dirty_rects() بتتحدث جزئياً
+DIRTY_RECTS = False
+DIRTY_RECT_MAX_COVERAGE = 0.4  # لو المساحة المتغيرة أكبر من كده نعمل flip كامل
+
+# Fixed-timestep simulation (مستقل عن FPS الرسم)
+TICK_RATE = 60          # ticks في الثانية للـ update
+MAX_CATCHUP_TICKS = 5   # أقصى ticks في فريم واحد (ضد الـ spiral of death)
+
+# Spatial hash broadphase (core.spatial) – حجم الخلية بالبكسل
+SPATIAL_CELL_SIZE = 64
+
+# Rift surge (stress test): عدد الأعداء في الـ EnemySwarm
+RIFT_SURGE_ENEMIES = 2000
+
+# Profiler overlay (F3) / Chrome trace capture (F4)
+PROFILER_HISTORY = 180                 # عدد الفريمات في الجراف
+PROFILER_TRACE_PATH = "profile_trace.json"
+
+# Animation cache (core.anim_cache): الـ glow / halo المتكررة بتترسم مرة لكل phase
+ANIM_CACHE_PHASES = 32                    # عدد الـ frames في الدورة الواحدة (K)
+ANIM_CACHE_MAX_BYTES = 8 * 1024 * 1024    # أقصى ذاكرة للـ frames المتخزنة
+
+# Dialogue typewriter: عدد الحروف في الثانية (0 = السطر يظهر كامل مرة واحدة)
+DIALOGUE_CHARS_PER_SEC = 45
+
+# لغة الحوارات (story/bundles/<LOCALE>/*.dlg)
+LOCALE = "en"
+
+# Scene preloading: أقصى وقت (ms) في الفريم لبناء المشهد الجاي في الخلفية
+# (بيتشيك بين الـ steps: الـ constructor وكل warm_up step بيخلصوا مرة واحدة)
+PRELOAD_BUDGET_MS = 2.0
+
+# Scene pool: عدد المشاهد اللي بتفضل محفوظة علشان الـ restart / الرجوع للمنيو يبقى فوري
+SCENE_POOL_MAX = 6
+
+# Fast start: init للـ display و font و timer بس بدل pygame.init() (من غير mixer / joystick)
+FAST_START = True
+
+# Render backend: "surface" (display.set_mode + flip) أو "texture" (pygame._sdl2.video Renderer)
+RENDER_BACKEND = "surface"
+# texture backend: -1 = SDL يختار (GPU لو موجود)، 0 = software، 1 = GPU بس
+RENDER_ACCELERATED = -1
+
+# ساعة اللعبة للـ cooldowns والـ timers: "simulated" (بتتقدم مع كل tick) أو "real" (wall clock)
+GAME_CLOCK = "simulated"
+
+# Pipelined frames: الـ update بتاع الـ tick الجاي بيشتغل في thread تاني وإحنا بنرسم snapshot
+# من الـ tick الحالي (scene.snapshot()) – فريم latency زيادة مقابل FPS أعلى على الأجهزة متعددة الأنوية
+PIPELINED = False
+
+# Particles (core.particles): عدد ذرات الرماد في Ashfall City
+ASH_PARTICLES = 20000
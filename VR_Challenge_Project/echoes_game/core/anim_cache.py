@@ -0,0 +1,63 @@
+# core/anim_cache.py
+import math
+from collections import OrderedDict
+
+from config import settings
+
+TAU = 2.0 * math.pi
+
+# Pre-rendered frames keyed by (key, steps, step), oldest first.
+_frames = OrderedDict()
+_frames_bytes = 0
+
+
+def _surface_bytes(surf):
+    return surf.get_width() * surf.get_height() * surf.get_bytesize()
+
+
+def quantize(angle, steps=None):
+    """
+    Snap a sine phase (radians) to the nearest of `steps` points per period.
+    Returns (step, pulse) where pulse = 0.5 + 0.5 * sin(snapped angle).
+    """
+    steps = steps or settings.ANIM_CACHE_PHASES
+    step = round(angle / TAU * steps) % steps
+    return step, 0.5 + 0.5 * math.sin(step * TAU / steps)
+
+
+def get_frame(key, angle, render, steps=None):
+    """
+    Cached frame of a periodic effect.
+
+    key:    tuple of everything the frame depends on besides the phase
+            (size, colors, alphas, ...) – two effects with the same key share frames.
+    angle:  current phase in radians (e.g. time * speed + phase).
+    render: render(pulse) -> Surface, only called on a cache miss.
+    """
+    global _frames_bytes
+
+    steps = steps or settings.ANIM_CACHE_PHASES
+    step, pulse = quantize(angle, steps)
+
+    full_key = (key, steps, step)
+    surf = _frames.get(full_key)
+    if surf is not None:
+        _frames.move_to_end(full_key)
+        return surf
+
+    surf = render(pulse)
+    _frames[full_key] = surf
+    _frames_bytes += _surface_bytes(surf)
+
+    # LRU eviction once we go over the memory budget
+    while _frames_bytes > settings.ANIM_CACHE_MAX_BYTES and len(_frames) > 1:
+        _, old = _frames.popitem(last=False)
+        _frames_bytes -= _surface_bytes(old)
+
+    return surf
+
+
+def clear():
+    global _frames_bytes
+    _frames.clear()
+    _frames_bytes = 0
@@ -0,0 +1,90 @@
+# core/arena.py
+from contextlib import contextmanager
+
+import pygame
+
+
+class SurfaceArena:
+    """
+    Pool of scratch surfaces reused across draw calls.
+
+    borrow(size, flags) hands out a cleared surface for the duration of a
+    `with` block and takes it back afterwards, so full-screen SRCALPHA
+    overlays stop hitting the allocator every frame. end_frame() (called by
+    Game) rolls the per-frame high-water stats.
+    """
+
+    def __init__(self):
+        self._free = {}   # (size, flags) -> [Surface, ...]
+
+        self.allocations = 0      # surfaces ever created by the arena
+        self._in_use = 0
+        self._bytes_in_use = 0
+        self._frame = self._empty_stats()
+        self.last_frame = self._empty_stats()
+
+    @staticmethod
+    def _empty_stats():
+        return {"borrows": 0, "allocations": 0, "high_water": 0, "high_water_bytes": 0}
+
+    @contextmanager
+    def borrow(self, size, flags=0):
+        key = ((int(size[0]), int(size[1])), flags)
+        pool = self._free.get(key)
+        if pool:
+            surf = pool.pop()
+            # Reset anything the last borrower may have changed
+            # (set_alpha(None) would also drop per-pixel alpha on SRCALPHA surfaces)
+            surf.set_alpha(255 if flags & pygame.SRCALPHA else None)
+            surf.set_colorkey(None)
+        else:
+            surf = pygame.Surface(key[0], flags)
+            self.allocations += 1
+            self._frame["allocations"] += 1
+        surf.fill((0, 0, 0, 0))
+
+        nbytes = surf.get_width() * surf.get_height() * surf.get_bytesize()
+        self._in_use += 1
+        self._bytes_in_use += nbytes
+        frame = self._frame
+        frame["borrows"] += 1
+        frame["high_water"] = max(frame["high_water"], self._in_use)
+        frame["high_water_bytes"] = max(frame["high_water_bytes"], self._bytes_in_use)
+
+        try:
+            yield surf
+        finally:
+            self._in_use -= 1
+            self._bytes_in_use -= nbytes
+            self._free.setdefault(key, []).append(surf)
+
+    def end_frame(self):
+        self.last_frame = self._frame
+        self._frame = self._empty_stats()
+
+    def pooled_bytes(self):
+        return sum(
+            s.get_width() * s.get_height() * s.get_bytesize()
+            for pool in self._free.values()
+            for s in pool
+        )
+
+    def clear(self):
+        self._free.clear()
+
+
+# Shared arena (scenes, StaticLayer bakes, overlays)
+_arena = SurfaceArena()
+
+
+def borrow(size, flags=0):
+    return _arena.borrow(size, flags)
+
+
+def end_frame():
+    _arena.end_frame()
+
+
+def stats():
+    """Last finished frame's stats + pool size."""
+    return dict(_arena.last_frame, allocations_total=_arena.allocations, pooled_bytes=_arena.pooled_bytes())
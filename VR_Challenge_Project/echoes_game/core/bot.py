@@ -0,0 +1,101 @@
+# core/bot.py
+"""
+Scripted player for headless tools (balance_sweep.py, benchmark.py): an Input
+whose key presses come from a policy instead of the keyboard. It only reads the
+sim.story chapter being played, so it runs with or without a scene on top.
+"""
+import pygame
+
+from core.input import Input
+
+MOVE_KEYS = {
+    "up": pygame.K_w,
+    "down": pygame.K_s,
+    "left": pygame.K_a,
+    "right": pygame.K_d,
+}
+
+
+class BotInput(Input):
+    """
+    Input driven by a policy instead of the keyboard: every tick the bot picks
+    the keys it wants held and the difference is sent as KEYDOWN / KEYUP events,
+    exactly like a player would produce them.
+    """
+
+    def __init__(self, policy, rng):
+        super().__init__()
+        self.policy = policy
+        self.rng = rng
+        self.chapter = None   # sim.story chapter the bot reads (set by the tool)
+        self._hold = set()
+        self._hold_ticks = 0
+
+    def begin_tick(self):
+        wanted = self._wanted_keys() if self.chapter is not None else set()
+        events = [
+            pygame.event.Event(pygame.KEYUP, key=key, mod=0, unicode="")
+            for key in sorted(self._pressed - wanted)
+        ]
+        events += [
+            pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode="")
+            for key in sorted(wanted - self._pressed)
+        ]
+        self._apply(events)
+
+    def _wanted_keys(self):
+        chapter = self.chapter
+        if chapter.active_dialogue() is not None:
+            # Tap Space through dialogues (first tap completes a typing line)
+            return set() if pygame.K_SPACE in self._pressed else {pygame.K_SPACE}
+        if self.policy == "random":
+            return self._random_keys()
+        enemies = chapter.world.enemies
+        if not enemies:
+            # Nothing to chase (story chapter, swarm, cleared): keep the player busy
+            return self._random_keys()
+        return self._chase_keys(chapter.player, enemies)
+
+    def _random_keys(self):
+        """Mash: random directions held for a while, random swings and dashes."""
+        if self._hold_ticks <= 0:
+            self._hold = set(self.rng.sample(list(MOVE_KEYS.values()), self.rng.randint(0, 2)))
+            self._hold_ticks = self.rng.randint(10, 40)
+        self._hold_ticks -= 1
+        keys = set(self._hold)
+        if self.rng.random() < 0.15:
+            keys.add(pygame.K_j)
+        if self.rng.random() < 0.02:
+            keys.add(pygame.K_k)
+        return keys
+
+    def _chase_keys(self, player, enemies):
+        """Line up with the nearest enemy, close in, face it and swing; dash now and then."""
+        pc = player.rect.center
+        target = min(enemies, key=lambda e: (e.rect.centerx - pc[0]) ** 2 + (e.rect.centery - pc[1]) ** 2)
+        dx = target.rect.centerx - pc[0]
+        dy = target.rect.centery - pc[1]
+
+        # Human-ish reaction time: sometimes keep doing what we did last tick
+        if self.rng.random() < 0.2:
+            return set(self._hold)
+
+        keys = set()
+        side = "right" if dx > 0 else "left"
+        gap = abs(dx) - (player.rect.width + target.rect.width) // 2
+
+        if abs(dy) > 10:
+            keys.add(MOVE_KEYS["down" if dy > 0 else "up"])
+            if gap > 40:
+                keys.add(MOVE_KEYS[side])
+        elif gap > player.attack_range - 8:
+            keys.add(MOVE_KEYS[side])
+        else:
+            if player.facing != side:
+                keys.add(MOVE_KEYS[side])
+            keys.add(pygame.K_j)
+            if gap < 4 and self.rng.random() < 0.05:
+                keys.add(pygame.K_k)
+
+        self._hold = keys
+        return keys
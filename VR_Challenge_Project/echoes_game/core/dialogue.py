@@ -1,71 +1,249 @@
 # core/dialogue.py
+import copy
+
 import pygame
 from config import settings
 from core import ui
+from sim.dialogue import DialogueState, spoken_text
+
+HINT_TEXT = "[Space / Enter] التالي"
+
+
+def wrap_text(text, font, max_width):
+    """Greedy word wrap: list of lines that each fit in max_width pixels."""
+    lines = []
+    line = ""
+    for w in text.split(" "):
+        test = (line + " " + w).strip()
+        if font.size(test)[0] <= max_width:
+            line = test
+        else:
+            lines.append(line)
+            line = w
+    if line:
+        lines.append(line)
+    return lines
+
 
 class DialogueBox:
-    def __init__(self, lines, on_finish=None):
+    """
+    Draws a sim.dialogue.DialogueState: word wrap, the panel and the typewriter
+    glyphs. Progress (line, timing, Space / Enter) lives in the state, so the
+    text only gets laid out when the box is actually drawn.
+    """
+
+    # Panel frame + hint, shared by every box with the same size / fonts
+    _panel_cache = {}
+
+    def __init__(self, lines=None, on_finish=None, chars_per_sec=None, clock=None, state=None):
         """
         lines: list[str]  ["Ryn: ...", "Lira: ..."]
         on_finish: callback بعد انتهاء الحوار
+        chars_per_sec: سرعة الـ typewriter (0 = السطر يظهر مرة واحدة)
+        clock: ساعة اللعبة (core.clock) – الافتراضي wall clock
+        state: draw an existing DialogueState (e.g. a sim.story chapter's) instead
         """
-        self.lines = lines
-        self.index = 0
-        self.on_finish = on_finish
-        self.active = True
+        self.state = state or DialogueState(lines, on_finish, chars_per_sec, clock)
         self.margin = 40
         self.height = 120
+        self.font_size = 22
+        self.hint_size = 16
 
-    def handle_event(self, event):
-        if not self.active:
-            return
-        if event.type == pygame.KEYDOWN:
-            if event.key in (pygame.K_SPACE, pygame.K_RETURN):
-                self.index += 1
-                if self.index >= len(self.lines):
-                    self.active = False
-                    if self.on_finish:
-                        self.on_finish()
-
-    def draw(self, surface):
-        if not self.active:
-            return
-
-        panel_rect = pygame.Rect(
+        self.rect = pygame.Rect(
             self.margin,
             settings.HEIGHT - self.margin - self.height,
             settings.WIDTH - 2 * self.margin,
             self.height,
         )
 
-        pygame.draw.rect(surface, settings.COLOR_PANEL, panel_rect, border_radius=10)
-        pygame.draw.rect(surface, settings.COLOR_HIGHLIGHT, panel_rect, 2, border_radius=10)
-
-        text = self.lines[self.index]
-        words = text.split(" ")
-        lines = []
-        font = ui.get_font(22)
-        max_width = panel_rect.width - 40
-
-        line = ""
-        for w in words:
-            test = (line + " " + w).strip()
-            if font.size(test)[0] <= max_width:
-                line = test
-            else:
-                lines.append(line)
-                line = w
-        if line:
-            lines.append(line)
+        # Layout cache: wrapped lines per index (lazy) + the composed current line
+        self._layout_key = None
+        self._wrapped = {}     # index -> (text, wrapped lines)
+        self._frame_key = None
+        self._frame = None
+        self._line_chars = 0      # visible characters in the wrapped line
+        self._shown = [0]         # typed characters (DialogueState count) -> wrapped characters
+        self._drawn = 0           # characters already blitted onto _frame
+
+    # ------------- Progress (sim.dialogue.DialogueState) -------------
+    @property
+    def lines(self):
+        return self.state.lines
+
+    @property
+    def index(self):
+        return self.state.index
+
+    @property
+    def active(self):
+        return self.state.active
+
+    @active.setter
+    def active(self, value):
+        self.state.active = value
+
+    def handle_event(self, event):
+        self.state.handle_event(event)
+
+    def line_complete(self):
+        return self.state.line_complete()
+
+    def reset(self):
+        """Start over from the first line (layout cache is kept)."""
+        self.state.reset()
+        self._frame_key = None
+
+    def set_lines(self, lines):
+        """Replace the text and start over from the first line."""
+        self.state.set_lines(lines)
+        self._wrapped = {}
+        self._frame_key = None
 
-        y = panel_rect.y + 20
-        for ln in lines:
-            img = font.render(ln, True, settings.COLOR_TEXT)
-            surface.blit(img, (panel_rect.x + 20, y))
+    # ------------- Layout cache -------------
+    def _check_layout(self):
+        """Drop cached layout if the font or box size changed."""
+        font = ui.get_font(self.font_size)
+        hint_font = ui.get_font(self.hint_size)
+        key = (font, hint_font, self.rect.size)
+        if key != self._layout_key:
+            self._layout_key = key
+            self._wrapped = {}
+            self._frame_key = None
+            self._frame = None
+        return font
+
+    def wrapped(self, index):
+        """Wrapped lines for self.lines[index] (computed once)."""
+        font = self._check_layout()
+        text = self.lines[index]
+        cached = self._wrapped.get(index)
+        if cached is None or cached[0] != text:
+            cached = self._wrapped[index] = (text, wrap_text(text, font, self.rect.width - 40))
+        return cached[1]
+
+    def prepare(self):
+        """Lay out every line and build the panel up front (e.g. while the scene is loading)."""
+        for i in range(len(self.lines)):
+            self.wrapped(i)
+        self._panel()
+
+    def _panel(self):
+        hint_font = ui.get_font(self.hint_size)
+        key = (self.rect.size, hint_font)
+        panel = DialogueBox._panel_cache.get(key)
+        if panel is None:
+            panel = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+            local = panel.get_rect()
+            pygame.draw.rect(panel, settings.COLOR_PANEL, local, border_radius=10)
+            pygame.draw.rect(panel, settings.COLOR_HIGHLIGHT, local, 2, border_radius=10)
+
+            img = ui.render_uncached(HINT_TEXT, self.hint_size, settings.COLOR_HIGHLIGHT)
+            panel.blit(img, (local.right - img.get_width() - 20,
+                             local.bottom - img.get_height() - 10))
+
+            if pygame.display.get_surface() is not None:
+                panel = panel.convert_alpha()
+            DialogueBox._panel_cache[key] = panel
+        return panel
+
+    # ------------- Typewriter -------------
+    def _revealed(self, state):
+        """Characters of the wrapped line to show for the state's typed count."""
+        shown = self._shown
+        return shown[min(len(shown) - 1, state.revealed())]
+
+    def _start_line(self, index):
+        """Fresh panel for a new line; glyphs get blitted onto it as they appear."""
+        self._frame = self._panel().copy()
+        rows = "".join(self.wrapped(index))
+        self._line_chars = len(rows)
+        self._drawn = 0
+
+        # The state types spoken_text(line); the rows are the same characters
+        # minus the space dropped at each row break. A dropped space shows
+        # nothing, so the panel is full exactly when the state's line is.
+        shown = [0]
+        j = 0
+        for ch in spoken_text(self.lines[index]):
+            if j < len(rows) and rows[j] == ch:
+                j += 1
+            shown.append(j)
+        self._shown = shown
+
+    def _reveal(self, index, upto):
+        """Blit only the glyph runs between _drawn and upto (no full-line re-render)."""
+        font = ui.get_font(self.font_size)
+        y = 20
+        start = 0
+        for ln in self.wrapped(index):
+            end = start + len(ln)
+            a = max(self._drawn, start)
+            b = min(upto, end)
+            if a < b and b == end:
+                # Row finished: one clean render of the whole row so kerning matches
+                # the static layout exactly (restore the panel under it first)
+                img = ui.render_uncached(ln, self.font_size, settings.COLOR_TEXT)
+                if a > start:
+                    area = pygame.Rect(20, y, self.rect.width - 20, img.get_height())
+                    self._frame.blit(self._panel(), area.topleft, area)
+                self._frame.blit(img, (20, y))
+            elif a < b:
+                run = ln[a - start:b - start]
+                x = 20 + (font.size(ln[:a - start])[0] if a > start else 0)
+                img = ui.render_uncached(run, self.font_size, settings.COLOR_TEXT)
+                self._frame.blit(img, (x, y))
+            start = end
             y += font.get_linesize() + 4
+        self._drawn = upto
+
+    def draw(self, surface, state=None):
+        """state: draw this DialogueState instead of the live one (a frozen copy, see freeze())."""
+        state = state or self.state
+        if not state.active:
+            return
+
+        self._check_layout()
+        index = state.index
+        # A restarted line (scene reset, same text) types again from scratch
+        frame_key = (index, state.lines[index], state.line_started)
+        if frame_key != self._frame_key or self._frame is None:
+            self._start_line(index)
+            self._frame_key = frame_key
 
-        hint_font = ui.get_font(16)
-        hint_text = "[Space / Enter] التالي"
-        img = hint_font.render(hint_text, True, settings.COLOR_HIGHLIGHT)
-        surface.blit(img, (panel_rect.right - img.get_width() - 20,
-                           panel_rect.bottom - img.get_height() - 10))
+        upto = self._revealed(state)
+        if upto > self._drawn:
+            self._reveal(index, upto)
+
+        surface.blit(self._frame, self.rect.topleft)
+
+    # ------------- Pipelined frames -------------
+    def freeze(self, clock):
+        """Draw-only copy of this tick's progress (core.snapshot)."""
+        state = copy.copy(self.state)
+        state.clock = clock
+        return FrozenDialogue(self, state)
+
+
+class FrozenDialogue:
+    """A DialogueBox as it was at one tick; drawing still goes through the box's layout cache."""
+
+    __slots__ = ("box", "state")
+
+    def __init__(self, box, state):
+        self.box = box
+        self.state = state
+
+    @property
+    def active(self):
+        return self.state.active
+
+    @property
+    def index(self):
+        return self.state.index
+
+    @property
+    def rect(self):
+        return self.box.rect
+
+    def draw(self, surface):
+        self.box.draw(surface, self.state)
@@ -0,0 +1,21 @@
+# core/dirty.py
+import pygame
+
+
+class DirtyTracker:
+    """
+    بيجمع المناطق اللي اتغيرت في الفريم الحالي + مناطق الفريم اللي قبله،
+    علشان أي حاجة اتحركت أو اختفت تتمسح من مكانها القديم كمان.
+    """
+
+    def __init__(self):
+        self._previous = []
+
+    def reset(self):
+        self._previous = []
+
+    def collect(self, rects):
+        current = [pygame.Rect(r) for r in rects if r]
+        dirty = current + self._previous
+        self._previous = current
+        return dirty
@@ -1,36 +1,385 @@
 # core/game.py
 import sys
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
 import pygame
 
+import scenes
 from config import settings
+from core import arena, startup
+from core import clock as game_clock
+from core.input import Input, ReplayInput
+from core.profiler import Profiler
+from core.renderer import TextureBackend
+
+class _Preload:
+    """
+    One speculative scene build: constructor first, then the scene's warm_up()
+    steps. Each is one indivisible step – the constructor included, so scenes
+    keep it cheap and leave the heavy work (baking, layout) to warm_up().
+    """
+
+    def __init__(self, game, scene_class):
+        self.scene = None
+        self.done = False
+        self._steps = self._run(game, scene_class)
+
+    def _run(self, game, scene_class):
+        scene = scene_class(game)
+        yield scene
+        for _ in scene.warm_up():
+            yield scene
+
+    def step(self):
+        try:
+            self.scene = next(self._steps)
+        except StopIteration:
+            self.done = True
+
+    def finish(self):
+        while not self.done:
+            self.step()
+        return self.scene
+
 
 class Game:
-    def __init__(self, initial_scene_class):
-        pygame.init()
-        self.screen = pygame.display.set_mode((settings.WIDTH, settings.HEIGHT))
-        pygame.display.set_caption(settings.TITLE)
-        self.clock = pygame.time.Clock()
+    def __init__(self, initial_scene, input=None, clock=None):
+        self._init_pygame()
+        size = (settings.WIDTH, settings.HEIGHT)
+
+        # Optional texture backend (SDL Renderer); scenes draw the same either way
+        self.renderer = None
+        if settings.RENDER_BACKEND == "texture":
+            with startup.stage("renderer"):
+                self.renderer = TextureBackend(size, settings.TITLE, settings.RENDER_ACCELERATED)
+            # Software frame for code that still wants a plain surface (benchmark, tools)
+            self.screen = self.renderer.surface
+        else:
+            with startup.stage("display.set_mode"):
+                self.screen = pygame.display.set_mode(size)
+                pygame.display.set_caption(settings.TITLE)
+        self.frame_clock = pygame.time.Clock()
+        # Game time for cooldowns / timers (core.clock); scenes pass it to entities
+        self.clock = clock or game_clock.create()
         self.running = True
 
-        self.current_scene = initial_scene_class(self)
+        # Fixed-timestep simulation: update() always gets tick_dt; alpha is how far
+        # the current frame sits between the last two ticks (for interpolation).
+        self.tick_dt = 1.0 / settings.TICK_RATE
+        self._accumulator = 0.0
+        self.alpha = 1.0
+
+        # آخر مشهد اتعرض على الشاشة (علشان أول فريم بعد تغيير المشهد يبقى flip كامل)
+        self._presented_scene = None
+
+        # Events + key state, handed to the scene one tick at a time (live, recorded or replayed)
+        self.input = input or Input()
+
+        # F3 overlay / F4 trace – التوقيتات بتتسجل دايماً، الـ hooks بتتركب بس وهي شغالة
+        self.profiler = Profiler()
+
+        # Next scenes being built ahead of time (scene_class -> _Preload)
+        self._preloads = {}
+
+        # Scene instances kept alive for re-entry (scene_class -> scene), oldest first
+        self._pool = OrderedDict()
+
+        # settings.PIPELINED: worker thread that simulates while a snapshot is drawn (run()).
+        # Ticks on the worker only touch scene state: scene switches and preload
+        # requests are queued and applied by the main thread (_apply_deferred)
+        self._sim_thread = None
+        self._deferring = False
+        self._pending_scene = None      # scene class enter() asked for on the worker
+        self._pending_update = False    # that tick's update() still has to run
+        self._preload_requests = []
+
+        initial_scene_class = scenes.resolve(initial_scene)
+        with startup.stage(f"{initial_scene_class.__name__}()"):
+            self.current_scene = initial_scene_class(self)
+        self._pool[initial_scene_class] = self.current_scene
+
+    def _init_pygame(self):
+        """
+        pygame.init() brings up every module (mixer, joystick, ...); with
+        settings.FAST_START only what the game uses gets initialized.
+        """
+        if not settings.FAST_START:
+            with startup.stage("pygame.init"):
+                pygame.init()
+            return
+
+        with startup.stage("display.init"):
+            pygame.display.init()
+        with startup.stage("font.init"):
+            pygame.font.init()
+        with startup.stage("timer"):
+            # get_ticks() stays at 0 until SDL's timer subsystem is up;
+            # arming (and cancelling) a timer is the public way to start it.
+            pygame.time.set_timer(pygame.USEREVENT, 1000)
+            pygame.time.set_timer(pygame.USEREVENT, 0)
 
     def change_scene(self, new_scene):
         self.current_scene = new_scene
+        # Full flip on the first frame, even when a scene restarts into itself
+        self._presented_scene = None
+        # Whatever wasn't used for this transition is stale now
+        self._preloads.clear()
+        self._preload_requests.clear()
+
+    # -------------------------------------------------------------
+    # Scene preloading
+    # -------------------------------------------------------------
+    def preload(self, scene_class):
+        """Start building scene_class (class or registered name) a few ms per frame."""
+        if self._deferring:
+            if scene_class not in self._preload_requests:
+                self._preload_requests.append(scene_class)
+            return
+        scene_class = scenes.resolve(scene_class)
+        if scene_class not in self._preloads and scene_class not in self._pool:
+            self._preloads[scene_class] = _Preload(self, scene_class)
+
+    def enter(self, scene_class):
+        """
+        Switch to scene_class: a pooled instance is reset() and reused, otherwise
+        its preload is finished (or the scene is built) and added to the pool.
+        scene_class may also be a name from the scenes registry.
+
+        On the pipelined worker the switch is only recorded (returns None): the
+        main thread makes it once the frame's draw is done (_apply_deferred).
+        """
+        if self._deferring:
+            self._pending_scene = scene_class
+            return None
+
+        scene_class = scenes.resolve(scene_class)
+        scene = self._pool.get(scene_class)
+        if scene is not None:
+            scene.reset()
+            self._pool.move_to_end(scene_class)
+        else:
+            job = self._preloads.pop(scene_class, None)
+            if job is not None:
+                scene = job.finish()
+                # Built some frames ago: restart its timers at this tick
+                scene.reset()
+            else:
+                scene = scene_class(self)
+            self._pool[scene_class] = scene
+            while len(self._pool) > settings.SCENE_POOL_MAX:
+                self._pool.popitem(last=False)
+
+        self.change_scene(scene)
+        return scene
+
+    def _advance_preloads(self):
+        """
+        Run preload steps until this frame's budget is spent (at least one step).
+        The budget is checked between steps, so a step that starts inside it –
+        the scene constructor or one warm_up() step – runs to the end.
+        """
+        if not self._preloads:
+            return
+        deadline = time.perf_counter() + settings.PRELOAD_BUDGET_MS / 1000.0
+        for job in list(self._preloads.values()):
+            while not job.done:
+                job.step()
+                if time.perf_counter() >= deadline:
+                    return
+
+    def _frame_rects(self, scene, drawn):
+        """
+        Dirty rects for this frame (flip only those when it pays off), or None
+        for a full flip. scene is the live scene, drawn is what gets drawn
+        (itself, or its snapshot when pipelined).
+        """
+        rects = None
+        # The overlay isn't part of the scene's dirty rects
+        if settings.DIRTY_RECTS and scene is self._presented_scene and not self.profiler.visible:
+            rects = drawn.dirty_rects()
+        self._presented_scene = scene
+        return rects
+
+    def _flip(self, rects):
+        if self.renderer is not None:
+            self.renderer.present()
+            return
+
+        if rects is None:
+            pygame.display.flip()
+            return
+
+        screen_rect = self.screen.get_rect()
+        rects = [r.clip(screen_rect) for r in rects]
+        changed = sum(r.width * r.height for r in rects)
+        if changed > settings.DIRTY_RECT_MAX_COVERAGE * screen_rect.width * screen_rect.height:
+            pygame.display.flip()
+        else:
+            pygame.display.update(rects)
+
+    def step(self):
+        """One fixed simulation step: game time, this tick's input, scene update."""
+        if self.input.finished:
+            # A replay ran out: nothing recorded happens after its last tick
+            return
+        self.step_events()
+
+        if self._pending_scene is not None:
+            # Pipelined: update() runs on the new scene after the main thread switches
+            self._pending_update = True
+            return
+        self.step_update()
+
+    def step_events(self):
+        """First half of step(): advance game time, read this tick's input, scene.handle_events."""
+        self.clock.advance(self.tick_dt)
+        self.input.begin_tick()
+        self.current_scene.handle_events(self.input.events)
+
+    def step_update(self):
+        """Second half of step(): scene.update() (handle_events may have switched scenes)."""
+        scene = self.current_scene
+        scene.begin_tick()
+        scene.update(self.tick_dt)
+
+    def soak(self, seconds):
+        """
+        Headless run: simulate `seconds` of game time as fast as the CPU allows
+        (no drawing, no FPS cap). Needs the simulated clock for timers to keep up.
+        Returns the number of ticks run (stops early when a replay runs out).
+        """
+        ticks = int(seconds * settings.TICK_RATE)
+        for i in range(ticks):
+            if self.input.finished:
+                return i
+            self.step()
+        return ticks
+
+    def _simulate(self, frame_dt, ticks=0):
+        """
+        Run as many fixed ticks as the elapsed time allows (capped); ticks is how
+        many this frame already ran. Returns the frame's tick count.
+        """
+        self._accumulator += frame_dt
+
+        while self._accumulator >= self.tick_dt and ticks < settings.MAX_CATCHUP_TICKS:
+            self.step()
+            self._accumulator -= self.tick_dt
+            ticks += 1
+            if self._pending_scene is not None:
+                # Pipelined: the rest of this frame's ticks run after the switch
+                break
+
+        # Too far behind: drop the backlog instead of spiralling
+        if ticks == settings.MAX_CATCHUP_TICKS:
+            self._accumulator = min(self._accumulator, self.tick_dt)
+
+        self.alpha = min(1.0, self._accumulator / self.tick_dt)
+        return ticks
+
+    def _simulate_deferred(self, frame_dt):
+        """_simulate() on the pipelined worker: scene switches / preloads are only queued."""
+        self._deferring = True
+        try:
+            return self._simulate(frame_dt)
+        finally:
+            self._deferring = False
+
+    def _apply_deferred(self, ticks):
+        """
+        Main thread, after the worker's ticks: make the queued scene switch and
+        preload requests, then run what those ticks left over (the switching
+        tick's update, the frame's remaining ticks) right here. The same ticks
+        happen in the same order as without the worker.
+        """
+        requests, self._preload_requests = self._preload_requests, []
+        for scene_class in requests:
+            self.preload(scene_class)
+
+        if self._pending_scene is None:
+            return
+        scene_class, self._pending_scene = self._pending_scene, None
+        self.enter(scene_class)
+        if self._pending_update:
+            self._pending_update = False
+            self.step_update()
+        self._simulate(0.0, ticks)
 
     def run(self):
+        profiler = self.profiler
+        if settings.PIPELINED:
+            self._sim_thread = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sim")
+        replay = self.input if isinstance(self.input, ReplayInput) else None
         while self.running:
-            dt = self.clock.tick(settings.FPS) / 1000.0
-            events = pygame.event.get()
+            if replay is not None:
+                # One tick per frame, uncapped: every frame does the recorded work
+                self.frame_clock.tick()
+                frame_dt = self.tick_dt
+            else:
+                frame_dt = self.frame_clock.tick(settings.FPS) / 1000.0
+            profiler.begin_frame()
 
-            for event in events:
-                if event.type == pygame.QUIT:
-                    self.running = False
+            with profiler.section("events"):
+                events = pygame.event.get()
 
-            self.current_scene.handle_events(events)
-            self.current_scene.update(dt)
-            self.current_scene.draw(self.screen)
+                for event in events:
+                    if event.type == pygame.QUIT:
+                        self.running = False
 
-            pygame.display.flip()
+                profiler.handle_events(events)
+                self.input.collect(events)
+
+            # Pipelined: draw this snapshot while the worker simulates the next ticks
+            snap = self.current_scene.snapshot() if self._sim_thread is not None else None
+            if snap is None:
+                with profiler.section("update"):
+                    self._simulate(frame_dt)
+                scene = drawn = self.current_scene
+                rects = self._frame_rects(scene, drawn)
+                sim = None
+            else:
+                # Decided before the worker may change scenes
+                scene, drawn = self.current_scene, snap
+                rects = self._frame_rects(scene, drawn)
+                sim = self._sim_thread.submit(self._simulate_deferred, frame_dt)
+
+            with profiler.section("draw"):
+                if self.renderer is not None:
+                    self.renderer.draw(drawn, profiler.draw if profiler.visible else None)
+                else:
+                    drawn.draw(self.screen)
+                    profiler.draw(self.screen)
+
+            with profiler.section("flip"):
+                self._flip(rects)
+
+            if sim is not None:
+                # Only the part of the simulation that didn't overlap draw + flip
+                with profiler.section("update"):
+                    self._apply_deferred(sim.result())
+
+            if startup.enabled:
+                # --profile-startup: the first frame is all we wanted
+                startup.first_frame()
+                print(startup.report())
+                self.running = False
+
+            with profiler.section("preload"):
+                self._advance_preloads()
+
+            arena.end_frame()
+            profiler.end_frame()
+
+            if replay is not None:
+                replay.frame_done()
+                if replay.finished:
+                    print(replay.report())
+                    self.running = False
 
+        if self._sim_thread is not None:
+            self._sim_thread.shutdown()
+        self.input.close()
         pygame.quit()
         sys.exit()
@@ -0,0 +1,196 @@
+# core/input.py
+"""
+Per-tick input for Game: the events delivered to scene.handle_events() and
+the key state scenes read in update(). Live play can be recorded to a file and
+replayed later, tick for tick (main.py --record / --replay).
+
+File format: gzip JSON lines. First line is a header (version, start scene and
+the clock / tick rate the session ran on), then one line per tick:
+    [events, keys]    events = [[type, key, mod, unicode], ...]
+                      keys   = sorted pressed keycodes, or null if unchanged
+"""
+import gzip
+import json
+import time
+
+import pygame
+
+from config import settings
+
+FORMAT_VERSION = 2
+
+# Event types that feed the simulation (everything else stays frame-level)
+SIM_EVENTS = (pygame.KEYDOWN, pygame.KEYUP)
+
+
+class KeyState:
+    """get_pressed()-style lookup (keys[pygame.K_e]) over a set of pressed keycodes."""
+
+    __slots__ = ("pressed",)
+
+    def __init__(self, pressed=()):
+        self.pressed = frozenset(pressed)
+
+    def __getitem__(self, key):
+        return key in self.pressed
+
+
+def _encode(event):
+    return [event.type, event.key, event.mod, event.unicode]
+
+
+def _decode(row):
+    type_, key, mod, unicode = row
+    return pygame.event.Event(type_, key=key, mod=mod, unicode=unicode)
+
+
+class Input:
+    """
+    Collects live events every frame and hands them out one tick at a time.
+    Key state is tracked from the KEYDOWN / KEYUP stream itself, so it's a pure
+    function of the recorded events.
+    """
+
+    def __init__(self):
+        self.events = []          # this tick's events
+        self.keys = KeyState()    # this tick's key state
+        self.ticks = 0
+
+        self._pending = []
+        self._pressed = set()
+        self._recorder = None
+
+    # ------------- Frame side -------------
+    def collect(self, events):
+        """Queue this frame's simulation events for the next tick."""
+        for event in events:
+            if event.type in SIM_EVENTS:
+                self._pending.append(event)
+            elif event.type == pygame.WINDOWFOCUSLOST:
+                # KEYUPs never arrive while unfocused – don't leave keys stuck
+                self._pending.extend(
+                    pygame.event.Event(pygame.KEYUP, key=key, mod=0, unicode="") for key in self._pressed
+                )
+
+    # ------------- Tick side -------------
+    def begin_tick(self):
+        events, self._pending = self._pending, []
+        self._apply(events)
+        if self._recorder is not None:
+            self._recorder.write(events, self.keys)
+
+    def _apply(self, events):
+        changed = False
+        for event in events:
+            if event.type == pygame.KEYDOWN:
+                self._pressed.add(event.key)
+                changed = True
+            elif event.type == pygame.KEYUP:
+                self._pressed.discard(event.key)
+                changed = True
+        self.events = events
+        if changed:
+            self.keys = KeyState(self._pressed)
+        self.ticks += 1
+
+    @property
+    def finished(self):
+        return False
+
+    # ------------- Recording -------------
+    def start_recording(self, path, scene_name, tick_rate, clock):
+        self._recorder = Recorder(path, scene_name, tick_rate, clock)
+
+    def close(self):
+        if self._recorder is not None:
+            self._recorder.close()
+            self._recorder = None
+
+
+class Recorder:
+    def __init__(self, path, scene_name, tick_rate, clock):
+        self.path = path
+        self._file = gzip.open(path, "wt", encoding="utf-8")
+        self._last_keys = None
+        header = {"version": FORMAT_VERSION, "scene": scene_name, "tick_rate": tick_rate, "clock": clock}
+        self._file.write(json.dumps(header) + "\n")
+
+    def write(self, events, keys):
+        pressed = keys.pressed
+        row_keys = None
+        if pressed != self._last_keys:
+            row_keys = sorted(pressed)
+            self._last_keys = pressed
+        self._file.write(json.dumps([[_encode(e) for e in events], row_keys], separators=(",", ":")) + "\n")
+
+    def close(self):
+        self._file.close()
+
+
+class ReplayInput(Input):
+    """
+    Input fed from a recording instead of the keyboard. Game runs it one tick per
+    frame with no FPS cap, so frame N always draws the same state – frame timings
+    from two builds can be compared on identical work.
+    """
+
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+        self._file = gzip.open(path, "rt", encoding="utf-8")
+        self.header = json.loads(self._file.readline())
+        if self.header.get("version") != FORMAT_VERSION:
+            raise ValueError(f"{path}: unsupported input recording version {self.header.get('version')}")
+        # Timers and the tick dt have to match the recorded session or the replay desyncs
+        for key, name in (("clock", "GAME_CLOCK"), ("tick_rate", "TICK_RATE")):
+            current = getattr(settings, name)
+            if self.header.get(key) != current:
+                raise ValueError(f"{path}: recorded with {name} = {self.header.get(key)!r}, this run uses {current!r}")
+        self._next = self._file.readline()   # read ahead: finished is known before the tick
+        self._frame_times = []
+        self._frame_start = None
+
+    def collect(self, events):
+        # Live keyboard input is ignored during a replay
+        pass
+
+    def begin_tick(self):
+        line, self._next = self._next, self._file.readline()
+        if not line:
+            self.events = []
+            return
+        rows, keys = json.loads(line)
+        events = [_decode(row) for row in rows]
+        self._apply(events)
+        if keys is not None:
+            # The recorded state wins (it's what the scenes saw)
+            self._pressed = set(keys)
+            self.keys = KeyState(keys)
+
+    @property
+    def finished(self):
+        return not self._next
+
+    def close(self):
+        self._file.close()
+
+    # ------------- Frame timings -------------
+    def frame_done(self):
+        now = time.perf_counter()
+        if self._frame_start is not None:
+            self._frame_times.append(now - self._frame_start)
+        self._frame_start = now
+
+    def report(self):
+        values = sorted(t * 1000.0 for t in self._frame_times)
+        if not values:
+            return f"replay {self.path}: no frames"
+
+        def pct(q):
+            return values[min(len(values) - 1, int(round(q * (len(values) - 1))))]
+
+        return (
+            f"replay {self.path}: {self.ticks} ticks, {len(values)} frames\n"
+            f"  frame ms  mean {sum(values) / len(values):.3f}  p50 {pct(0.5):.3f}"
+            f"  p95 {pct(0.95):.3f}  p99 {pct(0.99):.3f}  max {values[-1]:.3f}"
+        )
@@ -0,0 +1,85 @@
+# core/layers.py
+import pygame
+from config import settings
+
+
+class StaticLayer:
+    """
+    طبقة ثابتة في المشهد بتترسم مرة واحدة على Surface متخزن.
+
+    draw_fn(surface): بيرسم محتوى الطبقة.
+    state_fn(): (اختياري) بيرجع حالة المشهد اللي الطبقة معتمدة عليها
+                (مثلاً بوابة اتفتحت) – لو الحالة اتغيرت الطبقة تتعاد.
+                draw_fn بياخدها كـ argument: draw_fn(surface, state)، فالـ bake
+                ما بيقراش المشهد الحي (pipelined snapshots, see freeze()).
+    """
+
+    def __init__(self, draw_fn, state_fn=None, size=None):
+        self.draw_fn = draw_fn
+        self.state_fn = state_fn
+        self.size = size or (settings.WIDTH, settings.HEIGHT)
+
+        self.surface = None
+        self._state = None
+        self._baked = {}   # state -> baked surface (a scene reset flips back without re-baking)
+
+    def invalidate(self):
+        """Force a re-bake on the next draw."""
+        self.surface = None
+        self._baked.clear()
+
+    def _bake(self, state):
+        surf = pygame.Surface(self.size)
+        if self.state_fn is not None:
+            self.draw_fn(surf, state)
+        else:
+            self.draw_fn(surf)
+        # Match the display pixel format so the per-frame blit is a plain copy
+        if pygame.display.get_surface() is not None:
+            surf = surf.convert()
+        return surf
+
+    def prebake(self, state=None):
+        """
+        Bake now if needed (scene preloading), so the first draw is just a blit.
+        state: layer state to show (default: ask state_fn).
+        """
+        if self.state_fn is not None:
+            if state is None:
+                state = self.state_fn()
+            if state != self._state:
+                self._state = state
+                self.surface = self._baked.get(state)
+
+        if self.surface is None:
+            self.surface = self._bake(self._state)
+            if self.state_fn is not None:
+                self._baked[self._state] = self.surface
+
+    def draw(self, surface, dest=(0, 0)):
+        self.prebake()
+        surface.blit(self.surface, dest)
+
+    # ------------- Pipelined frames -------------
+    def freeze(self, clock):
+        """Draw-only view at this tick (core.snapshot): state_fn is read now, not while drawing."""
+        if self.state_fn is None:
+            return self
+        return FrozenLayer(self, self.state_fn())
+
+
+class FrozenLayer:
+    """A StaticLayer shown at one state; bakes still land in the layer's cache."""
+
+    __slots__ = ("layer", "state")
+
+    def __init__(self, layer, state):
+        self.layer = layer
+        self.state = state
+
+    def prebake(self):
+        self.layer.prebake(self.state)
+
+    def draw(self, surface, dest=(0, 0)):
+        self.layer.prebake(self.state)
+        surface.blit(self.layer.surface, dest)
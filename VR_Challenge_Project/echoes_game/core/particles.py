@@ -0,0 +1,254 @@
+# core/particles.py
+"""
+NumPy particle engine for scene atmosphere (ash, rift sparks, core energy).
+
+ParticleGroup keeps every field in preallocated arrays (position, velocity,
+age, life; the color comes from a ramp by age) and integrates the whole group
+in one vectorized step. Rendering:
+
+- size 1: direct pixel writes through pygame.surfarray – no blit per particle
+- size > 1: cached soft point sprites (one per ramp color) in one blits() call
+
+Emitter spawns into a group and follows the scene's time from draw(): the
+particles are decoration, so they only advance on frames that get drawn.
+Simulate-only runs (soak, balance sweeps) never pay for them, and a pipelined
+snapshot shares the emitter with the live scene (only the draw side touches it).
+"""
+import numpy as np
+import pygame
+
+from config import settings
+
+
+class ParticleGroup:
+    # (size, color, additive) -> point sprite, shared by all groups
+    _sprite_cache = {}
+
+    def __init__(self, capacity, ramp, size=1, gravity=(0.0, 0.0), bounds=None, additive=False):
+        """
+        ramp: colors from birth to death (picked by age / life)
+        size: 1 = one pixel, > 1 = soft dot of that radius
+        gravity: (ax, ay) px/s²
+        bounds: particles leaving this Rect die (default: screen + 64 px margin)
+        additive: point sprites are added onto the target (glows); pixels always overwrite
+        """
+        self.capacity = capacity
+        self.ramp = [tuple(color[:3]) for color in ramp]
+        self.size = size
+        self.gravity = gravity
+        self.additive = additive
+        if bounds is None:
+            bounds = pygame.Rect(0, 0, settings.WIDTH, settings.HEIGHT).inflate(64, 64)
+        self.bounds = pygame.Rect(bounds)
+
+        # Alive particles are packed in [0, count)
+        self.count = 0
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.vx = np.zeros(capacity, dtype=np.float32)
+        self.vy = np.zeros(capacity, dtype=np.float32)
+        self.age = np.zeros(capacity, dtype=np.float32)
+        self.life = np.ones(capacity, dtype=np.float32)
+
+        # Surface pixel format -> ramp as mapped pixel values
+        self._mapped = {}
+
+    def __len__(self):
+        return self.count
+
+    def _fields(self):
+        return (self.x, self.y, self.vx, self.vy, self.age, self.life)
+
+    def clear(self):
+        self.count = 0
+
+    # ------------- Spawning -------------
+    def spawn(self, x, y, vx, vy, life, age=0.0):
+        """Add particles (arrays of equal length, or scalars); extra ones beyond capacity are dropped."""
+        x = np.atleast_1d(x)
+        n = min(x.size, self.capacity - self.count)
+        if n <= 0:
+            return 0
+        a, b = self.count, self.count + n
+        for field, value in zip(self._fields(), (x, y, vx, vy, age, life)):
+            field[a:b] = np.broadcast_to(value, x.shape)[:n]
+        self.count = b
+        return n
+
+    # ------------- Update -------------
+    def step(self, dt):
+        """Integrate every particle once, then pack out the dead ones."""
+        n = self.count
+        if not n:
+            return
+        x, y = self.x[:n], self.y[:n]
+        vx, vy = self.vx[:n], self.vy[:n]
+        age = self.age[:n]
+
+        gx, gy = self.gravity
+        if gx:
+            vx += gx * dt
+        if gy:
+            vy += gy * dt
+        x += vx * dt
+        y += vy * dt
+        age += dt
+
+        b = self.bounds
+        keep = (age < self.life[:n]) & (x >= b.left) & (x < b.right) & (y >= b.top) & (y < b.bottom)
+        if not keep.all():
+            alive = np.flatnonzero(keep)
+            for field in self._fields():
+                field[:alive.size] = field[:n][alive]
+            self.count = alive.size
+
+    # ------------- Drawing -------------
+    def _ramp_index(self):
+        n = self.count
+        k = len(self.ramp)
+        return np.minimum((self.age[:n] / self.life[:n] * k).astype(np.intp), k - 1)
+
+    def draw(self, surface):
+        if not self.count:
+            return
+        if self.size <= 1 and self._draw_pixels(surface):
+            return
+        self._draw_sprites(surface)
+
+    def _draw_pixels(self, surface):
+        """Write one pixel per particle straight into the surface; False if its format can't be mapped."""
+        try:
+            pixels = pygame.surfarray.pixels2d(surface)
+        except ValueError:
+            # 24-bit surfaces have no 2D pixel view
+            return False
+
+        key = (surface.get_bitsize(), surface.get_masks())
+        lut = self._mapped.get(key)
+        if lut is None:
+            lut = self._mapped[key] = np.array([surface.map_rgb(c) for c in self.ramp]).astype(pixels.dtype)
+
+        n = self.count
+        w, h = surface.get_size()
+        xi = self.x[:n].astype(np.intp)
+        yi = self.y[:n].astype(np.intp)
+        inside = (xi >= 0) & (xi < w) & (yi >= 0) & (yi < h)
+        pixels[xi[inside], yi[inside]] = lut[self._ramp_index()[inside]]
+        del pixels  # unlock the surface
+        return True
+
+    def _sprite(self, color):
+        key = (self.size, color, self.additive)
+        sprite = ParticleGroup._sprite_cache.get(key)
+        if sprite is None:
+            r = max(1, self.size)
+            if self.additive:
+                # Added onto the target: black adds nothing, so no alpha needed
+                sprite = pygame.Surface((r * 2, r * 2))
+                sprite.fill((0, 0, 0))
+                for i in range(r, 0, -1):
+                    k = (r - i + 1) / r
+                    pygame.draw.circle(sprite, [int(c * k) for c in color], (r, r), i)
+            else:
+                sprite = pygame.Surface((r * 2, r * 2), pygame.SRCALPHA)
+                for i in range(r, 0, -1):
+                    pygame.draw.circle(sprite, color + (int(255 * (r - i + 1) / r),), (r, r), i)
+            if pygame.display.get_surface() is not None:
+                sprite = sprite.convert() if self.additive else sprite.convert_alpha()
+            ParticleGroup._sprite_cache[key] = sprite
+        return sprite
+
+    def _draw_sprites(self, surface):
+        n = self.count
+        sprites = [self._sprite(color) for color in self.ramp]
+        r = max(1, self.size)
+        flags = pygame.BLEND_RGB_ADD if self.additive else 0
+        xs = (self.x[:n] - r).astype(np.int32).tolist()
+        ys = (self.y[:n] - r).astype(np.int32).tolist()
+        surface.blits(
+            [(sprites[i], (x, y), None, flags) for i, x, y in zip(self._ramp_index().tolist(), xs, ys)],
+            doreturn=False,
+        )
+
+
+class Emitter:
+    """
+    Spawns `rate` particles per second into a group, uniformly inside one of
+    `areas` (Rects), with velocity and life drawn from ranges:
+
+        velocity = ((vx_min, vx_max), (vy_min, vy_max))   px/s
+        life = (min, max)                                   seconds
+
+    draw(surface, time) advances the group to `time` (the scene's clock) in
+    fixed ticks, then renders it. Time going backwards (scene reset) restarts
+    the emitter from its seed; prefill starts it at its steady state instead of
+    empty (e.g. ash already covering the street).
+    """
+
+    def __init__(self, group, rate, areas, velocity, life, seed=0, prefill=False):
+        self.group = group
+        self.rate = rate
+        self.areas = [pygame.Rect(area) for area in areas]
+        self.velocity = velocity
+        self.life = life
+        self.seed = seed
+        self.prefill = prefill
+        self.tick_dt = 1.0 / settings.TICK_RATE
+
+        self._time = None
+        self._carry = 0.0
+        self.rng = None
+
+    def restart(self):
+        self.rng = np.random.default_rng(self.seed)
+        self.group.clear()
+        self._carry = 0.0
+        if self.prefill:
+            # Steady state: particles all over the bounds, at random ages
+            count = int(min(self.group.capacity, self.rate * sum(self.life) / 2))
+            self._emit(count, [self.group.bounds], aged=True)
+
+    def _emit(self, count, areas=None, aged=False):
+        if count <= 0:
+            return
+        rng = self.rng
+        areas = areas or self.areas
+        pick = rng.integers(0, len(areas), count) if len(areas) > 1 else np.zeros(count, dtype=np.intp)
+        left = np.array([a.left for a in areas], dtype=np.float32)[pick]
+        top = np.array([a.top for a in areas], dtype=np.float32)[pick]
+        width = np.array([a.width for a in areas], dtype=np.float32)[pick]
+        height = np.array([a.height for a in areas], dtype=np.float32)[pick]
+
+        (vx0, vx1), (vy0, vy1) = self.velocity
+        life = rng.uniform(*self.life, count)
+        self.group.spawn(
+            left + rng.random(count) * width,
+            top + rng.random(count) * height,
+            rng.uniform(vx0, vx1, count),
+            rng.uniform(vy0, vy1, count),
+            life,
+            rng.random(count) * life if aged else 0.0,
+        )
+
+    def advance(self, time):
+        if self._time is None or time < self._time:
+            self.restart()
+            self._time = time
+            return
+
+        steps = int((time - self._time) / self.tick_dt + 1e-6)
+        if steps <= 0:
+            return
+        self._time += steps * self.tick_dt
+        # After a hitch / long pause only the last few ticks are simulated
+        dt = self.tick_dt
+        for _ in range(min(steps, settings.MAX_CATCHUP_TICKS)):
+            self._carry += self.rate * dt
+            count = int(self._carry)
+            self._carry -= count
+            self._emit(count)
+            self.group.step(dt)
+
+    def draw(self, surface, time):
+        self.advance(time)
+        self.group.draw(surface)
@@ -0,0 +1,245 @@
+# core/profiler.py
+import json
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import pygame
+
+from config import settings
+from core import arena, ui
+
+# pygame.draw primitives counted as "draw calls"
+_DRAW_FUNCTIONS = ("rect", "line", "lines", "aaline", "aalines", "circle", "ellipse", "arc", "polygon")
+
+PHASES = ("events", "update", "draw", "flip", "preload")
+
+
+class Profiler:
+    """
+    Frame profiler driven by hooks in Game.run.
+
+    - section(name): times one phase of the frame (events / update / draw / flip / preload)
+    - counters: Surface allocations, font renders and pygame.draw calls per frame
+    - F3 overlay: rolling frame-time graph + phase split + counters
+    - F4: start / stop a Chrome trace-event capture (chrome://tracing, Perfetto)
+
+    The surface / draw-call counters come from temporary hooks on pygame.Surface
+    and pygame.draw, installed only while the overlay or a trace is on (and
+    removed again after). They only see Python-level calls made while the hooks
+    are in:
+    - "surfaces" counts pygame.Surface(...) constructions; Surfaces made inside
+      pygame's C code (Font.render, copy, convert, subsurface, transform.*,
+      image.load) are not counted
+    - names bound before the hooks went in (from pygame import Surface, a
+      saved pygame.draw.rect) bypass them
+    - "font_renders" is core.ui's own count of text rasterized through it
+    """
+
+    def __init__(self, history=None):
+        self.visible = False
+        self.tracing = False
+
+        self.frame_times = deque(maxlen=history or settings.PROFILER_HISTORY)
+        self.sections = dict.fromkeys(PHASES, 0.0)
+        self.last_sections = dict.fromkeys(PHASES, 0.0)
+        self.counters = {"surfaces": 0, "font_renders": 0, "draw_calls": 0}
+        self.last_counters = dict(self.counters)
+
+        # Originals replaced by install_hooks() (None while the hooks are out)
+        self._original_surface = None
+        self._original_draw = {}
+        # Pipelined frames count from the sim thread too
+        self._lock = threading.Lock()
+        # Per-thread switch: the overlay mutes its own drawing on its thread only
+        self._local = threading.local()
+        self._frame_start = 0.0
+        self._font_renders_start = 0
+        self._trace = []
+        self._trace_origin = time.perf_counter()
+
+    # ------------- Instrumentation hooks -------------
+    def _count(self, name):
+        if getattr(self._local, "muted", False):
+            return
+        with self._lock:
+            self.counters[name] += 1
+
+    def install_hooks(self):
+        """Wrap pygame.Surface and pygame.draw so allocations / draw calls get counted."""
+        if self._original_surface is not None:
+            return
+        profiler = self
+        original_surface = pygame.Surface
+
+        class CountingSurface(original_surface):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                profiler._count("surfaces")
+
+        self._original_surface = original_surface
+        pygame.Surface = CountingSurface
+
+        for name in _DRAW_FUNCTIONS:
+            original = getattr(pygame.draw, name)
+            self._original_draw[name] = original
+
+            def counted(*args, _original=original, **kwargs):
+                profiler._count("draw_calls")
+                return _original(*args, **kwargs)
+
+            setattr(pygame.draw, name, counted)
+
+    def remove_hooks(self):
+        """Put the original pygame.Surface / pygame.draw back (no per-call cost when nothing is shown)."""
+        if self._original_surface is None:
+            return
+        pygame.Surface = self._original_surface
+        for name, original in self._original_draw.items():
+            setattr(pygame.draw, name, original)
+        self._original_surface = None
+        self._original_draw = {}
+
+    def _update_hooks(self):
+        """Hooks stay in only while someone reads the counters (overlay or trace)."""
+        if self.visible or self.tracing:
+            self.install_hooks()
+        else:
+            self.remove_hooks()
+
+    # ------------- Frame / section timing -------------
+    def begin_frame(self):
+        self._frame_start = time.perf_counter()
+        self._font_renders_start = ui.font_renders
+        for name in self.sections:
+            self.sections[name] = 0.0
+        with self._lock:
+            for name in self.counters:
+                self.counters[name] = 0
+
+    def end_frame(self):
+        end = time.perf_counter()
+        self.counters["font_renders"] = ui.font_renders - self._font_renders_start
+        self.frame_times.append(end - self._frame_start)
+        self.last_sections = dict(self.sections)
+        with self._lock:
+            self.last_counters = dict(self.counters)
+
+        if self.tracing:
+            self._trace_event("frame", self._frame_start, end)
+            self._trace.append({
+                "name": "counters",
+                "ph": "C",
+                "ts": self._ts(end),
+                "pid": 1,
+                "tid": 1,
+                "args": self.last_counters,
+            })
+
+    @contextmanager
+    def section(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self.sections[name] = self.sections.get(name, 0.0) + (end - start)
+            if self.tracing:
+                self._trace_event(name, start, end)
+
+    # ------------- Chrome trace -------------
+    def _ts(self, t):
+        return (t - self._trace_origin) * 1_000_000.0
+
+    def _trace_event(self, name, start, end):
+        self._trace.append({
+            "name": name,
+            "ph": "X",
+            "ts": self._ts(start),
+            "dur": (end - start) * 1_000_000.0,
+            "pid": 1,
+            "tid": 1,
+        })
+
+    def start_trace(self):
+        self._trace = []
+        self.tracing = True
+        self._update_hooks()
+
+    def stop_trace(self, path=None):
+        """Stop capturing and write the trace-event JSON; returns the path."""
+        self.tracing = False
+        self._update_hooks()
+        path = path or settings.PROFILER_TRACE_PATH
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": self._trace, "displayTimeUnit": "ms"}, f)
+        self._trace = []
+        return path
+
+    # ------------- Input -------------
+    def handle_events(self, events):
+        for event in events:
+            if event.type != pygame.KEYDOWN:
+                continue
+            if event.key == pygame.K_F3:
+                self.visible = not self.visible
+                self._update_hooks()
+            elif event.key == pygame.K_F4:
+                if self.tracing:
+                    path = self.stop_trace()
+                    print(f"[profiler] trace written to {path}")
+                else:
+                    self.start_trace()
+
+    # ------------- Overlay -------------
+    def draw(self, surface):
+        if not self.visible:
+            return
+
+        # The overlay's own drawing shouldn't show up in the counters
+        self._local.muted = True
+        try:
+            self._draw_overlay(surface)
+        finally:
+            self._local.muted = False
+
+    def _draw_overlay(self, surface):
+        width, height = 280, 220
+        x = surface.get_width() - width - 10
+        y = 10
+
+        panel = pygame.Rect(x, y, width, height)
+        pygame.draw.rect(surface, (8, 10, 20), panel)
+        pygame.draw.rect(surface, settings.COLOR_HIGHLIGHT, panel, 1)
+
+        # Rolling frame-time graph (bar height = ms, guide line at the FPS budget)
+        graph = pygame.Rect(x + 8, y + 8, width - 16, 60)
+        budget_ms = 1000.0 / settings.FPS
+        scale = graph.height / (budget_ms * 2)
+        samples = list(self.frame_times)[-graph.width:]
+        for i, ft in enumerate(samples):
+            ms = ft * 1000.0
+            bar = min(graph.height, int(ms * scale))
+            color = (90, 200, 120) if ms <= budget_ms else (230, 90, 90)
+            gx = graph.x + graph.width - len(samples) + i
+            pygame.draw.line(surface, color, (gx, graph.bottom), (gx, graph.bottom - bar))
+        budget_y = graph.bottom - int(budget_ms * scale)
+        pygame.draw.line(surface, (120, 120, 160), (graph.x, budget_y), (graph.right, budget_y))
+
+        frame_ms = self.frame_times[-1] * 1000.0 if self.frame_times else 0.0
+        avg_ms = (sum(self.frame_times) / len(self.frame_times) * 1000.0) if self.frame_times else 0.0
+
+        lines = [f"frame {frame_ms:5.2f} ms   avg {avg_ms:5.2f} ms"]
+        for name in PHASES:
+            lines.append(f"{name:<7}{self.last_sections.get(name, 0.0) * 1000.0:6.2f} ms")
+        c = self.last_counters
+        lines.append(f"surfaces {c['surfaces']}  fonts {c['font_renders']}  draws {c['draw_calls']}")
+        a = arena.stats()
+        lines.append(f"scratch peak {a['high_water']} ({a['high_water_bytes'] // 1024} KB)  new {a['allocations']}")
+        lines.append("F3 hide  ·  F4 " + ("stop trace" if self.tracing else "start trace"))
+
+        ty = graph.bottom + 6
+        for line in lines:
+            ui.draw_text(surface, line, 12, settings.COLOR_TEXT, x + 8, ty)
+            ty += 15
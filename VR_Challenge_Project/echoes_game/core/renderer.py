@@ -0,0 +1,147 @@
+# core/renderer.py
+import weakref
+
+import pygame
+
+try:
+    from pygame._sdl2.video import Renderer, Texture, Window
+except ImportError:  # pygame built without the SDL2 video bindings
+    Renderer = Texture = Window = None
+
+# SDL_BLENDMODE_BLEND
+_BLEND = 1
+
+
+class TextureFrame:
+    """
+    What Scene.draw_textured() draws into. Looks like a Surface for blit() / blits(),
+    but every blit is a renderer copy of a Texture uploaded once per source Surface –
+    so only pass surfaces that don't change after their first copy (baked layers,
+    cached sprite frames, cached text). Anything drawn with pygame.draw goes through
+    layer(draw_fn) instead.
+    """
+
+    def __init__(self, backend):
+        self._backend = backend
+        self._empty = True
+
+    def begin(self):
+        self._empty = True
+
+    # ------------- Surface-like copies -------------
+    def blit(self, source, dest, area=None):
+        texture = self._backend.texture(source)
+        if area is None:
+            texture.draw(dstrect=self._dest(dest, source))
+        else:
+            area = pygame.Rect(area)
+            texture.draw(srcrect=area, dstrect=(dest[0], dest[1], area.width, area.height))
+        self._empty = False
+
+    def blits(self, blit_sequence, doreturn=True):
+        texture = self._backend.texture
+        for source, dest in blit_sequence:
+            texture(source).draw(dstrect=self._dest(dest, source))
+        self._empty = False
+
+    @staticmethod
+    def _dest(dest, source):
+        if isinstance(dest, pygame.Rect):
+            return dest.topleft
+        return dest
+
+    def get_size(self):
+        return self._backend.size
+
+    def get_rect(self):
+        return pygame.Rect((0, 0), self._backend.size)
+
+    # ------------- Software layers -------------
+    def layer(self, draw_fn):
+        """
+        draw_fn(surface) draws with plain pygame; the result is uploaded and composed
+        on top of what's been copied so far. The first layer of a frame has nothing
+        under it, so it's drawn opaque (like the surface backend, it must cover the frame).
+        """
+        backend = self._backend
+        if self._empty:
+            surface = backend.surface
+        else:
+            surface = backend.overlay
+            surface.fill((0, 0, 0, 0))
+        draw_fn(surface)
+        backend.upload_layer(surface, opaque=self._empty)
+        self._empty = False
+
+
+class TextureBackend:
+    """
+    Optional renderer (settings.RENDER_BACKEND = "texture") on pygame._sdl2.video:
+    a Window + Renderer instead of display.set_mode, frames composed from Textures.
+
+    Scenes keep their draw(surface) API – by default the whole frame is one software
+    layer. A scene opts in by overriding draw_textured(frame) and sending its static
+    content (background bakes, sprites, text) through frame.blit / blits.
+    """
+
+    def __init__(self, size, title, accelerated=-1):
+        if Renderer is None:
+            raise RuntimeError("pygame._sdl2.video is not available in this pygame build")
+
+        self.size = size
+        self.window = Window(title, size=size)
+        try:
+            # -1 = whatever SDL picks (GPU if there is one), 0 = software, 1 = GPU only
+            self.renderer = Renderer(self.window, accelerated=accelerated)
+        except pygame.error:
+            self.renderer = Renderer(self.window, accelerated=0)
+        self.renderer.draw_color = (0, 0, 0, 255)
+
+        # Software targets: the opaque base layer and the transparent overlays
+        self.surface = pygame.Surface(size)
+        self.overlay = pygame.Surface(size, pygame.SRCALPHA)
+
+        self._textures = weakref.WeakKeyDictionary()  # source Surface -> Texture
+        self._layers = {}   # (index, opaque) -> streaming Texture, reused every frame
+        self._layer_index = 0
+
+        self.frame = TextureFrame(self)
+        self.uploads = 0   # Textures created from cached surfaces (lifetime)
+
+    # ------------- Textures -------------
+    def texture(self, source):
+        """Texture for a cached Surface (uploaded on first use, dropped with the Surface)."""
+        texture = self._textures.get(source)
+        if texture is None:
+            texture = Texture.from_surface(self.renderer, source)
+            self._textures[source] = texture
+            self.uploads += 1
+        return texture
+
+    def upload_layer(self, surface, opaque):
+        key = (self._layer_index, opaque)
+        texture = self._layers.get(key)
+        if texture is None:
+            texture = Texture(self.renderer, self.size, streaming=True)
+            if not opaque:
+                texture.blend_mode = _BLEND
+            self._layers[key] = texture
+        texture.update(surface)
+        texture.draw()
+        self._layer_index += 1
+
+    def clear(self):
+        self._textures.clear()
+
+    # ------------- Frame -------------
+    def draw(self, scene, overlay=None):
+        """Compose one frame: the scene, then overlay(surface) as a top layer (profiler)."""
+        self.renderer.clear()
+        self._layer_index = 0
+        self.frame.begin()
+        scene.draw_textured(self.frame)
+        if overlay is not None:
+            self.frame.layer(overlay)
+
+    def present(self):
+        self.renderer.present()
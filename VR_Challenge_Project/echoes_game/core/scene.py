@@ -1,10 +1,32 @@
 # core/scene.py
+import math
+
+import pygame
+
+from core import anim_cache, snapshot
+from core.dialogue import DialogueBox
+from core.layers import StaticLayer
+from entities.enemy import Enemy
+from entities.player import Player
+
 
 class Scene:
     """كلاس أساسي لكل المشاهد."""
+
+    # Sprite groups (attribute names) that get drawn interpolated between ticks
+    interpolated_groups = ("all_sprites", "enemies")
+
     def __init__(self, game):
         self.game = game
 
+    def reset(self):
+        """
+        Restore the scene's starting state without reallocating anything heavy.
+        Game keeps scene instances in a pool and calls this on re-entry
+        (restart after death, menu round-trips); __init__ allocates, reset() sets state.
+        """
+        pass
+
     def handle_events(self, events):
         pass
 
@@ -13,3 +35,152 @@ class Scene:
 
     def draw(self, surface):
         pass
+
+    def draw_textured(self, frame):
+        """
+        Texture backend entry point (core.renderer.TextureFrame). By default the
+        whole draw() is one software layer; scenes opt in by overriding this and
+        blitting their cached surfaces straight into the frame.
+        """
+        frame.layer(self.draw)
+
+    def snapshot(self):
+        """
+        Immutable render view of this tick for pipelined frames (core.snapshot):
+        draw() runs on it while the next tick updates the live scene. Return None
+        if draw() needs state capture() can't freeze – that frame runs serially.
+        """
+        return snapshot.capture(self)
+
+    # -------------------------------------------------------------
+    # Pulsing effects
+    # -------------------------------------------------------------
+    def _pulse(self, speed=2.0, phase=0.0):
+        """Return value between 0 and 1 for pulsing animations."""
+        return 0.5 + 0.5 * math.sin(self.time * speed + phase)
+
+    def _pulse_frame(self, key, speed, render, phase=0.0):
+        """
+        Frame of a periodic effect from core.anim_cache (nearest of K phases).
+        render(pulse) -> Surface is only called the first time a phase is seen.
+        """
+        return anim_cache.get_frame((type(self).__name__,) + key, self.time * speed + phase, render)
+
+    def dirty_rects(self):
+        """
+        المناطق اللي اتغيرت من آخر فريم (list of Rect)، أو None لو المشهد
+        محتاج flip كامل. بيتنده بس لما settings.DIRTY_RECTS شغال.
+        """
+        return None
+
+    def _revive(self, group, sprites):
+        """reset() helper: put every original sprite back in its group, fresh."""
+        for sprite in sprites:
+            sprite.reset()
+        group.add(sprites)
+
+    # -------------------------------------------------------------
+    # Preloading
+    # -------------------------------------------------------------
+    def warm_up(self):
+        """
+        Generator of small warm-up steps, run by Game.preload across frames
+        before the scene is shown: bakes static layers and lays out dialogues.
+        The constructor runs as a single unbudgeted step, so expensive setup
+        belongs here rather than in __init__.
+        """
+        for value in list(vars(self).values()):
+            if isinstance(value, StaticLayer):
+                value.prebake()
+                yield
+            elif isinstance(value, DialogueBox):
+                value.prepare()
+                yield
+
+    # -------------------------------------------------------------
+    # Fixed-timestep interpolation
+    # -------------------------------------------------------------
+    def begin_tick(self):
+        """Called by Game before every update(): remember where each sprite was."""
+        for name in self.interpolated_groups:
+            group = getattr(self, name, None)
+            if group is None:
+                continue
+            for sprite in group:
+                sprite.prev_pos = sprite.rect.topleft
+
+    def draw_sprites(self, surface, group):
+        """Like group.draw(), but blends positions between the last two ticks."""
+        alpha = self.game.alpha
+        blits = []
+        for sprite in group:
+            x, y = sprite.rect.topleft
+            prev = getattr(sprite, "prev_pos", None)
+            if prev is not None and alpha < 1.0:
+                x = round(prev[0] + (x - prev[0]) * alpha)
+                y = round(prev[1] + (y - prev[1]) * alpha)
+            blits.append((sprite.image, (x, y)))
+        surface.blits(blits, doreturn=False)
+
+    def sprite_rects(self, group):
+        """
+        Screen area each sprite of group can cover this frame, for dirty_rects():
+        draw_sprites() blits it somewhere between prev_pos and rect, so report
+        the union of both (last frame's is kept by DirtyTracker for erasing).
+        """
+        rects = []
+        for sprite in group:
+            rect = sprite.rect
+            prev = getattr(sprite, "prev_pos", None)
+            if prev is not None:
+                rect = rect.union(pygame.Rect(prev, rect.size))
+            rects.append(rect)
+        return rects
+
+
+class ChapterScene(Scene):
+    """
+    مشهد بيعرض فصل من sim.story: الفصل شايل التقدم والـ layout والقتال والحوارات،
+    والمشهد بيبني الرسم بس. Subclasses set chapter_class, build their visuals
+    after super().__init__() and call self.reset() last.
+    """
+
+    chapter_class = None   # sim.story.Chapter subclass
+
+    def __init__(self, game):
+        super().__init__(game)
+        self.chapter = self.chapter_class(clock=game.clock)
+
+        # Sprite views over the chapter's state (the roster keeps killed enemies for reset())
+        self.player = Player(0, 0, state=self.chapter.player)
+        self.all_sprites = pygame.sprite.Group(self.player)
+        self.enemy_roster = [Enemy(0, 0, state=state) for state in self.chapter.world.roster]
+        self.enemies = pygame.sprite.Group()
+
+        # One DialogueBox per chapter dialogue, under the same attribute name
+        for name in self.chapter.dialogues:
+            setattr(self, name, DialogueBox(state=getattr(self.chapter, name)))
+
+    def reset(self):
+        self.time = 0.0
+        self.chapter.reset()
+        self.player.prev_pos = None
+        self._revive(self.enemies, self.enemy_roster)
+
+    def travel(self, target):
+        """Follow the chapter's travel request: a registered scene name, or None."""
+        if target:
+            self.game.enter(target)
+
+    def handle_events(self, events):
+        self.travel(self.chapter.handle_events(events))
+
+    def update(self, dt):
+        self.time += dt
+
+        # Next chapter gets built in the background once the way out is in sight
+        if self.chapter.exit_in_sight:
+            self.game.preload(self.chapter.next_scene)
+
+        self.travel(self.chapter.step(self.game.input.keys, dt))
+        self.enemies.update()  # killed enemies leave the sprite group
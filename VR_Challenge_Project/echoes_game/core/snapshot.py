@@ -0,0 +1,80 @@
+# core/snapshot.py
+"""
+Render snapshots for pipelined frames (settings.PIPELINED).
+
+While the main thread draws tick N, Game simulates tick N+1 on a worker
+thread, so the frame can't read the live scene. capture(scene) makes a
+shallow copy of it in which everything update() mutates in place is frozen:
+
+- objects with freeze(clock) (Player, Enemy, DialogueBox, EnemySwarm, the
+  sim.story chapter, StaticLayers with a state_fn) are swapped for their
+  draw-only copies
+- sprite groups and lists become lists of frozen items, Rects are copied
+- self.game becomes a FrameState (interpolation alpha + a stopped clock)
+
+Scalars (time, flags, counters) need nothing: update() rebinds them on the
+live scene, the copy keeps its own. Caches used only by drawing (static
+layers, dialogue layout, anim_cache) stay shared with the live scene – the
+worker never draws: scene switches and preloads wait for the main thread
+(Game.enter / Game.preload while pipelined).
+"""
+import copy
+
+import pygame
+
+
+class FrozenClock:
+    """core.clock interface stopped at one tick."""
+
+    __slots__ = ("_ms",)
+
+    def __init__(self, ms):
+        self._ms = ms
+
+    def ticks(self):
+        return self._ms
+
+    def advance(self, dt):
+        pass
+
+
+class FrameState:
+    """What draw code may read from Game, fixed when the snapshot was taken."""
+
+    __slots__ = ("alpha", "clock")
+
+    def __init__(self, alpha, clock):
+        self.alpha = alpha
+        self.clock = clock
+
+
+def freeze(value, clock, memo):
+    """Draw-only version of one scene attribute (same object if it needs none)."""
+    key = id(value)
+    if key in memo:
+        return memo[key]
+
+    if hasattr(value, "freeze"):
+        frozen = value.freeze(clock)
+    elif isinstance(value, (pygame.sprite.AbstractGroup, list)):
+        frozen = [freeze(item, clock, memo) for item in value]
+    elif isinstance(value, pygame.Rect):
+        frozen = value.copy()
+    else:
+        frozen = value
+
+    memo[key] = frozen
+    return frozen
+
+
+def capture(scene):
+    """Shallow copy of scene that draw() / draw_textured() can use while the live one updates."""
+    game = scene.game
+    clock = FrozenClock(game.clock.ticks())
+    memo = {}
+
+    snap = copy.copy(scene)
+    for name, value in vars(scene).items():
+        setattr(snap, name, freeze(value, clock, memo))
+    snap.game = FrameState(game.alpha, clock)
+    return snap
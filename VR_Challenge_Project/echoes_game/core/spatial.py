@@ -0,0 +1,112 @@
+# core/spatial.py
+import pygame
+from config import settings
+
+
+class SpatialHash:
+    """
+    Uniform-grid broadphase for collisions.
+
+    Items (enemies, trigger zones, hitboxes) are bucketed by every grid cell
+    their rect touches; query(rect) only looks at the cells that rect touches,
+    then does the exact colliderect test. Each item lives on a layer
+    ("enemy", "zone", ...) so one grid can hold everything in a scene.
+    """
+
+    def __init__(self, cell_size=None):
+        self.cell_size = cell_size or settings.SPATIAL_CELL_SIZE
+        self._cells = {}   # (cx, cy) -> set of items
+        self._items = {}   # item -> [rect, layer, cells, order]
+        self._next_order = 0
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, item):
+        return item in self._items
+
+    def _cells_for(self, rect):
+        cs = self.cell_size
+        x0 = rect.left // cs
+        y0 = rect.top // cs
+        x1 = max(x0, (rect.right - 1) // cs)
+        y1 = max(y0, (rect.bottom - 1) // cs)
+        return tuple((cx, cy) for cx in range(x0, x1 + 1) for cy in range(y0, y1 + 1))
+
+    def _link(self, item, cells):
+        for cell in cells:
+            bucket = self._cells.get(cell)
+            if bucket is None:
+                bucket = self._cells[cell] = set()
+            bucket.add(item)
+
+    def _unlink(self, item, cells):
+        for cell in cells:
+            bucket = self._cells[cell]
+            bucket.discard(item)
+            if not bucket:
+                del self._cells[cell]
+
+    # ------------- Mutation -------------
+    def insert(self, item, rect, layer="default"):
+        if item in self._items:
+            self.move(item, rect)
+            return
+        rect = pygame.Rect(rect)
+        cells = self._cells_for(rect)
+        self._items[item] = [rect, layer, cells, self._next_order]
+        self._next_order += 1
+        self._link(item, cells)
+
+    def move(self, item, rect):
+        """Incremental update: only re-buckets when the covered cells change."""
+        entry = self._items[item]
+        entry[0].update(rect)
+        cells = self._cells_for(entry[0])
+        if cells != entry[2]:
+            self._unlink(item, entry[2])
+            self._link(item, cells)
+            entry[2] = cells
+
+    def remove(self, item):
+        entry = self._items.pop(item, None)
+        if entry is not None:
+            self._unlink(item, entry[2])
+
+    def clear(self):
+        self._cells.clear()
+        self._items.clear()
+
+    def sync(self, group, layer):
+        """Mirror a sprite group into one layer (moved, new and killed sprites)."""
+        present = set()
+        for sprite in group:
+            present.add(sprite)
+            if sprite in self._items:
+                self.move(sprite, sprite.rect)
+            else:
+                self.insert(sprite, sprite.rect, layer)
+
+        stale = [item for item, entry in self._items.items() if entry[1] == layer and item not in present]
+        for item in stale:
+            self.remove(item)
+
+    # ------------- Queries -------------
+    def query(self, rect, layer=None):
+        """Items overlapping rect (optionally on one layer), in insertion order."""
+        rect = pygame.Rect(rect)
+        candidates = set()
+        for cell in self._cells_for(rect):
+            bucket = self._cells.get(cell)
+            if bucket:
+                candidates.update(bucket)
+
+        hits = []
+        for item in candidates:
+            entry = self._items[item]
+            if layer is not None and entry[1] != layer:
+                continue
+            if entry[0].colliderect(rect):
+                hits.append(item)
+        hits.sort(key=lambda item: self._items[item][3])
+        return hits
@@ -0,0 +1,110 @@
+# core/startup.py
+"""
+Startup profile (main.py --profile-startup): time from process start to the
+first presented frame, split into per-module import time and per-step init
+time. Everything here is a no-op until enable() is called.
+"""
+import sys
+import time
+from contextlib import contextmanager
+
+enabled = False
+
+_origin = time.perf_counter()
+_imports = []   # (module name, self seconds, cumulative seconds)
+_stages = []    # (name, seconds)
+_first_frame = None
+
+
+# ------------- Per-module import timing -------------
+class _TimedLoader:
+    """Wraps a module's loader so exec_module() gets timed."""
+
+    _stack = []  # child time of the modules currently being imported
+
+    def __init__(self, loader):
+        self._loader = loader
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        stack = self._stack
+        stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            total = time.perf_counter() - start
+            children = stack.pop()
+            if stack:
+                stack[-1] += total
+            _imports.append((module.__name__, total - children, total))
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+
+class _TimedFinder:
+    """First entry on sys.meta_path: finds specs through the others, then times them."""
+
+    @classmethod
+    def find_spec(cls, name, path=None, target=None):
+        for finder in sys.meta_path:
+            if finder is cls or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(name, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = _TimedLoader(spec.loader)
+                return spec
+        return None
+
+
+def enable():
+    """Start recording; call before importing the modules you want timed."""
+    global enabled
+    if enabled:
+        return
+    enabled = True
+    sys.meta_path.insert(0, _TimedFinder)
+
+
+# ------------- Init steps -------------
+@contextmanager
+def stage(name):
+    """Time one startup step (subsystem init, window, first scene...)."""
+    if not enabled:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _stages.append((name, time.perf_counter() - start))
+
+
+def first_frame():
+    """Called by Game once the first frame is on screen."""
+    global _first_frame
+    if _first_frame is None:
+        _first_frame = time.perf_counter() - _origin
+
+
+# ------------- Report -------------
+def report(top=15):
+    ms = 1000.0
+    lines = ["startup profile"]
+    if _first_frame is not None:
+        lines.append(f"  time to first frame   {_first_frame * ms:8.2f} ms")
+
+    lines.append("  init steps")
+    for name, seconds in _stages:
+        lines.append(f"    {name:<28}{seconds * ms:8.2f} ms")
+
+    imports = sorted(_imports, key=lambda entry: entry[1], reverse=True)
+    total = sum(entry[1] for entry in imports)
+    lines.append(f"  imports ({len(imports)} modules, {total * ms:.2f} ms; self / cumulative)")
+    for name, own, cumulative in imports[:top]:
+        lines.append(f"    {name:<28}{own * ms:8.2f} ms {cumulative * ms:8.2f} ms")
+    return "\n".join(lines)
@@ -1,17 +1,70 @@
 # core/ui.py
+from collections import OrderedDict
+from functools import lru_cache
+
 import pygame
 
+from config import settings
+
+# Rendered text surfaces keyed by (text, size, color, antialias), oldest first.
+_text_cache = OrderedDict()
+_text_cache_bytes = 0
+
+# عدد مرات الـ rasterize الفعلية (font.render) – بيقراه core.profiler
+font_renders = 0
+
+
+@lru_cache(maxsize=None)
 def get_font(size: int):
-    """إرجاع فونت بالحجم المطلوب."""
+    """إرجاع فونت بالحجم المطلوب (SysFont بيتحمّل مرة واحدة لكل حجم)."""
     return pygame.font.SysFont("consolas", size)
 
+
+def _surface_bytes(surf):
+    return surf.get_width() * surf.get_height() * surf.get_bytesize()
+
+
+def render_uncached(text, size, color, antialias=True):
+    """Rasterize text without going through the cache (for callers that keep the surface)."""
+    global font_renders
+    font_renders += 1
+    return get_font(size).render(text, antialias, color)
+
+
+def render_text(text, size, color, antialias=True):
+    """Return a cached rendered surface for this text; rasterize only on a miss."""
+    global _text_cache_bytes
+
+    key = (text, size, tuple(color), antialias)
+    img = _text_cache.get(key)
+    if img is not None:
+        _text_cache.move_to_end(key)
+        return img
+
+    img = render_uncached(text, size, color, antialias)
+    _text_cache[key] = img
+    _text_cache_bytes += _surface_bytes(img)
+
+    # LRU eviction once we go over the memory cap
+    while _text_cache_bytes > settings.TEXT_CACHE_MAX_BYTES and len(_text_cache) > 1:
+        _, old = _text_cache.popitem(last=False)
+        _text_cache_bytes -= _surface_bytes(old)
+
+    return img
+
+
+def clear_text_cache():
+    global _text_cache_bytes
+    _text_cache.clear()
+    _text_cache_bytes = 0
+
+
 def draw_text(surface, text, size, color, x, y):
-    font = get_font(size)
-    img = font.render(text, True, color)
+    img = render_text(text, size, color)
     surface.blit(img, (x, y))
 
+
 def draw_centered_text(surface, text, size, color, center_x, center_y):
-    font = get_font(size)
-    img = font.render(text, True, color)
+    img = render_text(text, size, color)
     rect = img.get_rect(center=(center_x, center_y))
     surface.blit(img, rect)
@@ -1,102 +1,120 @@
 # entities/enemy.py
+import copy
+
 import pygame
-from config import settings
+from sim.enemy import EnemyState
 
 
 class Enemy(pygame.sprite.Sprite):
     """
-    Simple patrolling enemy.
-    Now has health and can be killed by the player's melee attack.
+    Sprite for a sim.enemy.EnemyState (patrol + health live in the state).
+    Leaves its groups once the state is dead.
     """
 
-    def __init__(self, x, y, patrol_width=160, speed=2, max_health=60):
-        super().__init__()
-
-        self.width = 32
-        self.height = 48
-
-        self.image = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        self.rect = self.image.get_rect(center=(x, y))
-
-        self.speed = speed
-        self.patrol_width = patrol_width
-        self.start_x = x
-        self.direction = 1  # 1 → right, -1 → left
-
-        # Health
-        self.max_health = max_health
-        self.health = max_health
-
-        # Hit feedback
-        self.last_hit_time = 0
-        self.hit_flash_duration_ms = 120
+    # body, outline, head, eyes, legs
+    PALETTE = ((170, 60, 70), (40, 10, 20), (220, 80, 90), (255, 220, 120), (120, 40, 50))
+    FLASH_COLOR = (255, 120, 120, 120)
 
-        self._draw_enemy()
+    # (width, height, palette) -> (normal frame, flash frame), shared by all enemies
+    _sprite_cache = {}
 
-    # ------------- Health -------------
-    def is_alive(self) -> bool:
-        return self.health > 0
-
-    def take_damage(self, amount: int):
-        if amount <= 0:
-            return
-        self.health = max(0, self.health - amount)
-        self.last_hit_time = pygame.time.get_ticks()
-        if self.health <= 0:
-            self.kill()
+    def __init__(self, x, y, patrol_width=160, speed=2, max_health=60, clock=None, state=None):
+        super().__init__()
+        self.state = state or EnemyState(x, y, patrol_width, speed, max_health, clock=clock)
+        self.prev_pos = None
+
+    def __getattr__(self, name):
+        # health, speed, is_alive(), take_damage(), ... come from the state
+        state = self.__dict__.get("state")
+        if state is None:
+            raise AttributeError(name)
+        return getattr(state, name)
+
+    def __setattr__(self, name, value):
+        # Writes to state fields (sprite.health = 0, sprite.rect = ...) land in
+        # the state too, so the view never drifts from what the world steps
+        if name in EnemyState.__slots__ and "state" in self.__dict__:
+            setattr(self.state, name, value)
+        else:
+            super().__setattr__(name, value)
+
+    @property
+    def rect(self):
+        return self.state.rect
+
+    @property
+    def image(self):
+        # Hit flash: just swap between the cached frames
+        normal, flash = self._get_frames(self.state.width, self.state.height, self.PALETTE)
+        return flash if self.state.flashing() else normal
+
+    def reset(self):
+        """Back to the spawn point with full health (scene restart)."""
+        self.state.reset()
+        self.prev_pos = None
+
+    def freeze(self, clock):
+        """Draw-only copy at this tick (core.snapshot): own state copy, stopped clock."""
+        state = copy.copy(self.state)
+        state.rect = state.rect.copy()
+        state.clock = clock
+        frozen = Enemy(0, 0, state=state)
+        frozen.prev_pos = self.prev_pos
+        return frozen
 
     # ------------- Visuals -------------
-    def _draw_enemy(self):
+    @classmethod
+    def _get_frames(cls, width, height, palette):
+        key = (width, height, palette)
+        frames = cls._sprite_cache.get(key)
+        if frames is None:
+            normal = pygame.Surface((width, height), pygame.SRCALPHA)
+            cls._draw_enemy(normal, palette)
+
+            # Flash frame = normal + red overlay (same look as the old per-frame blit)
+            flash = normal.copy()
+            overlay = pygame.Surface((width, height), pygame.SRCALPHA)
+            overlay.fill(cls.FLASH_COLOR)
+            flash.blit(overlay, (0, 0))
+
+            if pygame.display.get_surface() is not None:
+                normal = normal.convert_alpha()
+                flash = flash.convert_alpha()
+
+            frames = (normal, flash)
+            cls._sprite_cache[key] = frames
+        return frames
+
+    @staticmethod
+    def _draw_enemy(surf, palette):
         """Draw simple hostile robot / soldier style."""
-        surf = self.image
-        surf.fill((0, 0, 0, 0))
-
-        w, h = self.width, self.height
+        body_color, outline_color, head_color, eye_color, leg_color = palette
+        w, h = surf.get_size()
 
         # Body
         body_rect = pygame.Rect(w // 4, h // 4, w // 2, h // 2)
-        pygame.draw.rect(surf, (170, 60, 70), body_rect, border_radius=6)
-        pygame.draw.rect(surf, (40, 10, 20), body_rect, 2, border_radius=6)
+        pygame.draw.rect(surf, body_color, body_rect, border_radius=6)
+        pygame.draw.rect(surf, outline_color, body_rect, 2, border_radius=6)
 
         # Head
         head_rect = pygame.Rect(w // 4, h // 8, w // 2, h // 5)
-        pygame.draw.rect(surf, (220, 80, 90), head_rect, border_radius=4)
-        pygame.draw.rect(surf, (40, 10, 20), head_rect, 2, border_radius=4)
+        pygame.draw.rect(surf, head_color, head_rect, border_radius=4)
+        pygame.draw.rect(surf, outline_color, head_rect, 2, border_radius=4)
 
         # "Eyes"
         eye_rect = pygame.Rect(head_rect.x + 4, head_rect.y + 4, head_rect.width - 8, head_rect.height - 8)
-        pygame.draw.rect(surf, (255, 220, 120), eye_rect, border_radius=3)
+        pygame.draw.rect(surf, eye_color, eye_rect, border_radius=3)
 
         # Legs
         leg_w = w // 4
         leg_h = h // 4
         left_leg = pygame.Rect(w // 4, body_rect.bottom, leg_w, leg_h)
         right_leg = pygame.Rect(w // 2, body_rect.bottom, leg_w, leg_h)
-        pygame.draw.rect(surf, (120, 40, 50), left_leg, border_radius=4)
-        pygame.draw.rect(surf, (120, 40, 50), right_leg, border_radius=4)
+        pygame.draw.rect(surf, leg_color, left_leg, border_radius=4)
+        pygame.draw.rect(surf, leg_color, right_leg, border_radius=4)
 
     # ------------- Update -------------
     def update(self):
-        # Patrol horizontally around start_x
-        self.rect.x += self.speed * self.direction
-
-        if self.rect.x < self.start_x - self.patrol_width // 2:
-            self.rect.x = self.start_x - self.patrol_width // 2
-            self.direction = 1
-        elif self.rect.x > self.start_x + self.patrol_width // 2:
-            self.rect.x = self.start_x + self.patrol_width // 2
-            self.direction = -1
-
-        # Keep inside screen vertically just in case
-        self.rect.clamp_ip(pygame.Rect(0, 0, settings.WIDTH, settings.HEIGHT))
-
-        # Hit flash (اختياري لو حابب تبين إنه اتضرب)
-        now = pygame.time.get_ticks()
-        if now - self.last_hit_time <= self.hit_flash_duration_ms:
-            # overlay بسيط أحمر
-            flash = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-            flash.fill((255, 120, 120, 120))
-            self.image.blit(flash, (0, 0))
-        else:
-            # إعادة الرسم الطبيعي لتفادي تراكم الفلاش
-            self._draw_enemy()
+        """Follow the state after a world step: drop out of the groups once killed."""
+        if not self.state.is_alive():
+            self.kill()
@@ -1,158 +1,77 @@
 # entities/player.py
+import copy
+
 import pygame
 from config import settings
+from sim.player import PlayerState
 
 
 class Player(pygame.sprite.Sprite):
-    def __init__(self, x, y):
+    """
+    Sprite for a sim.player.PlayerState: the rules live in the state (scenes
+    read and write them straight through this view), this class only draws
+    the poses.
+    """
+
+    # Sprite atlas: every (facing × state) pose is drawn once into one packed
+    # surface, shared by all Player instances – built on the first draw, so
+    # code that only simulates never creates it.
+    FACINGS = ("down", "up", "left", "right")
+    STATES = ("idle", "dash", "attack")
+    _atlas = None
+    _frames = None
+
+    def __init__(self, x, y, clock=None, state=None):
         super().__init__()
+        self.state = state or PlayerState(x, y, clock=clock)
+        self.prev_pos = None
+
+    def __getattr__(self, name):
+        # health, facing, is_dashing, get_attack_rect(), ... come from the state
+        state = self.__dict__.get("state")
+        if state is None:
+            raise AttributeError(name)
+        return getattr(state, name)
+
+    def __setattr__(self, name, value):
+        # Writes to state fields (sprite.health = 0, sprite.rect = ...) land in
+        # the state too, so the view never drifts from what the world steps
+        if name in PlayerState.__slots__ and "state" in self.__dict__:
+            setattr(self.state, name, value)
+        else:
+            super().__setattr__(name, value)
 
-        # Size
-        self.width = 40
-        self.height = 64
-
-        # Sprite surface with transparency
-        self.image = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        self.rect = self.image.get_rect(center=(x, y))
-
-        # Movement
-        self.base_speed = 4
-        self.speed = self.base_speed
-        self.facing = "down"
-
-        # Dash system
-        self.is_dashing = False
-        self.dash_speed_multiplier = 2.4
-        self.dash_duration_ms = 220
-        self.dash_cooldown_ms = 600
-        self.dash_start_time = 0
-        self.last_dash_time = -9999
-
-        # Health system
-        self.max_health = 100
-        self.health = self.max_health
-        self.last_hit_time = 0
-        self.hit_cooldown_ms = 800  # ms between hits
-
-        # Attack system (melee)
-        self.attacking = False
-        self.attack_damage = 25
-        self.attack_range = 32       # المسافة قدام اللاعب
-        self.attack_width = 26       # عرض الضربة
-        self.attack_duration_ms = 180
-        self.attack_cooldown_ms = 260
-        self.last_attack_time = -9999
-        self.attack_start_time = 0
-        self._attack_already_hit = False  # علشان ما يضربش نفس العدو مليون مرة في نفس السوينج
-
-        # Draw initial idle sprite
-        self._draw_idle()
-
-    # ---------------- Health ----------------
-    def is_alive(self) -> bool:
-        return self.health > 0
-
-    def take_damage(self, amount: int):
-        """Reduce health with a short invincibility window."""
-        if amount <= 0:
-            return
+    @property
+    def rect(self):
+        return self.state.rect
 
-        now = pygame.time.get_ticks()
-        if now - self.last_hit_time < self.hit_cooldown_ms:
-            # Still in invincibility window
-            return
+    @property
+    def image(self):
+        """Atlas frame for the current facing / dash / attack pose."""
+        if Player._frames is None:
+            self._build_atlas()
+        return Player._frames[self.state.pose]
 
-        self.last_hit_time = now
-        self.health = max(0, self.health - amount)
-
-    # ---------------- Attack helpers ----------------
-    def can_attack(self) -> bool:
-        now = pygame.time.get_ticks()
-        return (not self.attacking) and (now - self.last_attack_time >= self.attack_cooldown_ms)
-
-    def _start_attack(self):
-        """Internal: start a melee swing."""
-        now = pygame.time.get_ticks()
-        self.attacking = True
-        self.attack_start_time = now
-        self.last_attack_time = now
-        self._attack_already_hit = False
-
-    def is_attacking(self) -> bool:
-        """Used by scenes to check if a swing is active."""
-        return self.attacking
-
-    def can_hit_this_swing(self) -> bool:
-        """Used by scenes: هل لسه مسموح للسوينج الحالي يضرب حد؟"""
-        return self.attacking and not self._attack_already_hit
-
-    def register_attack_hit(self):
-        """Called by scenes لما ضربة واحدة تصيب عدو."""
-        self._attack_already_hit = True
-
-    def get_attack_rect(self):
-        """Return a rect representing melee hitbox in front of the player."""
-        if not self.attacking:
-            return None
-
-        # Base rect (player)
-        px, py, pw, ph = self.rect
-
-        if self.facing == "up":
-            return pygame.Rect(
-                px + (pw - self.attack_width) // 2,
-                py - self.attack_range,
-                self.attack_width,
-                self.attack_range,
-            )
-        elif self.facing == "down":
-            return pygame.Rect(
-                px + (pw - self.attack_width) // 2,
-                py + ph,
-                self.attack_width,
-                self.attack_range,
-            )
-        elif self.facing == "left":
-            return pygame.Rect(
-                px - self.attack_range,
-                py + (ph - self.attack_width) // 2,
-                self.attack_range,
-                self.attack_width,
-            )
-        else:  # "right"
-            return pygame.Rect(
-                px + pw,
-                py + (ph - self.attack_width) // 2,
-                self.attack_range,
-                self.attack_width,
-            )
-
-    # ---------------- Dash helpers ----------------
-    def can_dash(self) -> bool:
-        now = pygame.time.get_ticks()
-        return (not self.is_dashing) and (now - self.last_dash_time >= self.dash_cooldown_ms)
-
-    def _start_dash(self):
-        now = pygame.time.get_ticks()
-        self.is_dashing = True
-        self.dash_start_time = now
-        self.last_dash_time = now
+    def reset(self, x, y):
+        """Back to a fresh spawn at (x, y) – used when a pooled scene restarts."""
+        self.state.reset(x, y)
+        self.prev_pos = None
 
-    def _update_dash_state(self):
-        if not self.is_dashing:
-            self.speed = self.base_speed
-            return
+    def update(self, keys):
+        self.state.update(keys)
 
-        now = pygame.time.get_ticks()
-        if now - self.dash_start_time >= self.dash_duration_ms:
-            self.is_dashing = False
-            self.speed = self.base_speed
-        else:
-            self.speed = int(self.base_speed * self.dash_speed_multiplier)
+    def freeze(self, clock):
+        """Draw-only copy at this tick (core.snapshot): own state copy, stopped clock."""
+        state = copy.copy(self.state)
+        state.rect = state.rect.copy()
+        state.clock = clock
+        frozen = Player(0, 0, state=state)
+        frozen.prev_pos = self.prev_pos
+        return frozen
 
     # ---------------- Drawing: 3D-style body ----------------
-    def _draw_head(self, surf):
-        """Helmet / head with visor and highlights."""
+    def _draw_head(self, surf, facing):
+        """Helmet / head with visor and highlights (visor follows the facing)."""
         w, h = self.width, self.height
 
         head_radius = w // 4
@@ -166,6 +85,21 @@ class Player(pygame.sprite.Sprite):
         pygame.draw.circle(head_surf, settings.COLOR_PLAYER_SUIT, (cx, cy), head_radius)
         pygame.draw.circle(head_surf, settings.COLOR_PLAYER_OUTLINE, (cx, cy), head_radius, 2)
 
+        if facing == "up":
+            # Back of the helmet: no visor, just a ridge
+            ridge = pygame.Rect(0, 0, 4, head_radius + 2)
+            ridge.center = (cx, cy)
+            pygame.draw.rect(head_surf, settings.COLOR_PLAYER_SUIT_FRONT, ridge, border_radius=2)
+            pygame.draw.rect(head_surf, settings.COLOR_PLAYER_OUTLINE, ridge, 1, border_radius=2)
+            surf.blit(head_surf, (head_center[0] - head_size // 2, head_center[1] - head_size // 2))
+            return
+
+        # Side facings slide the visor towards the facing side
+        if facing == "left":
+            cx -= head_radius // 3
+        elif facing == "right":
+            cx += head_radius // 3
+
         # Visor
         visor_w = int(head_radius * 1.5)
         visor_h = int(head_radius * 0.9)
@@ -215,7 +149,7 @@ class Player(pygame.sprite.Sprite):
         dest_y = head_center[1] - head_size // 2
         surf.blit(head_surf, (dest_x, dest_y))
 
-    def _draw_body_3d(self, surf):
+    def _draw_body_3d(self, surf, facing):
         """Pseudo-3D body: top, front, side."""
         w, h = self.width, self.height
 
@@ -294,18 +228,20 @@ class Player(pygame.sprite.Sprite):
         )
         pygame.draw.rect(surf, settings.COLOR_PLAYER_OUTLINE, belt_rect, border_radius=3)
 
-        # Chest light
-        chest_light = pygame.Rect(
-            body_x + body_width // 2 - 4,
-            body_y + 8,
-            8,
-            8,
-        )
-        pygame.draw.rect(surf, settings.COLOR_PLAYER_ACCENT, chest_light, border_radius=3)
+        # Chest light (hidden from behind, shifted on side facings)
+        if facing != "up":
+            shift = {"left": -4, "right": 4}.get(facing, 0)
+            chest_light = pygame.Rect(
+                body_x + body_width // 2 - 4 + shift,
+                body_y + 8,
+                8,
+                8,
+            )
+            pygame.draw.rect(surf, settings.COLOR_PLAYER_ACCENT, chest_light, border_radius=3)
 
         return front_rect
 
-    def _draw_limbs_3d(self, surf, front_rect):
+    def _draw_limbs_3d(self, surf, front_rect, facing, state):
         """Arms and legs that match the 3D-style body."""
         w, h = self.width, self.height
 
@@ -327,16 +263,28 @@ class Player(pygame.sprite.Sprite):
             arm_height,
         )
 
+        # Attack: the striking arm swings out and up towards the facing side
+        striking_arm = left_arm if facing in ("left", "up") else right_arm
+        if state == "attack":
+            if striking_arm is left_arm:
+                striking_arm.x -= 3
+            else:
+                striking_arm.x += 3
+            striking_arm.y -= 4
+
         for arm in (left_arm, right_arm):
             pygame.draw.rect(surf, settings.COLOR_PLAYER_SUIT_FRONT, arm, border_radius=8)
             pygame.draw.rect(surf, settings.COLOR_PLAYER_OUTLINE, arm, 2, border_radius=8)
 
-        # Hands
+        # Hands (the striking hand glows during an attack)
         hand_height = 6
         left_hand = pygame.Rect(left_arm.x, left_arm.bottom - hand_height, arm_width, hand_height)
         right_hand = pygame.Rect(right_arm.x, right_arm.bottom - hand_height, arm_width, hand_height)
-        for hand in (left_hand, right_hand):
-            pygame.draw.rect(surf, settings.COLOR_PLAYER_OUTLINE, hand, border_radius=4)
+        for arm, hand in ((left_arm, left_hand), (right_arm, right_hand)):
+            if state == "attack" and arm is striking_arm:
+                pygame.draw.rect(surf, settings.COLOR_PLAYER_ACCENT, hand, border_radius=4)
+            else:
+                pygame.draw.rect(surf, settings.COLOR_PLAYER_OUTLINE, hand, border_radius=4)
 
         # Legs
         leg_width = front_rect.width // 3
@@ -367,64 +315,48 @@ class Player(pygame.sprite.Sprite):
         for foot in (left_foot, right_foot):
             pygame.draw.rect(surf, settings.COLOR_PLAYER_OUTLINE, foot, border_radius=4)
 
-    def _draw_idle(self):
-        """Redraw character in idle pose."""
-        self.image.fill((0, 0, 0, 0))
-        front_rect = self._draw_body_3d(self.image)
-        self._draw_limbs_3d(self.image, front_rect)
-        self._draw_head(self.image)
-
-    # ---------------- Movement / Update ----------------
-    def _handle_movement_input(self, keys):
-        dx, dy = 0, 0
-
-        if keys[pygame.K_w] or keys[pygame.K_UP]:
-            dy -= self.speed
-            self.facing = "up"
-        if keys[pygame.K_s] or keys[pygame.K_DOWN]:
-            dy += self.speed
-            self.facing = "down"
-        if keys[pygame.K_a] or keys[pygame.K_LEFT]:
-            dx -= self.speed
-            self.facing = "left"
-        if keys[pygame.K_d] or keys[pygame.K_RIGHT]:
-            dx += self.speed
-            self.facing = "right"
-
-        self.rect.x += dx
-        self.rect.y += dy
-
-        # Clamp to screen
-        self.rect.clamp_ip(pygame.Rect(0, 0, settings.WIDTH, settings.HEIGHT))
-
-    def _handle_attack_input(self, keys):
-        # Attack key: J
-        if keys[pygame.K_j] and self.can_attack():
-            self._start_attack()
-
-        # End attack after duration
-        if self.attacking:
-            now = pygame.time.get_ticks()
-            if now - self.attack_start_time >= self.attack_duration_ms:
-                self.attacking = False
-
-    def _handle_dash_input(self, keys):
-        # Dash key: K
-        if keys[pygame.K_k] and self.can_dash():
-            self._start_dash()
-
-        self._update_dash_state()
+    def _draw_dash_trail(self, surf, facing):
+        """Motion streaks behind the player while dashing."""
+        w, h = self.width, self.height
+        trail = pygame.Surface((w, h), pygame.SRCALPHA)
+        color = (*settings.COLOR_PLAYER_VISOR_GLOW, 110)
 
-    def update(self, keys):
-        if not self.is_alive():
-            return
+        if facing in ("left", "right"):
+            x0, x1 = (w - 10, w - 1) if facing == "left" else (0, 9)
+            for y in (h // 3, h // 2, 2 * h // 3):
+                pygame.draw.line(trail, color, (x0, y), (x1, y), 2)
+        else:
+            y0, y1 = (h - 8, h - 1) if facing == "up" else (0, 7)
+            for x in (w // 4, w // 2, 3 * w // 4):
+                pygame.draw.line(trail, color, (x, y0), (x, y1), 2)
+
+        surf.blit(trail, (0, 0))
+
+    def _draw_pose(self, surf, facing, state):
+        """Draw one (facing, state) pose onto an empty cell."""
+        if state == "dash":
+            self._draw_dash_trail(surf, facing)
+        front_rect = self._draw_body_3d(surf, facing)
+        self._draw_limbs_3d(surf, front_rect, facing, state)
+        self._draw_head(surf, facing)
+
+    def _build_atlas(self):
+        """Render every pose once into one packed surface and slice it into frames."""
+        w, h = self.width, self.height
+        atlas = pygame.Surface((w * len(self.STATES), h * len(self.FACINGS)), pygame.SRCALPHA)
+
+        for row, facing in enumerate(self.FACINGS):
+            for col, state in enumerate(self.STATES):
+                self._draw_pose(atlas.subsurface((col * w, row * h, w, h)), facing, state)
+
+        if pygame.display.get_surface() is not None:
+            atlas = atlas.convert_alpha()
 
-        # Dash affects speed
-        self._handle_dash_input(keys)
+        frames = {}
+        for row, facing in enumerate(self.FACINGS):
+            for col, state in enumerate(self.STATES):
+                frames[(facing, state)] = atlas.subsurface((col * w, row * h, w, h))
 
-        # Movement
-        self._handle_movement_input(keys)
+        Player._atlas = atlas
+        Player._frames = frames
 
-        # Attack
-        self._handle_attack_input(keys)
-        # ممكن لاحقاً نغير شكل الـ sprite وقت الهجوم / الداش
@@ -0,0 +1,145 @@
+# entities/swarm.py
+import copy
+
+import numpy as np
+import pygame
+
+from config import settings
+from core import clock as game_clock
+from entities.enemy import Enemy
+
+
+class EnemySwarm:
+    """
+    Data-oriented storage for lots of patrolling enemies (Rift surge mode).
+
+    Same patrol / clamp / damage rules as Enemy, but every field lives in a
+    NumPy array and each tick is a handful of vectorized operations instead of
+    one Python update() per sprite. Drawing blits the shared cached Enemy frames.
+    Only draw() touches pygame Surfaces.
+    """
+
+    def __init__(self, width=32, height=48, palette=Enemy.PALETTE, clock=None):
+        self.clock = clock or game_clock.REAL
+        self.width = width
+        self.height = height
+        self.palette = palette
+        self.hit_flash_duration_ms = 120
+
+        # Positions are the rect's top-left, like Enemy.rect.x / rect.y
+        self.x = np.zeros(0, dtype=np.int32)
+        self.y = np.zeros(0, dtype=np.int32)
+        self.direction = np.zeros(0, dtype=np.int32)
+        self.speed = np.zeros(0, dtype=np.int32)
+        self.patrol_min = np.zeros(0, dtype=np.int32)
+        self.patrol_max = np.zeros(0, dtype=np.int32)
+        self.health = np.zeros(0, dtype=np.int32)
+        self.max_health = np.zeros(0, dtype=np.int32)
+        self.last_hit_time = np.zeros(0, dtype=np.int64)
+
+        # Spawn positions, for reset()
+        self.spawn_x = np.zeros(0, dtype=np.int32)
+        self.spawn_y = np.zeros(0, dtype=np.int32)
+
+    def __len__(self):
+        return int(np.count_nonzero(self.health > 0))
+
+    # ------------- Spawning -------------
+    def spawn(self, center_x, center_y, patrol_width=160, speed=2, max_health=60):
+        """Add enemies; every argument may be a scalar or an array (one per enemy)."""
+        center_x = np.atleast_1d(np.asarray(center_x, dtype=np.int32))
+        count = center_x.size
+
+        def column(value):
+            return np.broadcast_to(np.asarray(value, dtype=np.int32), (count,))
+
+        center_y = column(center_y)
+        patrol_width = column(patrol_width)
+        max_health = column(max_health)
+
+        # Same quirk as Enemy: patrol bounds are around the spawn center but
+        # compared against the rect's left edge.
+        self.x = np.concatenate([self.x, center_x - self.width // 2])
+        self.y = np.concatenate([self.y, center_y - self.height // 2])
+        self.direction = np.concatenate([self.direction, np.ones(count, dtype=np.int32)])
+        self.speed = np.concatenate([self.speed, column(speed)])
+        self.patrol_min = np.concatenate([self.patrol_min, center_x - patrol_width // 2])
+        self.patrol_max = np.concatenate([self.patrol_max, center_x + patrol_width // 2])
+        self.health = np.concatenate([self.health, max_health])
+        self.max_health = np.concatenate([self.max_health, max_health])
+        self.last_hit_time = np.concatenate([self.last_hit_time, np.full(count, -9999, dtype=np.int64)])
+        self.spawn_x = self.x.copy()
+        self.spawn_y = self.y.copy()
+
+    def reset(self):
+        """Every enemy back to its spawn point with full health (same arrays, no re-spawn)."""
+        self.x[:] = self.spawn_x
+        self.y[:] = self.spawn_y
+        self.direction[:] = 1
+        self.health[:] = self.max_health
+        self.last_hit_time[:] = -9999
+
+    # ------------- Update -------------
+    def update(self):
+        alive = self.health > 0
+
+        self.x += np.where(alive, self.speed * self.direction, 0).astype(np.int32)
+
+        # Reflect at the patrol bounds
+        low = self.x < self.patrol_min
+        high = self.x > self.patrol_max
+        self.x = np.where(low, self.patrol_min, np.where(high, self.patrol_max, self.x))
+        self.direction[low] = 1
+        self.direction[high] = -1
+
+        # Keep inside the screen
+        np.clip(self.x, 0, settings.WIDTH - self.width, out=self.x)
+        np.clip(self.y, 0, settings.HEIGHT - self.height, out=self.y)
+
+    # ------------- Collisions / damage -------------
+    def overlapping(self, rect):
+        """Indices of living enemies whose rect overlaps rect (ascending)."""
+        rect = pygame.Rect(rect)
+        hit = (
+            (self.health > 0)
+            & (self.x < rect.right)
+            & (self.x + self.width > rect.left)
+            & (self.y < rect.bottom)
+            & (self.y + self.height > rect.top)
+        )
+        return np.flatnonzero(hit)
+
+    def take_damage(self, indices, amount):
+        if amount <= 0 or len(indices) == 0:
+            return
+        self.health[indices] = np.maximum(0, self.health[indices] - amount)
+        self.last_hit_time[indices] = self.clock.ticks()
+
+    # ------------- Drawing -------------
+    def freeze(self, clock):
+        """Draw-only copy at this tick (core.snapshot): the arrays draw() reads, copied."""
+        frozen = copy.copy(self)
+        frozen.x = self.x.copy()
+        frozen.y = self.y.copy()
+        frozen.health = self.health.copy()
+        frozen.last_hit_time = self.last_hit_time.copy()
+        frozen.clock = clock
+        return frozen
+
+    def draw(self, surface):
+        alive = np.flatnonzero(self.health > 0)
+        if alive.size == 0:
+            return
+
+        now = self.clock.ticks()
+        flashing = (now - self.last_hit_time[alive]) <= self.hit_flash_duration_ms
+
+        # Frames are fetched on the first draw – a simulate-only run never makes them
+        normal, flash = Enemy._get_frames(self.width, self.height, self.palette)
+        surface.blits(
+            [
+                (flash if f else normal, (x, y))
+                for x, y, f in zip(self.x[alive].tolist(), self.y[alive].tolist(), flashing.tolist())
+            ],
+            doreturn=False,
+        )
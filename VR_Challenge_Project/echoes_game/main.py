@@ -1,7 +1,72 @@
 # main.py
+import argparse
+import os
+import sys
+import time
+
+if "--profile-startup" in sys.argv:
+    # Has to come before the game's imports so they get timed too
+    from core import startup
+    startup.enable()
+
+from config import settings
 from core.game import Game
-from scenes.main_menu import MainMenu
+from core.input import ReplayInput
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=settings.TITLE)
+    parser.add_argument("--scene", default="MainMenu", help="start in this registered scene")
+    parser.add_argument("--rift-surge", action="store_true",
+                        help="stress test: Rift Zone with settings.RIFT_SURGE_ENEMIES enemies")
+    parser.add_argument("--record", metavar="FILE", help="record every tick's input to FILE")
+    parser.add_argument("--replay", metavar="FILE",
+                        help="replay a recording (uncapped) and print frame timings")
+    parser.add_argument("--soak", type=float, metavar="SECONDS",
+                        help="headless: simulate SECONDS of game time as fast as possible, then exit")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="report import / init times up to the first frame, then exit")
+    parser.add_argument("--full-init", action="store_true",
+                        help="pygame.init() everything instead of the fast-start subsystems")
+    parser.add_argument("--pipelined", action="store_true",
+                        help="simulate the next ticks on a worker thread while the frame is drawn")
+    return parser.parse_args(argv)
+
 
 if __name__ == "__main__":
-    game = Game(MainMenu)
-    game.run()
+    args = parse_args()
+
+    if args.full_init:
+        # Compare against pygame.init() (all modules, mixer + joystick included)
+        settings.FAST_START = False
+
+    if args.pipelined:
+        settings.PIPELINED = True
+
+    if args.soak:
+        # No window needed; the simulated clock lets timers run at CPU speed
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        settings.GAME_CLOCK = "simulated"
+
+    scene = "RiftSurgeScene" if args.rift_surge else args.scene
+
+    if args.replay:
+        # Refuses a recording made on another clock / tick rate (it would desync)
+        replay = ReplayInput(args.replay)
+        game = Game(replay.header["scene"], input=replay)
+    else:
+        game = Game(scene)
+        if args.record:
+            game.input.start_recording(
+                args.record, type(game.current_scene).__name__, settings.TICK_RATE, settings.GAME_CLOCK
+            )
+
+    if args.soak:
+        start = time.perf_counter()
+        ticks = game.soak(args.soak)
+        elapsed = time.perf_counter() - start
+        print(f"soak: {ticks / settings.TICK_RATE:.1f} s of game time in {elapsed:.2f} s "
+              f"({ticks} ticks, ended in {type(game.current_scene).__name__})")
+        game.input.close()
+    else:
+        game.run()
@@ -0,0 +1,38 @@
+# scenes/__init__.py
+"""
+Scene registry: class name -> module. Scene modules are only imported the
+first time a scene is asked for (Game.enter / Game.preload by name), so
+startup pays for MainMenu and nothing else.
+"""
+import importlib
+
+# Chapter order
+SCENES = {
+    "MainMenu": "scenes.main_menu",
+    "LabScene": "scenes.lab_scene",
+    "AshfallCityScene": "scenes.ashfall_city",
+    "RiftZoneScene": "scenes.rift_zone",
+    "KeepersFacilityScene": "scenes.keepers_facility",
+    "AscendantSpireScene": "scenes.ascendant_spire",
+    "CoreChamberScene": "scenes.core_chamber",
+    "RuinedArchiveScene": "scenes.ruined_archive",
+    "MirrorWalkScene": "scenes.mirror_walk",
+    "SilentOrbitScene": "scenes.silent_orbit",
+    "OriginCoreScene": "scenes.origin_core",
+    # Stress test (EnemySwarm)
+    "RiftSurgeScene": "scenes.rift_surge",
+}
+
+
+def get(name):
+    """Scene class for a registered name (imports its module on first use)."""
+    try:
+        module_name = SCENES[name]
+    except KeyError:
+        raise KeyError(f"Unknown scene: {name!r}") from None
+    return getattr(importlib.import_module(module_name), name)
+
+
+def resolve(scene):
+    """Accept a scene class or its registered name."""
+    return get(scene) if isinstance(scene, str) else scene
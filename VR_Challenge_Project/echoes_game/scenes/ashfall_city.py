@@ -1,159 +1,42 @@
 # scenes/ashfall_city.py
 import pygame
-import math
 
-from core.scene import Scene
-from core import ui
-from core.dialogue import DialogueBox
+from core.scene import ChapterScene
+from core import arena, ui
+from core.layers import StaticLayer
+from core.particles import Emitter, ParticleGroup
 from config import settings
-from entities.player import Player
-from entities.enemy import Enemy
-from story.dialogues import CITY_INTRO_DIALOGUE, CITY_STREET_ECHO_1
+from sim.story import AshfallChapter
 
 
-class AshfallCityScene(Scene):
+class AshfallCityScene(ChapterScene):
+    chapter_class = AshfallChapter
+
     def __init__(self, game):
         super().__init__(game)
-        self.game = game
-        self.time = 0.0
 
-        # Player starts near bottom of screen
-        self.player = Player(settings.WIDTH // 2, settings.HEIGHT - 100)
-        self.all_sprites = pygame.sprite.Group(self.player)
+        # Trigger zones come from the chapter (same Rects)
+        self.echo_rect = self.chapter.echo_rect
+        self.gate_rect = self.chapter.gate_rect
 
-        # Enemies
-        self.enemies = pygame.sprite.Group()
-        self._spawn_enemies()
+        # Static background (baked once, blitted every frame)
+        self.background = StaticLayer(self._draw_city_background)
 
-        # Simple Memory Echo zone in the street
-        self.echo_rect = pygame.Rect(
-            settings.WIDTH // 2 - 50,
-            settings.HEIGHT // 2 - 20,
-            100,
-            40,
-        )
-        self.echo_active = False
-        self.echo_collected = False
-
-        # Gate to Rift Zone on the far right side of the road
-        self.gate_rect = pygame.Rect(
-            settings.WIDTH - 120,
-            settings.HEIGHT // 2 + 20,
-            60,
-            120,
+        # Ash falling over the whole street (one pixel per flake, fading to the ground tone)
+        self.ash = Emitter(
+            ParticleGroup(
+                settings.ASH_PARTICLES,
+                ramp=[(200, 192, 186), (170, 162, 160), (135, 128, 132), (100, 95, 104), (64, 60, 74)],
+            ),
+            rate=settings.ASH_PARTICLES / 12,
+            areas=[(-40, -24, settings.WIDTH + 80, 16)],
+            velocity=((-14, 20), (22, 58)),
+            life=(10, 20),
+            seed=2,
+            prefill=True,
         )
-        self.gate_active = False
-
-        # Intro dialogue for the city
-        self.dialogue = DialogueBox(CITY_INTRO_DIALOGUE)
-
-        # Echo dialogue
-        self.echo_dialogue = None
-
-        # Player death state
-        self.player_dead = False
-
-    def _spawn_enemies(self):
-        """Create a couple of patrolling enemies on the road."""
-        road_y = settings.HEIGHT // 2 + 80
-
-        e1 = Enemy(settings.WIDTH // 2 - 140, road_y, patrol_width=200, speed=2, max_health=60)
-        e2 = Enemy(settings.WIDTH // 2 + 80, road_y, patrol_width=180, speed=2, max_health=60)
-
-        self.enemies.add(e1, e2)
-
-    def _pulse(self, speed=2.0, phase=0.0):
-        return 0.5 + 0.5 * math.sin(self.time * speed + phase)
-
-    # ----------------- Events -----------------
-    def handle_events(self, events):
-        # If player is dead, only accept restart / menu
-        if self.player_dead:
-            for event in events:
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_r:
-                        from scenes.ashfall_city import AshfallCityScene
-                        self.game.change_scene(AshfallCityScene(self.game))
-                    elif event.key == pygame.K_ESCAPE:
-                        from scenes.main_menu import MainMenu
-                        self.game.change_scene(MainMenu(self.game))
-            return
-
-        if self.dialogue and self.dialogue.active:
-            for event in events:
-                self.dialogue.handle_event(event)
-            return
 
-        if self.echo_dialogue and self.echo_dialogue.active:
-            for event in events:
-                self.echo_dialogue.handle_event(event)
-            return
-
-        for event in events:
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    from scenes.main_menu import MainMenu
-                    self.game.change_scene(MainMenu(self.game))
-
-                # Travel to Rift Zone
-                if event.key == pygame.K_f and self.gate_active:
-                    from scenes.rift_zone import RiftZoneScene
-                    self.game.change_scene(RiftZoneScene(self.game))
-
-    # ----------------- Update -----------------
-    def update(self, dt):
-        self.time += dt
-        keys = pygame.key.get_pressed()
-
-        if self.player_dead:
-            return
-
-        if self.dialogue and self.dialogue.active:
-            return
-        if self.echo_dialogue and self.echo_dialogue.active:
-            return
-
-        # Update player & enemies
-        self.all_sprites.update(keys)
-        self.enemies.update()
-
-        # Enemy collisions (damage to player)
-        if self.player.is_alive():
-            hits = pygame.sprite.spritecollide(self.player, self.enemies, False)
-            if hits and not self.player.is_dashing:
-                # أثناء الـ Dash ما ناخدش Damage (إحساس بروفيشنال شويه)
-                self.player.take_damage(15)
-
-        # Player attack vs enemies
-        if self.player.is_attacking() and self.player.can_hit_this_swing():
-            attack_rect = self.player.get_attack_rect()
-            if attack_rect:
-                # أي عدو في الـ Hitbox يتضرب مرة واحدة في السوينج
-                for enemy in list(self.enemies):
-                    if enemy.rect.colliderect(attack_rect):
-                        enemy.take_damage(self.player.attack_damage)
-                        self.player.register_attack_hit()
-                        break  # تضرب أول واحد وتخرج، تقدر تغير ده لو عايز Multi-hit
-
-        # Check death
-        if not self.player.is_alive():
-            self.player_dead = True
-
-        # Echo zone logic
-        if not self.echo_collected and self.player.rect.colliderect(self.echo_rect):
-            self.echo_active = True
-        else:
-            self.echo_active = False
-
-        if self.echo_active and keys[pygame.K_e] and not self.echo_dialogue:
-            self.echo_collected = True
-            self.echo_dialogue = DialogueBox(CITY_STREET_ECHO_1)
-
-        # Gate to Rift Zone
-        if self.player.rect.colliderect(self.gate_rect):
-            self.gate_active = True
-        else:
-            self.gate_active = False
+        self.reset()
 
     # ----------------- Drawing helpers -----------------
     def _draw_city_background(self, surface):
@@ -195,34 +78,36 @@ class AshfallCityScene(Scene):
         ui.draw_text(surface, "RIFT ZONE", 12, (200, 190, 255), self.gate_rect.x - 10, self.gate_rect.y - 18)
 
     def _draw_echo_zone(self, surface):
-        if self.echo_collected:
+        if self.chapter.echo_collected:
             return
 
-        pulse = self._pulse(speed=3.0)
-        extra = int(4 * pulse)
+        def render(pulse):
+            extra = int(4 * pulse)
 
-        glow_surface = pygame.Surface((self.echo_rect.width + 40, self.echo_rect.height + 40), pygame.SRCALPHA)
+            glow_surface = pygame.Surface((self.echo_rect.width + 40, self.echo_rect.height + 40), pygame.SRCALPHA)
 
-        pygame.draw.rect(
-            glow_surface,
-            (settings.COLOR_ECHO[0], settings.COLOR_ECHO[1], settings.COLOR_ECHO[2], 40),
-            glow_surface.get_rect(),
-            border_radius=12,
-        )
+            pygame.draw.rect(
+                glow_surface,
+                (settings.COLOR_ECHO[0], settings.COLOR_ECHO[1], settings.COLOR_ECHO[2], 40),
+                glow_surface.get_rect(),
+                border_radius=12,
+            )
 
-        pygame.draw.rect(
-            glow_surface,
-            (settings.COLOR_ECHO[0], settings.COLOR_ECHO[1], settings.COLOR_ECHO[2], 160),
-            pygame.Rect(
-                10 - extra,
-                10 - extra,
-                self.echo_rect.width + extra * 2,
-                self.echo_rect.height + extra * 2,
-            ),
-            2,
-            border_radius=12,
-        )
+            pygame.draw.rect(
+                glow_surface,
+                (settings.COLOR_ECHO[0], settings.COLOR_ECHO[1], settings.COLOR_ECHO[2], 160),
+                pygame.Rect(
+                    10 - extra,
+                    10 - extra,
+                    self.echo_rect.width + extra * 2,
+                    self.echo_rect.height + extra * 2,
+                ),
+                2,
+                border_radius=12,
+            )
+            return glow_surface
 
+        glow_surface = self._pulse_frame(("echo_zone", self.echo_rect.size), 3.0, render)
         surface.blit(glow_surface, (self.echo_rect.x - 20, self.echo_rect.y - 20))
 
         pygame.draw.rect(surface, settings.COLOR_ECHO, self.echo_rect, 2, border_radius=8)
@@ -244,9 +129,10 @@ class AshfallCityScene(Scene):
         if ratio > 0:
             fg_rect = pygame.Rect(x, y, int(width * ratio), height)
             pygame.draw.rect(surface, (200, 80, 80), fg_rect, border_radius=6)
-            glow = pygame.Surface((fg_rect.width, height), pygame.SRCALPHA)
-            pygame.draw.rect(glow, (255, 120, 120, 90), (0, 0, fg_rect.width, height), border_radius=6)
-            surface.blit(glow, (x, y))
+            # Full bar width so every health value reuses the same scratch surface
+            with arena.borrow((width, height), pygame.SRCALPHA) as glow:
+                pygame.draw.rect(glow, (255, 120, 120, 90), (0, 0, fg_rect.width, height), border_radius=6)
+                surface.blit(glow, (x, y), (0, 0, fg_rect.width, height))
 
         pygame.draw.rect(surface, (120, 40, 40), bg_rect, 2, border_radius=6)
 
@@ -281,7 +167,7 @@ class AshfallCityScene(Scene):
             92,
         )
 
-        if self.echo_active and not self.echo_collected and not (self.dialogue and self.dialogue.active):
+        if self.chapter.echo_active and not self.chapter.echo_collected and not self.dialogue.active:
             ui.draw_text(
                 surface,
                 "Press [E] to trigger a street Memory Echo.",
@@ -291,7 +177,7 @@ class AshfallCityScene(Scene):
                 114,
             )
 
-        if self.gate_active and not self.player_dead:
+        if self.chapter.gate_active and not self.chapter.player_dead:
             ui.draw_text(
                 surface,
                 "Press [F] to enter the Rift Zone.",
@@ -313,12 +199,12 @@ class AshfallCityScene(Scene):
         )
 
     def _draw_death_overlay(self, surface):
-        if not self.player_dead:
+        if not self.chapter.player_dead:
             return
 
-        overlay = pygame.Surface((settings.WIDTH, settings.HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 160))
-        surface.blit(overlay, (0, 0))
+        with arena.borrow((settings.WIDTH, settings.HEIGHT), pygame.SRCALPHA) as overlay:
+            overlay.fill((0, 0, 0, 160))
+            surface.blit(overlay, (0, 0))
 
         ui.draw_centered_text(
             surface,
@@ -347,16 +233,17 @@ class AshfallCityScene(Scene):
 
     # ----------------- Draw -----------------
     def draw(self, surface):
-        self._draw_city_background(surface)
+        self.background.draw(surface)
+        self.ash.draw(surface, self.time)
         self._draw_echo_zone(surface)
 
-        self.all_sprites.draw(surface)
-        self.enemies.draw(surface)
+        self.draw_sprites(surface, self.all_sprites)
+        self.draw_sprites(surface, self.enemies)
 
         self._draw_hud(surface)
         self._draw_death_overlay(surface)
 
-        if self.dialogue and self.dialogue.active:
+        if self.dialogue.active:
             self.dialogue.draw(surface)
-        elif self.echo_dialogue and self.echo_dialogue.active:
+        elif self.echo_dialogue.active:
             self.echo_dialogue.draw(surface)
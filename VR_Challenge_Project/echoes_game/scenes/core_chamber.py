@@ -1,134 +1,46 @@
 # scenes/core_chamber.py
 import pygame
-import math
 
-from core.scene import Scene
-from core import ui
-from core.dialogue import DialogueBox
+from core.scene import ChapterScene
+from core import arena, ui
+from core.layers import StaticLayer
+from core.particles import Emitter, ParticleGroup
 from config import settings
-from entities.player import Player
-from story.dialogues import (
-    CORE_INTRO_DIALOGUE,
-    CORE_FINAL_CHOICE_INTRO,
-    CORE_FINAL_CHOICE_ENDING_RESET,
-    CORE_FINAL_CHOICE_ENDING_PRESERVE,
-)
+from sim.story import CoreChamberChapter
 
 
-class CoreChamberScene(Scene):
+class CoreChamberScene(ChapterScene):
+    # Intro -> choice -> ending dialogues; the closed ending leads on (sim.story)
+    chapter_class = CoreChamberChapter
+
     def __init__(self, game):
         super().__init__(game)
-        self.game = game
-        self.time = 0.0
-
-        # Player
-        self.player = Player(settings.WIDTH // 2, settings.HEIGHT - 120)
-        self.all_sprites = pygame.sprite.Group(self.player)
-
-        # Core center
-        self.core_rect = pygame.Rect(
-            settings.WIDTH // 2 - 40,
-            settings.HEIGHT // 2 - 60,
-            80,
-            120,
-        )
 
-        # Choice terminals
-        self.reset_rect = pygame.Rect(
-            settings.WIDTH // 2 - 200,
-            settings.HEIGHT // 2 + 60,
-            140,
-            50,
+        # Core center and the choice terminals come from the chapter (same Rects)
+        self.core_rect = self.chapter.core_rect
+        self.reset_rect = self.chapter.reset_rect
+        self.preserve_rect = self.chapter.preserve_rect
+
+        # Static background (rings + core column); only the core glow animates
+        self.background = StaticLayer(self._draw_core_background)
+
+        # Energy rising off the core column
+        self.core_energy = Emitter(
+            ParticleGroup(
+                800,
+                ramp=[(220, 240, 255), (140, 200, 255), (80, 130, 255), (50, 70, 170), (20, 24, 70)],
+                size=3,
+                gravity=(0, -20),
+                additive=True,
+            ),
+            rate=260,
+            areas=[self.core_rect.inflate(-10, -10)],
+            velocity=((-28, 28), (-70, -20)),
+            life=(1.0, 2.6),
+            seed=5,
         )
-        self.preserve_rect = pygame.Rect(
-            settings.WIDTH // 2 + 60,
-            settings.HEIGHT // 2 + 60,
-            140,
-            50,
-        )
-
-        self.reset_active = False
-        self.preserve_active = False
 
-        # Dialogue phases
-        self.intro_dialogue = DialogueBox(CORE_INTRO_DIALOGUE)
-        self.choice_intro_dialogue = None
-        self.ending_dialogue = None
-
-        # Which ending selected
-        self.selected_ending = None
-
-    # -------------------------------------------------------------
-    # Helpers
-    # -------------------------------------------------------------
-    def _pulse(self, speed=2.0, phase=0.0):
-        return 0.5 + 0.5 * math.sin(self.time * speed + phase)
-
-    # -------------------------------------------------------------
-    # Events
-    # -------------------------------------------------------------
-    def handle_events(self, events):
-        # Handle dialogue sequences
-        if self.intro_dialogue and self.intro_dialogue.active:
-            for event in events:
-                self.intro_dialogue.handle_event(event)
-            return
-
-        if self.choice_intro_dialogue and self.choice_intro_dialogue.active:
-            for event in events:
-                self.choice_intro_dialogue.handle_event(event)
-            return
-
-        if self.ending_dialogue and self.ending_dialogue.active:
-            for event in events:
-                self.ending_dialogue.handle_event(event)
-            return
-
-        for event in events:
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    from scenes.main_menu import MainMenu
-                    self.game.change_scene(MainMenu(self.game))
-
-                # أول ضغطة 1 / 2 تفتح حوار المواجهة مع Seraph
-                if self.choice_intro_dialogue is None and (event.key in (pygame.K_1, pygame.K_2)):
-                    self.choice_intro_dialogue = DialogueBox(CORE_FINAL_CHOICE_INTRO)
-                    self.selected_ending = "reset" if event.key == pygame.K_1 else "preserve"
-                    return
-
-                # بعد حوار المواجهة، 1/2 تؤكد النهاية وتفتح حوار النهاية
-                if self.choice_intro_dialogue is not None and not (self.ending_dialogue and self.ending_dialogue.active):
-                    if event.key == pygame.K_1:
-                        self.selected_ending = "reset"
-                        self.ending_dialogue = DialogueBox(CORE_FINAL_CHOICE_ENDING_RESET)
-                    elif event.key == pygame.K_2:
-                        self.selected_ending = "preserve"
-                        self.ending_dialogue = DialogueBox(CORE_FINAL_CHOICE_ENDING_PRESERVE)
-
-    # -------------------------------------------------------------
-    # Update
-    # -------------------------------------------------------------
-    def update(self, dt):
-        self.time += dt
-
-        # لو أي حوار شغّال، ما فيش حركة
-        if (self.intro_dialogue and self.intro_dialogue.active) or \
-           (self.choice_intro_dialogue and self.choice_intro_dialogue.active) or \
-           (self.ending_dialogue and self.ending_dialogue.active):
-            return
-
-        # لو في حوار نهاية واتقفَل (active = False) → مباشرة ننتقل للمرحلة اللي بعدها
-        if self.ending_dialogue and not self.ending_dialogue.active:
-            from scenes.ruined_archive import RuinedArchiveScene
-            self.game.change_scene(RuinedArchiveScene(self.game))
-            return
-
-        keys = pygame.key.get_pressed()
-        self.all_sprites.update(keys)
-
-        # Detect if player stands near terminals (just for hints)
-        self.reset_active = self.player.rect.colliderect(self.reset_rect)
-        self.preserve_active = self.player.rect.colliderect(self.preserve_rect)
+        self.reset()
 
     # -------------------------------------------------------------
     # Drawing helpers
@@ -141,19 +53,14 @@ class CoreChamberScene(Scene):
         for i in range(5):
             radius = 60 + i * 35
             alpha = 30 + i * 20
-            circle_surf = pygame.Surface((settings.WIDTH, settings.HEIGHT), pygame.SRCALPHA)
-            pygame.draw.circle(circle_surf, (80, 120, 255, alpha), center, radius, 2)
-            surface.blit(circle_surf, (0, 0))
+            with arena.borrow((settings.WIDTH, settings.HEIGHT), pygame.SRCALPHA) as circle_surf:
+                pygame.draw.circle(circle_surf, (80, 120, 255, alpha), center, radius, 2)
+                surface.blit(circle_surf, (0, 0))
 
         # Core column
         pygame.draw.rect(surface, (30, 40, 80), self.core_rect, border_radius=12)
         inner = self.core_rect.inflate(-10, -10)
-        pulse = self._pulse(speed=3.0)
         pygame.draw.rect(surface, (140, 190, 255), inner, 0, border_radius=10)
-        glow_alpha = int(80 + 70 * pulse)
-        glow_surf = pygame.Surface((inner.width, inner.height), pygame.SRCALPHA)
-        glow_surf.fill((180, 220, 255, glow_alpha))
-        surface.blit(glow_surf, inner.topleft, special_flags=pygame.BLEND_RGBA_ADD)
 
         ui.draw_centered_text(
             surface,
@@ -164,19 +71,34 @@ class CoreChamberScene(Scene):
             self.core_rect.y - 24,
         )
 
+    def _draw_core_glow(self, surface):
+        inner = self.core_rect.inflate(-10, -10)
+
+        def render(pulse):
+            glow_alpha = int(80 + 70 * pulse)
+            glow_surf = pygame.Surface((inner.width, inner.height), pygame.SRCALPHA)
+            glow_surf.fill((180, 220, 255, glow_alpha))
+            return glow_surf
+
+        glow_surf = self._pulse_frame(("core_glow", inner.size), 3.0, render)
+        surface.blit(glow_surf, inner.topleft, special_flags=pygame.BLEND_RGBA_ADD)
+
     def _draw_terminals(self, surface):
         # Reset terminal (left)
         reset_color = (220, 150, 150)
         preserve_color = (150, 220, 180)
 
         for rect, label, color, active, key_label in [
-            (self.reset_rect, "RESET TIMELINE", reset_color, self.reset_active, "[1]"),
-            (self.preserve_rect, "PRESERVE THIS BRANCH", preserve_color, self.preserve_active, "[2]"),
+            (self.reset_rect, "RESET TIMELINE", reset_color, self.chapter.reset_active, "[1]"),
+            (self.preserve_rect, "PRESERVE THIS BRANCH", preserve_color, self.chapter.preserve_active, "[2]"),
         ]:
-            pulse = self._pulse(speed=2.5)
-            base = pygame.Surface((rect.width + 20, rect.height + 20), pygame.SRCALPHA)
-            alpha = 40 + int(40 * pulse)
-            pygame.draw.rect(base, (color[0], color[1], color[2], alpha), base.get_rect(), border_radius=10)
+            def render(pulse, rect=rect, color=color):
+                base = pygame.Surface((rect.width + 20, rect.height + 20), pygame.SRCALPHA)
+                alpha = 40 + int(40 * pulse)
+                pygame.draw.rect(base, (color[0], color[1], color[2], alpha), base.get_rect(), border_radius=10)
+                return base
+
+            base = self._pulse_frame(("terminal", rect.size, color), 2.5, render)
             surface.blit(base, (rect.x - 10, rect.y - 10))
 
             pygame.draw.rect(surface, (25, 30, 45), rect, border_radius=8)
@@ -210,10 +132,10 @@ class CoreChamberScene(Scene):
             255,
         )
 
-        if not self.selected_ending:
+        if not self.chapter.selected_ending:
             text = "Objective: Approach the Core and decide the fate of all branches."
         else:
-            if self.selected_ending == "reset":
+            if self.chapter.selected_ending == "reset":
                 text = "You chose to RESET the timeline. The Core is obeying."
             else:
                 text = "You chose to PRESERVE this branch. The Core is stabilizing around it."
@@ -231,16 +153,18 @@ class CoreChamberScene(Scene):
     # Draw
     # -------------------------------------------------------------
     def draw(self, surface):
-        self._draw_core_background(surface)
+        self.background.draw(surface)
+        self._draw_core_glow(surface)
+        self.core_energy.draw(surface, self.time)
         self._draw_terminals(surface)
 
-        self.all_sprites.draw(surface)
+        self.draw_sprites(surface, self.all_sprites)
         self._draw_hud(surface)
 
         # Dialogues overlays
-        if self.intro_dialogue and self.intro_dialogue.active:
+        if self.intro_dialogue.active:
             self.intro_dialogue.draw(surface)
-        elif self.choice_intro_dialogue and self.choice_intro_dialogue.active:
+        elif self.choice_intro_dialogue.active:
             self.choice_intro_dialogue.draw(surface)
-        elif self.ending_dialogue and self.ending_dialogue.active:
+        elif self.ending_dialogue.active:
             self.ending_dialogue.draw(surface)
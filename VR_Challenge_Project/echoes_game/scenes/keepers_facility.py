@@ -1,133 +1,28 @@
 # scenes/keepers_facility.py
 import pygame
-import math
 
-from core.scene import Scene
+from core.scene import ChapterScene
 from core import ui
-from core.dialogue import DialogueBox
+from core.layers import StaticLayer
 from config import settings
-from entities.player import Player
-from story.dialogues import (
-    KEEPERS_INTRO_DIALOGUE,
-    KEEPERS_MEETING_DIALOGUE,
-    KEEPERS_SECRET_ECHO,
-)
+from sim.story import KeepersChapter
 
 
-class KeepersFacilityScene(Scene):
+class KeepersFacilityScene(ChapterScene):
+    chapter_class = KeepersChapter
+
     def __init__(self, game):
         super().__init__(game)
-        self.game = game
-        self.time = 0.0
-
-        # Player starts near bottom-center of the facility room
-        self.player = Player(settings.WIDTH // 2, settings.HEIGHT - 120)
-        self.all_sprites = pygame.sprite.Group(self.player)
-
-        # Meeting area (Commander Hale)
-        self.meeting_rect = pygame.Rect(
-            settings.WIDTH // 2 - 60,
-            settings.HEIGHT // 2 - 60,
-            120,
-            80,
-        )
-        self.meeting_active = False
-        self.meeting_done = False
-
-        # Secret echo terminal
-        self.secret_echo_rect = pygame.Rect(
-            120,
-            settings.HEIGHT // 2 - 30,
-            80,
-            60,
-        )
-        self.secret_echo_active = False
-        self.secret_echo_done = False
-
-        # Exit to Ascendant Spire (top center)
-        self.exit_rect = pygame.Rect(
-            settings.WIDTH // 2 - 40,
-            70,
-            80,
-            40,
-        )
-        self.exit_active = False
-
-        # Dialogues
-        self.intro_dialogue = DialogueBox(KEEPERS_INTRO_DIALOGUE)
-        self.meeting_dialogue = None
-        self.secret_echo_dialogue = None
-
-    # -------------------------------------------------------------
-    # Helpers
-    # -------------------------------------------------------------
-    def _pulse(self, speed=2.0, phase=0.0):
-        return 0.5 + 0.5 * math.sin(self.time * speed + phase)
-
-    # -------------------------------------------------------------
-    # Events
-    # -------------------------------------------------------------
-    def handle_events(self, events):
-        # Dialogues priority
-        if self.intro_dialogue and self.intro_dialogue.active:
-            for event in events:
-                self.intro_dialogue.handle_event(event)
-            return
-
-        if self.meeting_dialogue and self.meeting_dialogue.active:
-            for event in events:
-                self.meeting_dialogue.handle_event(event)
-            return
-
-        if self.secret_echo_dialogue and self.secret_echo_dialogue.active:
-            for event in events:
-                self.secret_echo_dialogue.handle_event(event)
-            return
-
-        for event in events:
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    from scenes.main_menu import MainMenu
-                    self.game.change_scene(MainMenu(self.game))
 
-                # Trigger meeting with Hale
-                if event.key == pygame.K_e and self.meeting_active and not self.meeting_done:
-                    self.meeting_dialogue = DialogueBox(KEEPERS_MEETING_DIALOGUE)
-                    self.meeting_done = True
+        # Meeting area, secret echo terminal and exit come from the chapter (same Rects)
+        self.meeting_rect = self.chapter.meeting_rect
+        self.secret_echo_rect = self.chapter.secret_echo_rect
+        self.exit_rect = self.chapter.exit_rect
 
-                # Trigger secret Memory Echo
-                if event.key == pygame.K_e and self.secret_echo_active and not self.secret_echo_done:
-                    self.secret_echo_dialogue = DialogueBox(KEEPERS_SECRET_ECHO)
-                    self.secret_echo_done = True
+        # Static background (baked once, blitted every frame)
+        self.background = StaticLayer(self._draw_facility_background)
 
-                # Travel to Ascendant Spire (after meeting Hale)
-                if event.key == pygame.K_f and self.exit_active and self.meeting_done:
-                    from scenes.ascendant_spire import AscendantSpireScene
-                    self.game.change_scene(AscendantSpireScene(self.game))
-
-    # -------------------------------------------------------------
-    # Update
-    # -------------------------------------------------------------
-    def update(self, dt):
-        self.time += dt
-        keys = pygame.key.get_pressed()
-
-        # Stop movement while any dialogue is active
-        if (self.intro_dialogue and self.intro_dialogue.active) or \
-           (self.meeting_dialogue and self.meeting_dialogue.active) or \
-           (self.secret_echo_dialogue and self.secret_echo_dialogue.active):
-            return
-
-        self.all_sprites.update(keys)
-
-        # Check meeting area
-        self.meeting_active = self.player.rect.colliderect(self.meeting_rect)
-
-        # Check secret echo terminal
-        self.secret_echo_active = self.player.rect.colliderect(self.secret_echo_rect)
-
-        # Check exit to spire (only meaningful after meeting Hale)
-        self.exit_active = self.player.rect.colliderect(self.exit_rect)
+        self.reset()
 
     # -------------------------------------------------------------
     # Drawing helpers
@@ -191,37 +86,30 @@ class KeepersFacilityScene(Scene):
         )
 
     def _draw_interaction_highlights(self, surface):
-        pulse = self._pulse(speed=3.0)
-
         # Meeting halo
-        if not self.meeting_done:
-            halo_surface = pygame.Surface((self.meeting_rect.width + 40, self.meeting_rect.height + 40), pygame.SRCALPHA)
-            pygame.draw.ellipse(
-                halo_surface,
-                (120, 220, 255, int(80 + 60 * pulse)),
-                halo_surface.get_rect(),
-            )
-            surface.blit(halo_surface, (self.meeting_rect.x - 20, self.meeting_rect.y - 20))
+        if not self.chapter.meeting_done:
+            self._draw_halo(surface, "meeting", self.meeting_rect, (120, 220, 255), 80, 60)
 
         # Secret console halo
-        if not self.secret_echo_done:
-            halo_surface = pygame.Surface((self.secret_echo_rect.width + 40, self.secret_echo_rect.height + 40), pygame.SRCALPHA)
-            pygame.draw.ellipse(
-                halo_surface,
-                (200, 140, 255, int(70 + 50 * pulse)),
-                halo_surface.get_rect(),
-            )
-            surface.blit(halo_surface, (self.secret_echo_rect.x - 20, self.secret_echo_rect.y - 20))
+        if not self.chapter.secret_echo_done:
+            self._draw_halo(surface, "secret", self.secret_echo_rect, (200, 140, 255), 70, 50)
 
         # Exit halo (actively pulsing only after meeting)
-        if self.meeting_done:
-            halo_surface = pygame.Surface((self.exit_rect.width + 40, self.exit_rect.height + 40), pygame.SRCALPHA)
+        if self.chapter.meeting_done:
+            self._draw_halo(surface, "exit", self.exit_rect, (180, 210, 255), 60, 50)
+
+    def _draw_halo(self, surface, name, rect, color, base_alpha, pulse_alpha):
+        def render(pulse):
+            halo_surface = pygame.Surface((rect.width + 40, rect.height + 40), pygame.SRCALPHA)
             pygame.draw.ellipse(
                 halo_surface,
-                (180, 210, 255, int(60 + 50 * pulse)),
+                (color[0], color[1], color[2], int(base_alpha + pulse_alpha * pulse)),
                 halo_surface.get_rect(),
             )
-            surface.blit(halo_surface, (self.exit_rect.x - 20, self.exit_rect.y - 20))
+            return halo_surface
+
+        halo_surface = self._pulse_frame(("halo", name, rect.size), 3.0, render)
+        surface.blit(halo_surface, (rect.x - 20, rect.y - 20))
 
     def _draw_hud(self, surface):
         ui.draw_text(surface, "Echoes of the Last Core // CH-04: KEEPERS FACILITY", 14, settings.COLOR_TEXT, 20, 10)
@@ -244,7 +132,7 @@ class KeepersFacilityScene(Scene):
             70,
         )
 
-        if self.meeting_active and not self.meeting_done:
+        if self.chapter.meeting_active and not self.chapter.meeting_done:
             ui.draw_text(
                 surface,
                 "Press [E] to talk to Commander Hale.",
@@ -254,7 +142,7 @@ class KeepersFacilityScene(Scene):
                 94,
             )
 
-        if self.secret_echo_active and not self.secret_echo_done:
+        if self.chapter.secret_echo_active and not self.chapter.secret_echo_done:
             ui.draw_text(
                 surface,
                 "Press [E] to access Lira's hidden Memory Console.",
@@ -264,7 +152,7 @@ class KeepersFacilityScene(Scene):
                 114,
             )
 
-        if self.exit_active and self.meeting_done:
+        if self.chapter.exit_active and self.chapter.meeting_done:
             ui.draw_text(
                 surface,
                 "Press [F] to travel to the Ascendant Spire.",
@@ -278,16 +166,16 @@ class KeepersFacilityScene(Scene):
     # Draw
     # -------------------------------------------------------------
     def draw(self, surface):
-        self._draw_facility_background(surface)
+        self.background.draw(surface)
         self._draw_interaction_highlights(surface)
 
-        self.all_sprites.draw(surface)
+        self.draw_sprites(surface, self.all_sprites)
         self._draw_hud(surface)
 
         # Dialogues
-        if self.intro_dialogue and self.intro_dialogue.active:
+        if self.intro_dialogue.active:
             self.intro_dialogue.draw(surface)
-        elif self.meeting_dialogue and self.meeting_dialogue.active:
+        elif self.meeting_dialogue.active:
             self.meeting_dialogue.draw(surface)
-        elif self.secret_echo_dialogue and self.secret_echo_dialogue.active:
+        elif self.secret_echo_dialogue.active:
             self.secret_echo_dialogue.draw(surface)
@@ -2,15 +2,36 @@
 import pygame
 import math
 from core.scene import Scene
-from core import ui
+from core import arena, ui
+from core.layers import StaticLayer
 from config import settings
 
 
 class MainMenu(Scene):
+    # Hologram panel frame per size (translucent, drawn over the pulse ring)
+    _panel_cache = {}
+
     def __init__(self, game):
         super().__init__(game)
         # Menu options (English)
         self.options = ["Start Game", "Quit"]
+
+        # Static grid (baked once); pulse ring + vignette stay animated
+        self.background = StaticLayer(self._draw_grid)
+
+        # Hologram panel
+        panel_width = settings.WIDTH - 220
+        panel_height = 340
+        self.panel_rect = pygame.Rect(
+            (settings.WIDTH - panel_width) // 2,
+            (settings.HEIGHT - panel_height) // 2,
+            panel_width,
+            panel_height,
+        )
+
+        self.reset()
+
+    def reset(self):
         self.selected = 0
 
         # Animation timer
@@ -33,25 +54,20 @@ class MainMenu(Scene):
                 # Confirm selection
                 elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
                     if self.selected == 0:
-                        from scenes.lab_scene import LabScene
-                        self.game.change_scene(LabScene(self.game))
+                        self.game.enter("LabScene")
                     else:
                         self.game.running = False
 
     def update(self, dt):
         self.time += dt
 
-    # -------------------------------------------------------------
-    # Helpers
-    # -------------------------------------------------------------
-    def _pulse(self, speed=2.0, phase=0.0):
-        """Returns value between 0 and 1 based on time (for pulsing effects)."""
-        return 0.5 + 0.5 * math.sin(self.time * speed + phase)
+        # Menu -> Lab is the only way forward; build it while the menu is up
+        self.game.preload("LabScene")
 
     # -------------------------------------------------------------
     # Sci-Fi background
     # -------------------------------------------------------------
-    def _draw_background(self, surface):
+    def _draw_grid(self, surface):
         # Dark base background
         surface.fill((5, 10, 20))
 
@@ -65,46 +81,50 @@ class MainMenu(Scene):
         for y in range(0, settings.HEIGHT, spacing):
             pygame.draw.line(surface, grid_color, (0, y), (settings.WIDTH, y), 1)
 
+    def _draw_background(self, surface):
+        self.background.draw(surface)
+
         # Pulsing circle in the center
         center_x = settings.WIDTH // 2
         center_y = settings.HEIGHT // 2
 
         pulse_radius = 140 + int(12 * math.sin(self.time * 2))
 
-        pulse_surface = pygame.Surface((settings.WIDTH, settings.HEIGHT), pygame.SRCALPHA)
-        pygame.draw.circle(
-            pulse_surface,
-            (
-                settings.COLOR_HIGHLIGHT[0],
-                settings.COLOR_HIGHLIGHT[1],
-                settings.COLOR_HIGHLIGHT[2],
-                26,  # alpha
-            ),
-            (center_x, center_y),
-            pulse_radius,
-            width=2,
-        )
-        surface.blit(pulse_surface, (0, 0))
+        with arena.borrow((settings.WIDTH, settings.HEIGHT), pygame.SRCALPHA) as pulse_surface:
+            pygame.draw.circle(
+                pulse_surface,
+                (
+                    settings.COLOR_HIGHLIGHT[0],
+                    settings.COLOR_HIGHLIGHT[1],
+                    settings.COLOR_HIGHLIGHT[2],
+                    26,  # alpha
+                ),
+                (center_x, center_y),
+                pulse_radius,
+                width=2,
+            )
+            surface.blit(pulse_surface, (0, 0))
 
         # Soft vignette
-        vignette = pygame.Surface((settings.WIDTH, settings.HEIGHT), pygame.SRCALPHA)
-        pygame.draw.rect(
-            vignette,
-            (0, 0, 0, 160),
-            (0, 0, settings.WIDTH, settings.HEIGHT),
-        )
-        vignette.set_alpha(90)
-        surface.blit(vignette, (0, 0), special_flags=pygame.BLEND_RGBA_SUB)
+        with arena.borrow((settings.WIDTH, settings.HEIGHT), pygame.SRCALPHA) as vignette:
+            pygame.draw.rect(
+                vignette,
+                (0, 0, 0, 160),
+                (0, 0, settings.WIDTH, settings.HEIGHT),
+            )
+            vignette.set_alpha(90)
+            surface.blit(vignette, (0, 0), special_flags=pygame.BLEND_RGBA_SUB)
 
     # -------------------------------------------------------------
     # Hologram menu panel
     # -------------------------------------------------------------
-    def _draw_panel(self, surface):
-        panel_width = settings.WIDTH - 220
-        panel_height = 340
-        panel_x = (settings.WIDTH - panel_width) // 2
-        panel_y = (settings.HEIGHT - panel_height) // 2
+    def _panel(self):
+        """The static panel frame, drawn once and converted to the display format."""
+        panel = MainMenu._panel_cache.get(self.panel_rect.size)
+        if panel is not None:
+            return panel
 
+        panel_width, panel_height = self.panel_rect.size
         panel = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
 
         # Transparent background
@@ -159,8 +179,14 @@ class MainMenu(Scene):
             3,
         )
 
-        surface.blit(panel, (panel_x, panel_y))
-        return panel_x, panel_y, panel_width, panel_height
+        if pygame.display.get_surface() is not None:
+            panel = panel.convert_alpha()
+        MainMenu._panel_cache[self.panel_rect.size] = panel
+        return panel
+
+    def _draw_panel(self, surface):
+        surface.blit(self._panel(), self.panel_rect.topleft)
+        return self.panel_rect
 
     # -------------------------------------------------------------
     # Small corner labels (professional feel)
@@ -220,18 +246,22 @@ class MainMenu(Scene):
         )
 
         # Glow behind title
-        glow_surface = pygame.Surface((panel_w, 80), pygame.SRCALPHA)
-        glow_alpha = int(80 + 60 * pulse_value)
-        pygame.draw.ellipse(
-            glow_surface,
-            (
-                settings.COLOR_HIGHLIGHT[0],
-                settings.COLOR_HIGHLIGHT[1],
-                settings.COLOR_HIGHLIGHT[2],
-                glow_alpha,
-            ),
-            (40, 10, panel_w - 80, 60),
-        )
+        def render(pulse):
+            glow_surface = pygame.Surface((panel_w, 80), pygame.SRCALPHA)
+            glow_alpha = int(80 + 60 * pulse)
+            pygame.draw.ellipse(
+                glow_surface,
+                (
+                    settings.COLOR_HIGHLIGHT[0],
+                    settings.COLOR_HIGHLIGHT[1],
+                    settings.COLOR_HIGHLIGHT[2],
+                    glow_alpha,
+                ),
+                (40, 10, panel_w - 80, 60),
+            )
+            return glow_surface
+
+        glow_surface = self._pulse_frame(("title_glow", panel_w), 2.2, render)
         surface.blit(glow_surface, (panel_x, panel_y + 10))
 
         # Game title
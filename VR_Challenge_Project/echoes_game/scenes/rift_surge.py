@@ -0,0 +1,19 @@
+# scenes/rift_surge.py
+from scenes.rift_zone import RiftZoneScene
+from sim.story import RiftSurgeChapter
+
+
+class RiftSurgeScene(RiftZoneScene):
+    """
+    Stress-test variant of the Rift Zone: thousands of corrupted echoes stored
+    in an EnemySwarm (NumPy arrays) instead of one Sprite per enemy.
+    """
+
+    chapter_class = RiftSurgeChapter
+
+    def __init__(self, game):
+        super().__init__(game)
+        self.swarm = self.chapter.world.swarm
+
+    def _draw_enemies(self, surface):
+        self.swarm.draw(surface)
@@ -1,171 +1,30 @@
 # scenes/ruined_archive.py
 import pygame
-import math
 
-from core.scene import Scene
-from core import ui
-from core.dialogue import DialogueBox
+from core.scene import ChapterScene
+from core import arena, ui
+from core.layers import StaticLayer
 from config import settings
-from entities.player import Player
-from entities.enemy import Enemy
-from story.dialogues import (
-    ARCHIVE_INTRO_DIALOGUE,
-    ARCHIVE_LOG_ECHO_1,
-    ARCHIVE_HIDDEN_ECHO,
-)
+from sim.story import ArchiveChapter
 
 
-class RuinedArchiveScene(Scene):
+class RuinedArchiveScene(ChapterScene):
     """CH-07: Digital graveyard of failed branches."""
 
+    chapter_class = ArchiveChapter
+
     def __init__(self, game):
         super().__init__(game)
-        self.game = game
-        self.time = 0.0
-
-        self.player = Player(settings.WIDTH // 2, settings.HEIGHT - 120)
-        self.all_sprites = pygame.sprite.Group(self.player)
-
-        # A few weak glitch enemies
-        self.enemies = pygame.sprite.Group()
-        self._spawn_enemies()
-
-        # Echo zones
-        self.log_echo_rect = pygame.Rect(
-            settings.WIDTH // 2 - 60,
-            settings.HEIGHT // 2 + 30,
-            120,
-            40,
-        )
-        self.hidden_echo_rect = pygame.Rect(
-            140,
-            settings.HEIGHT // 2 - 40,
-            100,
-            40,
-        )
-
-        self.log_echo_active = False
-        self.hidden_echo_active = False
-        self.log_echo_done = False
-        self.hidden_echo_done = False
-
-        # Dialogues
-        self.intro_dialogue = DialogueBox(ARCHIVE_INTRO_DIALOGUE)
-        self.log_echo_dialogue = None
-        self.hidden_echo_dialogue = None
-
-        # Gate to next chapter (Mirror Walk)
-        self.exit_rect = pygame.Rect(
-            settings.WIDTH // 2 - 40,
-            60,
-            80,
-            40,
-        )
-        self.exit_active = False
-
-        self.player_dead = False
-
-    # ---------------- Helpers ----------------
-    def _pulse(self, speed=2.0, phase=0.0):
-        return 0.5 + 0.5 * math.sin(self.time * speed + phase)
-
-    def _spawn_enemies(self):
-        y = settings.HEIGHT // 2 + 80
-        e1 = Enemy(settings.WIDTH // 2 - 150, y, patrol_width=120, speed=1, max_health=40)
-        e2 = Enemy(settings.WIDTH // 2 + 140, y, patrol_width=120, speed=1, max_health=40)
-        self.enemies.add(e1, e2)
-
-    # ---------------- Events ----------------
-    def handle_events(self, events):
-        if self.player_dead:
-            for event in events:
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_r:
-                        from scenes.ruined_archive import RuinedArchiveScene
-                        self.game.change_scene(RuinedArchiveScene(self.game))
-                    elif event.key == pygame.K_ESCAPE:
-                        from scenes.main_menu import MainMenu
-                        self.game.change_scene(MainMenu(self.game))
-            return
-
-        # Dialogues priority
-        if self.intro_dialogue and self.intro_dialogue.active:
-            for event in events:
-                self.intro_dialogue.handle_event(event)
-            return
 
-        if self.log_echo_dialogue and self.log_echo_dialogue.active:
-            for event in events:
-                self.log_echo_dialogue.handle_event(event)
-            return
+        # Trigger zones come from the chapter (same Rects)
+        self.log_echo_rect = self.chapter.log_echo_rect
+        self.hidden_echo_rect = self.chapter.hidden_echo_rect
+        self.exit_rect = self.chapter.exit_rect
 
-        if self.hidden_echo_dialogue and self.hidden_echo_dialogue.active:
-            for event in events:
-                self.hidden_echo_dialogue.handle_event(event)
-            return
+        # Static background (baked once, blitted every frame)
+        self.background = StaticLayer(self._draw_background)
 
-        for event in events:
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    from scenes.main_menu import MainMenu
-                    self.game.change_scene(MainMenu(self.game))
-
-                # Travel to Mirror Walk
-                if event.key == pygame.K_f and self.exit_active:
-                    from scenes.mirror_walk import MirrorWalkScene
-                    self.game.change_scene(MirrorWalkScene(self.game))
-
-                # Trigger log echo
-                if event.key == pygame.K_e and self.log_echo_active and not self.log_echo_done:
-                    self.log_echo_done = True
-                    self.log_echo_dialogue = DialogueBox(ARCHIVE_LOG_ECHO_1)
-
-                # Trigger hidden echo
-                if event.key == pygame.K_e and self.hidden_echo_active and not self.hidden_echo_done:
-                    self.hidden_echo_done = True
-                    self.hidden_echo_dialogue = DialogueBox(ARCHIVE_HIDDEN_ECHO)
-
-    # ---------------- Update ----------------
-    def update(self, dt):
-        self.time += dt
-        keys = pygame.key.get_pressed()
-
-        if self.player_dead:
-            return
-
-        if (self.intro_dialogue and self.intro_dialogue.active) or \
-           (self.log_echo_dialogue and self.log_echo_dialogue.active) or \
-           (self.hidden_echo_dialogue and self.hidden_echo_dialogue.active):
-            return
-
-        self.all_sprites.update(keys)
-        self.enemies.update()
-
-        # Enemy contact damage (no damage during dash)
-        if self.player.is_alive():
-            hits = pygame.sprite.spritecollide(self.player, self.enemies, False)
-            if hits and not self.player.is_dashing:
-                self.player.take_damage(10)
-
-        # Player attack vs enemies
-        if self.player.is_attacking() and self.player.can_hit_this_swing():
-            attack_rect = self.player.get_attack_rect()
-            if attack_rect:
-                for enemy in list(self.enemies):
-                    if enemy.rect.colliderect(attack_rect):
-                        enemy.take_damage(self.player.attack_damage)
-                        self.player.register_attack_hit()
-                        break
-
-        if not self.player.is_alive():
-            self.player_dead = True
-
-        # Echo zones
-        self.log_echo_active = (not self.log_echo_done) and self.player.rect.colliderect(self.log_echo_rect)
-        self.hidden_echo_active = (not self.hidden_echo_done) and self.player.rect.colliderect(self.hidden_echo_rect)
-
-        # Exit
-        self.exit_active = self.player.rect.colliderect(self.exit_rect)
+        self.reset()
 
     # ---------------- Drawing helpers ----------------
     def _draw_background(self, surface):
@@ -191,7 +50,6 @@ class RuinedArchiveScene(Scene):
             pygame.draw.line(surface, (25, 28, 50), (floor_rect.x, y), (floor_rect.right, y), 1)
 
         # Exit portal
-        pulse = self._pulse(speed=3.0)
         gate_rect = self.exit_rect.inflate(40, 20)
         pygame.draw.rect(surface, (20, 15, 50), gate_rect, border_radius=10)
         pygame.draw.rect(surface, (140, 180, 255), gate_rect, 2, border_radius=10)
@@ -211,23 +69,26 @@ class RuinedArchiveScene(Scene):
         else:
             base_alpha = 80
 
-        pulse = self._pulse(speed=3.0)
-        extra = int(4 * pulse)
+        def render(pulse):
+            extra = int(4 * pulse)
 
-        glow = pygame.Surface((rect.width + 40, rect.height + 40), pygame.SRCALPHA)
-        pygame.draw.rect(
-            glow,
-            (settings.COLOR_ECHO[0], settings.COLOR_ECHO[1], settings.COLOR_ECHO[2], base_alpha),
-            glow.get_rect(),
-            border_radius=10,
-        )
-        pygame.draw.rect(
-            glow,
-            (settings.COLOR_ECHO[0], settings.COLOR_ECHO[1], settings.COLOR_ECHO[2], 160),
-            pygame.Rect(10 - extra, 10 - extra, rect.width + extra * 2, rect.height + extra * 2),
-            2,
-            border_radius=10,
-        )
+            glow = pygame.Surface((rect.width + 40, rect.height + 40), pygame.SRCALPHA)
+            pygame.draw.rect(
+                glow,
+                (settings.COLOR_ECHO[0], settings.COLOR_ECHO[1], settings.COLOR_ECHO[2], base_alpha),
+                glow.get_rect(),
+                border_radius=10,
+            )
+            pygame.draw.rect(
+                glow,
+                (settings.COLOR_ECHO[0], settings.COLOR_ECHO[1], settings.COLOR_ECHO[2], 160),
+                pygame.Rect(10 - extra, 10 - extra, rect.width + extra * 2, rect.height + extra * 2),
+                2,
+                border_radius=10,
+            )
+            return glow
+
+        glow = self._pulse_frame(("echo_zone", rect.size, base_alpha), 3.0, render)
         surface.blit(glow, (rect.x - 20, rect.y - 20))
 
         pygame.draw.rect(surface, settings.COLOR_ECHO, rect, 2, border_radius=8)
@@ -252,19 +113,20 @@ class RuinedArchiveScene(Scene):
         if ratio > 0:
             fg = pygame.Rect(x, y, int(w * ratio), h)
             pygame.draw.rect(surface, (200, 80, 80), fg, border_radius=6)
-            glow = pygame.Surface((fg.width, h), pygame.SRCALPHA)
-            pygame.draw.rect(glow, (255, 120, 120, 90), (0, 0, fg.width, h), border_radius=6)
-            surface.blit(glow, (x, y))
+            # Full bar width so every health value reuses the same scratch surface
+            with arena.borrow((w, h), pygame.SRCALPHA) as glow:
+                pygame.draw.rect(glow, (255, 120, 120, 90), (0, 0, fg.width, h), border_radius=6)
+                surface.blit(glow, (x, y), (0, 0, fg.width, h))
 
         pygame.draw.rect(surface, (120, 40, 40), bg, 2, border_radius=6)
         ui.draw_text(surface, "HP", 12, settings.COLOR_TEXT, x - 28, y - 2)
 
     def _draw_death_overlay(self, surface):
-        if not self.player_dead:
+        if not self.chapter.player_dead:
             return
-        overlay = pygame.Surface((settings.WIDTH, settings.HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 170))
-        surface.blit(overlay, (0, 0))
+        with arena.borrow((settings.WIDTH, settings.HEIGHT), pygame.SRCALPHA) as overlay:
+            overlay.fill((0, 0, 0, 170))
+            surface.blit(overlay, (0, 0))
 
         ui.draw_centered_text(
             surface,
@@ -299,7 +161,7 @@ class RuinedArchiveScene(Scene):
             70,
         )
 
-        if self.exit_active:
+        if self.chapter.exit_active:
             ui.draw_text(
                 surface,
                 "Press [F] to travel to the Mirror Walk.",
@@ -311,34 +173,34 @@ class RuinedArchiveScene(Scene):
 
     # ---------------- Draw ----------------
     def draw(self, surface):
-        self._draw_background(surface)
+        self.background.draw(surface)
 
         # Echo zones
         self._draw_echo_zone_rect(
             surface,
             self.log_echo_rect,
             "ARCHIVE LOG",
-            self.log_echo_active,
-            self.log_echo_done,
+            self.chapter.log_echo_active,
+            self.chapter.log_echo_done,
         )
         self._draw_echo_zone_rect(
             surface,
             self.hidden_echo_rect,
             "HIDDEN SIGNAL",
-            self.hidden_echo_active,
-            self.hidden_echo_done,
+            self.chapter.hidden_echo_active,
+            self.chapter.hidden_echo_done,
         )
 
-        self.all_sprites.draw(surface)
-        self.enemies.draw(surface)
+        self.draw_sprites(surface, self.all_sprites)
+        self.draw_sprites(surface, self.enemies)
 
         self._draw_hud(surface)
         self._draw_health_bar(surface)
         self._draw_death_overlay(surface)
 
-        if self.intro_dialogue and self.intro_dialogue.active:
+        if self.intro_dialogue.active:
             self.intro_dialogue.draw(surface)
-        elif self.log_echo_dialogue and self.log_echo_dialogue.active:
+        elif self.log_echo_dialogue.active:
             self.log_echo_dialogue.draw(surface)
-        elif self.hidden_echo_dialogue and self.hidden_echo_dialogue.active:
+        elif self.hidden_echo_dialogue.active:
             self.hidden_echo_dialogue.draw(surface)
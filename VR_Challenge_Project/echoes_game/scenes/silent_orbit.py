@@ -1,116 +1,63 @@
 # scenes/silent_orbit.py
 import pygame
-import math
 
-from core.scene import Scene
+from core.scene import ChapterScene
 from core import ui
-from core.dialogue import DialogueBox
+from core.dirty import DirtyTracker
+from core.layers import StaticLayer
 from config import settings
-from entities.player import Player
-from story.dialogues import (
-    ORBIT_INTRO_DIALOGUE,
-    ORBIT_REVELATION_ECHO,
-    ORBIT_LIRA_CONFRONT_DIALOGUE,
-)
+from sim.story import OrbitChapter
 
 
-class SilentOrbitScene(Scene):
+class SilentOrbitScene(ChapterScene):
     """CH-09: Quiet orbital facility – story-heavy, no enemies."""
 
+    chapter_class = OrbitChapter
+
     def __init__(self, game):
         super().__init__(game)
-        self.game = game
-        self.time = 0.0
-
-        self.player = Player(settings.WIDTH // 2, settings.HEIGHT - 120)
-        self.all_sprites = pygame.sprite.Group(self.player)
-
-        # Echo zones
-        self.revelation_rect = pygame.Rect(
-            settings.WIDTH // 2 - 80,
-            settings.HEIGHT // 2,
-            160,
-            40,
-        )
-        self.revelation_active = False
-        self.revelation_done = False
-
-        self.confront_rect = pygame.Rect(
-            settings.WIDTH // 2 - 80,
-            settings.HEIGHT // 2 - 80,
-            160,
-            40,
-        )
-        self.confront_active = False
-        self.confront_done = False
-
-        # Dialogues
-        self.intro_dialogue = DialogueBox(ORBIT_INTRO_DIALOGUE)
-        self.revelation_dialogue = None
-        self.confront_dialogue = None
-
-        # Exit to Origin Core (فصل 10)
-        self.exit_rect = pygame.Rect(
-            settings.WIDTH // 2 - 40,
-            60,
-            80,
-            30,
-        )
-        self.exit_active = False
-
-    def _pulse(self, speed=2.0, phase=0.0):
-        return 0.5 + 0.5 * math.sin(self.time * speed + phase)
-
-    # ---------------- Events ----------------
-    def handle_events(self, events):
-        if self.intro_dialogue and self.intro_dialogue.active:
-            for event in events:
-                self.intro_dialogue.handle_event(event)
-            return
-
-        if self.revelation_dialogue and self.revelation_dialogue.active:
-            for event in events:
-                self.revelation_dialogue.handle_event(event)
-            return
-
-        if self.confront_dialogue and self.confront_dialogue.active:
-            for event in events:
-                self.confront_dialogue.handle_event(event)
-            return
-
-        for event in events:
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    from scenes.main_menu import MainMenu
-                    self.game.change_scene(MainMenu(self.game))
-
-                if event.key == pygame.K_e and self.revelation_active and not self.revelation_done:
-                    self.revelation_done = True
-                    self.revelation_dialogue = DialogueBox(ORBIT_REVELATION_ECHO)
-
-                if event.key == pygame.K_e and self.confront_active and not self.confront_done:
-                    self.confront_done = True
-                    self.confront_dialogue = DialogueBox(ORBIT_LIRA_CONFRONT_DIALOGUE)
-
-                if event.key == pygame.K_f and self.exit_active:
-                    from scenes.origin_core import OriginCoreScene
-                    self.game.change_scene(OriginCoreScene(self.game))
-
-    # ---------------- Update ----------------
-    def update(self, dt):
-        self.time += dt
-        keys = pygame.key.get_pressed()
-
-        if (self.intro_dialogue and self.intro_dialogue.active) or \
-           (self.revelation_dialogue and self.revelation_dialogue.active) or \
-           (self.confront_dialogue and self.confront_dialogue.active):
-            return
-
-        self.all_sprites.update(keys)
-
-        self.revelation_active = (not self.revelation_done) and self.player.rect.colliderect(self.revelation_rect)
-        self.confront_active = (not self.confront_done) and self.player.rect.colliderect(self.confront_rect)
-        self.exit_active = self.revelation_done and self.confront_done and self.player.rect.colliderect(self.exit_rect)
+
+        # Echo zones and the exit to Origin Core come from the chapter (same Rects)
+        self.revelation_rect = self.chapter.revelation_rect
+        self.confront_rect = self.chapter.confront_rect
+        self.exit_rect = self.chapter.exit_rect
+
+        # Static background (baked once, blitted every frame)
+        self.background = StaticLayer(self._draw_background)
+
+        # HUD lines that change every frame (pulsing objective, exit hint): drawn
+        # inside these strips, which dirty_rects() reports as-is
+        self.objective_line = pygame.Rect(0, 66, settings.WIDTH, 24)
+        self.exit_hint_line = pygame.Rect(0, self.objective_line.bottom - 2, settings.WIDTH, 24)
+
+        # Dirty-rect tracking (settings.DIRTY_RECTS)
+        self.dirty = DirtyTracker()
+
+        self.reset()
+
+    def reset(self):
+        super().reset()
+        self.dirty.reset()
+
+    def _active_dialogue(self):
+        for dialogue in (self.intro_dialogue, self.revelation_dialogue, self.confront_dialogue):
+            if dialogue.active:
+                return dialogue
+        return None
+
+    def dirty_rects(self):
+        # Echo glows (+ labels / hints), objective + exit hint lines, player, dialogue panel
+        rects = [
+            self.revelation_rect.inflate(60, 40),
+            self.confront_rect.inflate(60, 40),
+            self.objective_line,
+            self.exit_hint_line,
+        ]
+        rects += self.sprite_rects(self.all_sprites)
+        dialogue = self._active_dialogue()
+        if dialogue:
+            rects.append(dialogue.rect)
+        return self.dirty.collect(rects)
 
     # ---------------- Drawing helpers ----------------
     def _draw_background(self, surface):
@@ -153,23 +100,26 @@ class SilentOrbitScene(Scene):
         else:
             alpha = 80
 
-        pulse = self._pulse(3.0)
-        extra = int(3 * pulse)
+        def render(pulse):
+            extra = int(3 * pulse)
 
-        glow = pygame.Surface((rect.width + 30, rect.height + 30), pygame.SRCALPHA)
-        pygame.draw.rect(
-            glow,
-            (settings.COLOR_ECHO[0], settings.COLOR_ECHO[1], settings.COLOR_ECHO[2], alpha),
-            glow.get_rect(),
-            border_radius=10,
-        )
-        pygame.draw.rect(
-            glow,
-            (settings.COLOR_ECHO[0], settings.COLOR_ECHO[1], settings.COLOR_ECHO[2], 160),
-            pygame.Rect(8 - extra, 8 - extra, rect.width + extra * 2, rect.height + extra * 2),
-            2,
-            border_radius=10,
-        )
+            glow = pygame.Surface((rect.width + 30, rect.height + 30), pygame.SRCALPHA)
+            pygame.draw.rect(
+                glow,
+                (settings.COLOR_ECHO[0], settings.COLOR_ECHO[1], settings.COLOR_ECHO[2], alpha),
+                glow.get_rect(),
+                border_radius=10,
+            )
+            pygame.draw.rect(
+                glow,
+                (settings.COLOR_ECHO[0], settings.COLOR_ECHO[1], settings.COLOR_ECHO[2], 160),
+                pygame.Rect(8 - extra, 8 - extra, rect.width + extra * 2, rect.height + extra * 2),
+                2,
+                border_radius=10,
+            )
+            return glow
+
+        glow = self._pulse_frame(("echo_area", rect.size, alpha), 3.0, render)
         surface.blit(glow, (rect.x - 15, rect.y - 15))
 
         pygame.draw.rect(surface, settings.COLOR_ECHO, rect, 2, border_radius=8)
@@ -197,44 +147,44 @@ class SilentOrbitScene(Scene):
             14,
             color,
             20,
-            70,
+            self.objective_line.y + 4,
         )
 
-        if self.exit_active:
+        if self.chapter.exit_active:
             ui.draw_text(
                 surface,
                 "Press [F] to travel to the Origin Core.",
                 13,
                 (210, 230, 255),
                 20,
-                92,
+                self.exit_hint_line.y + 4,
             )
 
     # ---------------- Draw ----------------
     def draw(self, surface):
-        self._draw_background(surface)
+        self.background.draw(surface)
 
         self._draw_echo_area(
             surface,
             self.revelation_rect,
             "REVELATION LOG",
-            self.revelation_active,
-            self.revelation_done,
+            self.chapter.revelation_active,
+            self.chapter.revelation_done,
         )
         self._draw_echo_area(
             surface,
             self.confront_rect,
             "LIRA CONFRONT",
-            self.confront_active,
-            self.confront_done,
+            self.chapter.confront_active,
+            self.chapter.confront_done,
         )
 
-        self.all_sprites.draw(surface)
+        self.draw_sprites(surface, self.all_sprites)
         self._draw_hud(surface)
 
-        if self.intro_dialogue and self.intro_dialogue.active:
+        if self.intro_dialogue.active:
             self.intro_dialogue.draw(surface)
-        elif self.revelation_dialogue and self.revelation_dialogue.active:
+        elif self.revelation_dialogue.active:
             self.revelation_dialogue.draw(surface)
-        elif self.confront_dialogue and self.confront_dialogue.active:
+        elif self.confront_dialogue.active:
             self.confront_dialogue.draw(surface)
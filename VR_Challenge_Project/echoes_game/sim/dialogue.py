@@ -0,0 +1,93 @@
+# sim/dialogue.py
+import pygame
+from config import settings
+from core import clock as game_clock
+
+
+def spoken_text(line):
+    """
+    The line as word wrap keeps it: words joined by single spaces. The
+    typewriter counts these characters; wrapping then only ever drops the
+    separator at each row break (core.dialogue maps the count onto rows).
+    """
+    return " ".join(word for word in line.split(" ") if word)
+
+
+class DialogueState:
+    """
+    Dialogue progress without fonts: current line, typewriter timing and the
+    Space / Enter handling. core.dialogue.DialogueBox lays it out and draws it.
+    """
+
+    __slots__ = ("lines", "index", "active", "on_finish", "chars_per_sec", "clock",
+                 "_line_start_ms", "_line_chars", "_skip")
+
+    def __init__(self, lines, on_finish=None, chars_per_sec=None, clock=None):
+        self.lines = lines
+        self.on_finish = on_finish
+        if chars_per_sec is None:
+            chars_per_sec = settings.DIALOGUE_CHARS_PER_SEC
+        self.chars_per_sec = chars_per_sec
+        self.clock = clock or game_clock.REAL
+        self.reset()
+
+    def reset(self):
+        """Start over from the first line."""
+        self.index = 0
+        self.active = True
+        self._begin_line()
+
+    def start(self):
+        """Show it from the first line (dialogues a trigger opens start out stopped)."""
+        self.reset()
+
+    def stop(self):
+        """Hide it without finishing (on_finish is not called)."""
+        self.active = False
+
+    def set_lines(self, lines):
+        """Replace the text and start over from the first line."""
+        self.lines = lines
+        self.reset()
+
+    def handle_event(self, event):
+        if not self.active:
+            return
+        if event.type == pygame.KEYDOWN:
+            if event.key in (pygame.K_SPACE, pygame.K_RETURN):
+                # First press completes a line that is still typing
+                if not self.line_complete():
+                    self._skip = True
+                    return
+                self.index += 1
+                if self.index >= len(self.lines):
+                    self.active = False
+                    if self.on_finish:
+                        self.on_finish()
+                else:
+                    self._begin_line()
+
+    # ------------- Typewriter -------------
+    def _begin_line(self):
+        """
+        The current line starts typing now, in game time – not on its first draw,
+        so the typewriter depends on ticks only (replays stay in sync).
+        """
+        self._skip = False
+        self._line_start_ms = self.clock.ticks()
+        self._line_chars = len(spoken_text(self.lines[self.index])) if self.index < len(self.lines) else 0
+
+    def revealed(self):
+        """How many characters of the current line should be visible now."""
+        if self._skip or self.chars_per_sec <= 0:
+            return self._line_chars
+        elapsed = self.clock.ticks() - self._line_start_ms
+        return min(self._line_chars, int(elapsed * self.chars_per_sec / 1000))
+
+    @property
+    def line_started(self):
+        """Game time (ms) the current line started typing."""
+        return self._line_start_ms
+
+    def line_complete(self):
+        return self.revealed() >= self._line_chars
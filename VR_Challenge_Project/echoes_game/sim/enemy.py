@@ -0,0 +1,75 @@
+# sim/enemy.py
+import pygame
+from config import settings
+from core import clock as game_clock
+
+
+class EnemyState:
+    """
+    Patrolling enemy rules: patrol, health and the hit timestamp.
+    entities.enemy.Enemy is the sprite that renders it.
+    """
+
+    __slots__ = (
+        "clock", "width", "height", "rect",
+        "speed", "patrol_width", "start_x", "start_y", "direction",
+        "max_health", "health", "last_hit_time", "hit_flash_duration_ms",
+    )
+
+    def __init__(self, x, y, patrol_width=160, speed=2, max_health=60, clock=None):
+        self.clock = clock or game_clock.REAL
+
+        self.width = 32
+        self.height = 48
+
+        self.speed = speed
+        self.patrol_width = patrol_width
+        self.start_x = x
+        self.start_y = y
+
+        self.max_health = max_health
+        self.hit_flash_duration_ms = 120
+
+        self.rect = pygame.Rect(0, 0, self.width, self.height)
+        self.reset()
+
+    def reset(self):
+        """Back to the spawn point with full health (scene restart)."""
+        self.rect.size = (self.width, self.height)
+        self.rect.center = (self.start_x, self.start_y)
+        self.direction = 1  # 1 → right, -1 → left
+
+        # Health
+        self.health = self.max_health
+
+        # Hit feedback
+        self.last_hit_time = -9999
+
+    # ------------- Health -------------
+    def is_alive(self) -> bool:
+        return self.health > 0
+
+    def take_damage(self, amount: int):
+        if amount <= 0:
+            return
+        self.health = max(0, self.health - amount)
+        self.last_hit_time = self.clock.ticks()
+
+    def flashing(self) -> bool:
+        """Still inside the hit-flash window?"""
+        return self.clock.ticks() - self.last_hit_time <= self.hit_flash_duration_ms
+
+    # ------------- Update -------------
+    def update(self):
+        # Patrol horizontally around start_x
+        self.rect.x += self.speed * self.direction
+
+        if self.rect.x < self.start_x - self.patrol_width // 2:
+            self.rect.x = self.start_x - self.patrol_width // 2
+            self.direction = 1
+        elif self.rect.x > self.start_x + self.patrol_width // 2:
+            self.rect.x = self.start_x + self.patrol_width // 2
+            self.direction = -1
+
+        # Keep inside screen vertically just in case
+        self.rect.clamp_ip(pygame.Rect(0, 0, settings.WIDTH, settings.HEIGHT))
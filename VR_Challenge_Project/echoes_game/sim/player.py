@@ -0,0 +1,238 @@
+# sim/player.py
+import pygame
+from config import settings
+from core import clock as game_clock
+
+
+class PlayerState:
+    """
+    Player rules without any drawing: movement, dash, melee and health.
+    entities.player.Player is the sprite that renders it.
+    """
+
+    __slots__ = (
+        "clock", "width", "height", "rect",
+        "base_speed", "speed", "facing",
+        "dash_speed_multiplier", "dash_duration_ms", "dash_cooldown_ms",
+        "is_dashing", "dash_start_time", "last_dash_time",
+        "max_health", "hit_cooldown_ms", "health", "last_hit_time",
+        "attack_damage", "attack_range", "attack_width", "attack_duration_ms", "attack_cooldown_ms",
+        "attacking", "last_attack_time", "attack_start_time", "_attack_already_hit",
+    )
+
+    def __init__(self, x, y, clock=None):
+        # Game time for cooldowns / invincibility (core.clock)
+        self.clock = clock or game_clock.REAL
+
+        # Size
+        self.width = 40
+        self.height = 64
+
+        # Movement
+        self.base_speed = 4
+
+        # Dash system
+        self.dash_speed_multiplier = 2.4
+        self.dash_duration_ms = 220
+        self.dash_cooldown_ms = 600
+
+        # Health system
+        self.max_health = 100
+        self.hit_cooldown_ms = 800  # ms between hits
+
+        # Attack system (melee)
+        self.attack_damage = 25
+        self.attack_range = 32       # المسافة قدام اللاعب
+        self.attack_width = 26       # عرض الضربة
+        self.attack_duration_ms = 180
+        self.attack_cooldown_ms = 260
+
+        self.rect = pygame.Rect(0, 0, self.width, self.height)
+        self.reset(x, y)
+
+    def reset(self, x, y):
+        """Back to a fresh spawn at (x, y)."""
+        self.rect.size = (self.width, self.height)
+        self.rect.center = (x, y)
+
+        self.speed = self.base_speed
+        self.facing = "down"
+
+        self.is_dashing = False
+        self.dash_start_time = 0
+        self.last_dash_time = -9999
+
+        self.health = self.max_health
+        self.last_hit_time = -9999
+
+        self.attacking = False
+        self.last_attack_time = -9999
+        self.attack_start_time = 0
+        self._attack_already_hit = False  # علشان ما يضربش نفس العدو مليون مرة في نفس السوينج
+
+    @property
+    def pose(self):
+        """(facing, state) key of the frame to show."""
+        if self.attacking:
+            state = "attack"
+        elif self.is_dashing:
+            state = "dash"
+        else:
+            state = "idle"
+        return self.facing, state
+
+    # ---------------- Health ----------------
+    def is_alive(self) -> bool:
+        return self.health > 0
+
+    def take_damage(self, amount: int):
+        """Reduce health with a short invincibility window."""
+        if amount <= 0:
+            return
+
+        now = self.clock.ticks()
+        if now - self.last_hit_time < self.hit_cooldown_ms:
+            # Still in invincibility window
+            return
+
+        self.last_hit_time = now
+        self.health = max(0, self.health - amount)
+
+    # ---------------- Attack helpers ----------------
+    def can_attack(self) -> bool:
+        now = self.clock.ticks()
+        return (not self.attacking) and (now - self.last_attack_time >= self.attack_cooldown_ms)
+
+    def _start_attack(self):
+        """Internal: start a melee swing."""
+        now = self.clock.ticks()
+        self.attacking = True
+        self.attack_start_time = now
+        self.last_attack_time = now
+        self._attack_already_hit = False
+
+    def is_attacking(self) -> bool:
+        """Used by scenes to check if a swing is active."""
+        return self.attacking
+
+    def can_hit_this_swing(self) -> bool:
+        """Used by scenes: هل لسه مسموح للسوينج الحالي يضرب حد؟"""
+        return self.attacking and not self._attack_already_hit
+
+    def register_attack_hit(self):
+        """Called by scenes لما ضربة واحدة تصيب عدو."""
+        self._attack_already_hit = True
+
+    def get_attack_rect(self):
+        """Return a rect representing melee hitbox in front of the player."""
+        if not self.attacking:
+            return None
+
+        # Base rect (player)
+        px, py, pw, ph = self.rect
+
+        if self.facing == "up":
+            return pygame.Rect(
+                px + (pw - self.attack_width) // 2,
+                py - self.attack_range,
+                self.attack_width,
+                self.attack_range,
+            )
+        elif self.facing == "down":
+            return pygame.Rect(
+                px + (pw - self.attack_width) // 2,
+                py + ph,
+                self.attack_width,
+                self.attack_range,
+            )
+        elif self.facing == "left":
+            return pygame.Rect(
+                px - self.attack_range,
+                py + (ph - self.attack_width) // 2,
+                self.attack_range,
+                self.attack_width,
+            )
+        else:  # "right"
+            return pygame.Rect(
+                px + pw,
+                py + (ph - self.attack_width) // 2,
+                self.attack_range,
+                self.attack_width,
+            )
+
+    # ---------------- Dash helpers ----------------
+    def can_dash(self) -> bool:
+        now = self.clock.ticks()
+        return (not self.is_dashing) and (now - self.last_dash_time >= self.dash_cooldown_ms)
+
+    def _start_dash(self):
+        now = self.clock.ticks()
+        self.is_dashing = True
+        self.dash_start_time = now
+        self.last_dash_time = now
+
+    def _update_dash_state(self):
+        if not self.is_dashing:
+            self.speed = self.base_speed
+            return
+
+        now = self.clock.ticks()
+        if now - self.dash_start_time >= self.dash_duration_ms:
+            self.is_dashing = False
+            self.speed = self.base_speed
+        else:
+            self.speed = int(self.base_speed * self.dash_speed_multiplier)
+
+    # ---------------- Movement / Update ----------------
+    def _handle_movement_input(self, keys):
+        dx, dy = 0, 0
+
+        if keys[pygame.K_w] or keys[pygame.K_UP]:
+            dy -= self.speed
+            self.facing = "up"
+        if keys[pygame.K_s] or keys[pygame.K_DOWN]:
+            dy += self.speed
+            self.facing = "down"
+        if keys[pygame.K_a] or keys[pygame.K_LEFT]:
+            dx -= self.speed
+            self.facing = "left"
+        if keys[pygame.K_d] or keys[pygame.K_RIGHT]:
+            dx += self.speed
+            self.facing = "right"
+
+        self.rect.x += dx
+        self.rect.y += dy
+
+        # Clamp to screen
+        self.rect.clamp_ip(pygame.Rect(0, 0, settings.WIDTH, settings.HEIGHT))
+
+    def _handle_attack_input(self, keys):
+        # Attack key: J
+        if keys[pygame.K_j] and self.can_attack():
+            self._start_attack()
+
+        # End attack after duration
+        if self.attacking:
+            now = self.clock.ticks()
+            if now - self.attack_start_time >= self.attack_duration_ms:
+                self.attacking = False
+
+    def _handle_dash_input(self, keys):
+        # Dash key: K
+        if keys[pygame.K_k] and self.can_dash():
+            self._start_dash()
+
+        self._update_dash_state()
+
+    def update(self, keys):
+        if not self.is_alive():
+            return
+
+        # Dash affects speed
+        self._handle_dash_input(keys)
+
+        # Movement
+        self._handle_movement_input(keys)
+
+        # Attack
+        self._handle_attack_input(keys)
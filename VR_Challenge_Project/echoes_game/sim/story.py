@@ -0,0 +1,969 @@
+# sim/story.py
+"""
+Story progress per chapter as plain state, next to its combat world.
+
+A Chapter owns what used to live on each scene: the layout (trigger zones,
+spawn points), the CombatWorld, the progress flags and the DialogueStates the
+triggers open. Scenes only draw it; a bot or a headless server plays the whole
+story with the same two calls per tick:
+
+    target = chapter.handle_events(events)   # this tick's KEYDOWNs
+    target = chapter.step(keys, dt)          # this tick's key state
+
+Both return the registered scene name the player travels to ("MainMenu" on
+ESC, the chapter's own scene on a restart after death), or None.
+"""
+import copy
+
+import pygame
+from config import settings
+from core import clock as game_clock
+from sim.dialogue import DialogueState
+from sim.enemy import EnemyState
+from sim.player import PlayerState
+from sim.world import CombatWorld
+from story.bundles import load_dialogue
+
+
+class Chapter:
+    """Base chapter: dialogue priority, death / menu keys and the tick order."""
+
+    scene = None           # registered scene that draws this chapter
+    next_scene = None      # where its exit leads (preloaded once exit_in_sight)
+    contact_damage = 10    # ضرر اللاعب لكل لمسة عدو (balance sweeps override it on the world)
+
+    # DialogueState attribute names in input / draw priority; the first one is
+    # the intro, shown on every reset()
+    dialogues = ()
+
+    def __init__(self, clock=None):
+        self.clock = clock or game_clock.REAL
+
+    def _dialogue(self, key):
+        """DialogueState for a story.bundles key (hidden until start())."""
+        return DialogueState(load_dialogue(key), clock=self.clock)
+
+    def _create_world(self, player_start, zones, enemies=()):
+        """Combat world for this chapter's player, enemies and trigger zones."""
+        return CombatWorld(
+            PlayerState(*player_start, clock=self.clock),
+            enemies,
+            zones,
+            contact_damage=self.contact_damage,
+        )
+
+    def reset(self):
+        """Back to the chapter's start: fresh world, intro dialogue up, the rest unseen."""
+        self.world.reset()
+        for name in self.dialogues:
+            getattr(self, name).stop()
+        getattr(self, self.dialogues[0]).start()
+
+    @property
+    def player(self):
+        return self.world.player
+
+    @property
+    def player_dead(self) -> bool:
+        return self.world.player_dead
+
+    @property
+    def exit_in_sight(self) -> bool:
+        """True once the next chapter is worth loading in the background."""
+        return False
+
+    def active_dialogue(self):
+        """The DialogueState on screen (it takes all input and stops play), or None."""
+        for name in self.dialogues:
+            dialogue = getattr(self, name)
+            if dialogue.active:
+                return dialogue
+        return None
+
+    # ------------- Tick -------------
+    def handle_events(self, events):
+        # If player is dead, only accept restart / menu
+        if self.player_dead:
+            target = None
+            for event in events:
+                if event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_r:
+                        target = self.scene
+                    elif event.key == pygame.K_ESCAPE:
+                        target = "MainMenu"
+            return target
+
+        # While a dialogue is active, only feed events to it
+        dialogue = self.active_dialogue()
+        if dialogue is not None:
+            for event in events:
+                dialogue.handle_event(event)
+            return None
+
+        target = None
+        for event in events:
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    target = "MainMenu"
+                target = self._on_key(event.key) or target
+        return target
+
+    def step(self, keys, dt):
+        """One tick of play; nothing moves while the player is dead or a dialogue is up."""
+        if self.player_dead or self.active_dialogue() is not None:
+            return None
+        self._on_zones(self.world.step(keys), keys)
+        return None
+
+    def _on_key(self, key):
+        """A KEYDOWN during play; returns a travel target or None."""
+        return None
+
+    def _on_zones(self, zones, keys):
+        """Trigger zones the player stands in after this tick's move."""
+        pass
+
+    # ------------- Pipelined frames -------------
+    def freeze(self, clock):
+        """Draw-only copy of this tick's flags (core.snapshot); the world status stops here too."""
+        frozen = copy.copy(self)
+        frozen.world = copy.copy(self.world)
+        return frozen
+
+
+# -------------------------------------------------------------
+# CH-01 .. CH-10
+# -------------------------------------------------------------
+class LabChapter(Chapter):
+    scene = "LabScene"
+    next_scene = "AshfallCityScene"
+    dialogues = ("dialogue", "echo_dialogue")
+
+    def __init__(self, clock=None):
+        super().__init__(clock)
+
+        # Intro / cinematic sequence
+        self.intro_duration = 4.0   # seconds before player can move
+
+        # Memory Echo area
+        self.echo_rect = pygame.Rect(
+            settings.WIDTH // 2 - 40,
+            settings.HEIGHT // 2 - 120,
+            80,
+            80,
+        )
+
+        # Door rect (exit)
+        self.door_rect = pygame.Rect(settings.WIDTH - 140, settings.HEIGHT // 2 - 50, 40, 100)
+
+        self.dialogue = self._dialogue("LAB_INTRO_DIALOGUE")
+        # Memory Echo dialogue (appears after pressing E inside the Echo area)
+        self.echo_dialogue = self._dialogue("LAB_ECHO_1_DIALOGUE")
+
+        self.world = self._create_world(
+            (settings.WIDTH // 2, settings.HEIGHT // 2 + 80),
+            {"echo": self.echo_rect, "door": self.door_rect},
+        )
+        self.reset()
+
+    def reset(self):
+        super().reset()
+        self.intro_time = 0.0
+        self.in_intro = True
+
+        self.echo_active = False
+        self.echo_collected = False
+        self.door_active = False  # هل اللاعب قرب الباب؟
+
+    @property
+    def exit_in_sight(self):
+        return self.echo_collected or self.door_active
+
+    def step(self, keys, dt):
+        # After intro_duration seconds, we end the cinematic intro
+        self.intro_time += dt
+        if self.intro_time >= self.intro_duration:
+            self.in_intro = False
+
+        # Stop movement while intro cinematic is running
+        if self.in_intro:
+            return None
+        return super().step(keys, dt)
+
+    def _on_key(self, key):
+        # انتقال للفصل الثاني عند الباب
+        if key == pygame.K_f and self.door_active:
+            return self.next_scene
+        return None
+
+    def _on_zones(self, zones, keys):
+        self.echo_active = not self.echo_collected and "echo" in zones
+        self.door_active = "door" in zones
+
+        # Trigger Memory Echo
+        if self.echo_active and keys[pygame.K_e]:
+            self.echo_collected = True
+            self.echo_dialogue.start()
+
+
+class AshfallChapter(Chapter):
+    scene = "AshfallCityScene"
+    next_scene = "RiftZoneScene"
+    contact_damage = 15
+    dialogues = ("dialogue", "echo_dialogue")
+
+    def __init__(self, clock=None):
+        super().__init__(clock)
+
+        # Simple Memory Echo zone in the street
+        self.echo_rect = pygame.Rect(
+            settings.WIDTH // 2 - 50,
+            settings.HEIGHT // 2 - 20,
+            100,
+            40,
+        )
+
+        # Gate to Rift Zone on the far right side of the road
+        self.gate_rect = pygame.Rect(
+            settings.WIDTH - 120,
+            settings.HEIGHT // 2 + 20,
+            60,
+            120,
+        )
+
+        self.dialogue = self._dialogue("CITY_INTRO_DIALOGUE")
+        self.echo_dialogue = self._dialogue("CITY_STREET_ECHO_1")
+
+        # A couple of patrolling enemies on the road
+        road_y = settings.HEIGHT // 2 + 80
+        self.world = self._create_world(
+            (settings.WIDTH // 2, settings.HEIGHT - 100),
+            {"echo": self.echo_rect, "gate": self.gate_rect},
+            [
+                EnemyState(settings.WIDTH // 2 - 140, road_y, patrol_width=200, speed=2, max_health=60, clock=self.clock),
+                EnemyState(settings.WIDTH // 2 + 80, road_y, patrol_width=180, speed=2, max_health=60, clock=self.clock),
+            ],
+        )
+        self.reset()
+
+    def reset(self):
+        super().reset()
+        self.echo_active = False
+        self.echo_collected = False
+        self.gate_active = False
+
+    @property
+    def exit_in_sight(self):
+        return self.echo_collected or self.gate_active
+
+    def _on_key(self, key):
+        # Travel to Rift Zone
+        if key == pygame.K_f and self.gate_active:
+            return self.next_scene
+        return None
+
+    def _on_zones(self, zones, keys):
+        self.echo_active = not self.echo_collected and "echo" in zones
+        if self.echo_active and keys[pygame.K_e]:
+            self.echo_collected = True
+            self.echo_dialogue.start()
+
+        self.gate_active = "gate" in zones
+
+
+class RiftChapter(Chapter):
+    scene = "RiftZoneScene"
+    next_scene = "KeepersFacilityScene"
+    dialogues = ("dialogue", "alt_echo_dialogue", "reveal_echo_dialogue")
+
+    def __init__(self, clock=None):
+        super().__init__(clock)
+
+        # Two Echo zones
+        self.alt_echo_rect = pygame.Rect(
+            settings.WIDTH // 2 - 120,
+            settings.HEIGHT // 2 - 40,
+            80,
+            80,
+        )
+        self.reveal_echo_rect = pygame.Rect(
+            settings.WIDTH // 2 + 40,
+            settings.HEIGHT // 2 - 40,
+            80,
+            80,
+        )
+
+        # Gateway to Keepers Facility – appears effectively after both echoes collected
+        self.gate_rect = pygame.Rect(
+            settings.WIDTH // 2 - 40,
+            40,
+            80,
+            60,
+        )
+
+        self.dialogue = self._dialogue("RIFT_INTRO_DIALOGUE")
+        self.alt_echo_dialogue = self._dialogue("RIFT_ALT_PATH_ECHO")
+        self.reveal_echo_dialogue = self._dialogue("RIFT_REVEAL_ECHO")
+
+        self.world = self._create_world(
+            (settings.WIDTH // 2, settings.HEIGHT - 100),
+            {
+                "alt_echo": self.alt_echo_rect,
+                "reveal_echo": self.reveal_echo_rect,
+                "gate": self.gate_rect,
+            },
+            self._spawn_enemies(),
+        )
+        self.reset()
+
+    def _spawn_enemies(self):
+        """A couple of 'corrupted echoes' as enemies."""
+        y1 = settings.HEIGHT // 2 + 40
+        y2 = settings.HEIGHT // 2 - 20
+        return [
+            EnemyState(settings.WIDTH // 2 - 160, y1, patrol_width=220, speed=2, max_health=60, clock=self.clock),
+            EnemyState(settings.WIDTH // 2 + 140, y2, patrol_width=200, speed=3, max_health=60, clock=self.clock),
+        ]
+
+    def reset(self):
+        super().reset()
+        self.alt_echo_active = False
+        self.reveal_echo_active = False
+        self.alt_echo_collected = False
+        self.reveal_echo_collected = False
+        self.gate_active = False
+
+    @property
+    def both_echoes_synced(self) -> bool:
+        return self.alt_echo_collected and self.reveal_echo_collected
+
+    @property
+    def exit_in_sight(self):
+        return self.both_echoes_synced
+
+    def _on_key(self, key):
+        # Travel to Keepers Facility when gate is active
+        if key == pygame.K_f and self.gate_active and self.both_echoes_synced:
+            return self.next_scene
+        return None
+
+    def _on_zones(self, zones, keys):
+        self.alt_echo_active = not self.alt_echo_collected and "alt_echo" in zones
+        self.reveal_echo_active = not self.reveal_echo_collected and "reveal_echo" in zones
+
+        # Trigger alt path echo
+        if self.alt_echo_active and keys[pygame.K_e]:
+            self.alt_echo_collected = True
+            self.alt_echo_dialogue.start()
+
+        # Trigger reveal echo
+        if self.reveal_echo_active and keys[pygame.K_e]:
+            self.reveal_echo_collected = True
+            self.reveal_echo_dialogue.start()
+
+        # Gate activation only makes sense once both echoes are synced
+        self.gate_active = self.both_echoes_synced and "gate" in zones
+
+
+class RiftSurgeChapter(RiftChapter):
+    """
+    Stress-test variant of the Rift Zone: thousands of corrupted echoes stored
+    in an EnemySwarm (NumPy arrays) instead of one state object per enemy.
+    """
+
+    scene = "RiftSurgeScene"
+
+    def _create_world(self, player_start, zones, enemies=()):
+        # NumPy only loads for the stress test
+        import numpy as np
+        from entities.swarm import EnemySwarm
+        from sim.world import SwarmWorld
+
+        count = settings.RIFT_SURGE_ENEMIES
+        rng = np.random.default_rng(2189)  # same surge every run
+
+        swarm = EnemySwarm(clock=self.clock)
+        swarm.spawn(
+            rng.integers(40, settings.WIDTH - 40, count),
+            # Patrol band above the player's start line
+            rng.integers(140, settings.HEIGHT // 2 + 60, count),
+            patrol_width=rng.integers(80, 240, count),
+            speed=rng.integers(1, 4, count),
+            max_health=60,
+        )
+        return SwarmWorld(PlayerState(*player_start, clock=self.clock), swarm, zones,
+                          contact_damage=self.contact_damage)
+
+    def _spawn_enemies(self):
+        return ()
+
+
+class KeepersChapter(Chapter):
+    scene = "KeepersFacilityScene"
+    next_scene = "AscendantSpireScene"
+    dialogues = ("intro_dialogue", "meeting_dialogue", "secret_echo_dialogue")
+
+    def __init__(self, clock=None):
+        super().__init__(clock)
+
+        # Meeting area (Commander Hale)
+        self.meeting_rect = pygame.Rect(
+            settings.WIDTH // 2 - 60,
+            settings.HEIGHT // 2 - 60,
+            120,
+            80,
+        )
+
+        # Secret echo terminal
+        self.secret_echo_rect = pygame.Rect(
+            120,
+            settings.HEIGHT // 2 - 30,
+            80,
+            60,
+        )
+
+        # Exit to Ascendant Spire (top center)
+        self.exit_rect = pygame.Rect(
+            settings.WIDTH // 2 - 40,
+            70,
+            80,
+            40,
+        )
+
+        self.intro_dialogue = self._dialogue("KEEPERS_INTRO_DIALOGUE")
+        self.meeting_dialogue = self._dialogue("KEEPERS_MEETING_DIALOGUE")
+        self.secret_echo_dialogue = self._dialogue("KEEPERS_SECRET_ECHO")
+
+        self.world = self._create_world(
+            (settings.WIDTH // 2, settings.HEIGHT - 120),
+            {"meeting": self.meeting_rect, "secret_echo": self.secret_echo_rect, "exit": self.exit_rect},
+        )
+        self.reset()
+
+    def reset(self):
+        super().reset()
+        self.meeting_active = False
+        self.meeting_done = False
+
+        self.secret_echo_active = False
+        self.secret_echo_done = False
+
+        self.exit_active = False
+
+    @property
+    def exit_in_sight(self):
+        return self.meeting_done
+
+    def _on_key(self, key):
+        # Trigger meeting with Hale
+        if key == pygame.K_e and self.meeting_active and not self.meeting_done:
+            self.meeting_dialogue.start()
+            self.meeting_done = True
+
+        # Trigger secret Memory Echo
+        if key == pygame.K_e and self.secret_echo_active and not self.secret_echo_done:
+            self.secret_echo_dialogue.start()
+            self.secret_echo_done = True
+
+        # Travel to Ascendant Spire (after meeting Hale)
+        if key == pygame.K_f and self.exit_active and self.meeting_done:
+            return self.next_scene
+        return None
+
+    def _on_zones(self, zones, keys):
+        self.meeting_active = "meeting" in zones
+        self.secret_echo_active = "secret_echo" in zones
+        # Exit to spire (only meaningful after meeting Hale)
+        self.exit_active = "exit" in zones
+
+
+class SpireChapter(Chapter):
+    scene = "AscendantSpireScene"
+    next_scene = "CoreChamberScene"
+    contact_damage = 15
+    dialogues = ("dialogue", "echo_dialogue")
+
+    def __init__(self, clock=None):
+        super().__init__(clock)
+
+        # Memory Echo with Seraph
+        self.echo_rect = pygame.Rect(
+            settings.WIDTH // 2 - 40,
+            settings.HEIGHT // 2,
+            80,
+            60,
+        )
+
+        # Gate to Core Chamber (top center)
+        self.core_gate_rect = pygame.Rect(
+            settings.WIDTH // 2 - 40,
+            40,
+            80,
+            50,
+        )
+
+        self.dialogue = self._dialogue("ASCENDANT_INTRO_DIALOGUE")
+        self.echo_dialogue = self._dialogue("ASCENDANT_SERAPH_ECHO")
+
+        # Ascendant patrols on different platforms
+        y1 = settings.HEIGHT // 2 + 40
+        y2 = settings.HEIGHT // 2 - 10
+        self.world = self._create_world(
+            (settings.WIDTH // 2, settings.HEIGHT - 100),
+            {"echo": self.echo_rect, "core_gate": self.core_gate_rect},
+            [
+                EnemyState(settings.WIDTH // 2 - 160, y1, patrol_width=220, speed=2, max_health=70, clock=self.clock),
+                EnemyState(settings.WIDTH // 2 + 140, y2, patrol_width=200, speed=3, max_health=70, clock=self.clock),
+            ],
+        )
+        self.reset()
+
+    def reset(self):
+        super().reset()
+        self.echo_active = False
+        self.echo_done = False
+        self.core_gate_active = False
+
+    @property
+    def exit_in_sight(self):
+        return self.echo_done
+
+    def _on_key(self, key):
+        # Travel to Core Chamber when gate is active
+        if key == pygame.K_f and self.core_gate_active:
+            return self.next_scene
+        return None
+
+    def _on_zones(self, zones, keys):
+        self.echo_active = not self.echo_done and "echo" in zones
+        if self.echo_active and keys[pygame.K_e]:
+            self.echo_done = True
+            self.echo_dialogue.start()
+
+        # Gate to Core Chamber – لا يُفعّل إلا بعد الـ Echo
+        self.core_gate_active = self.echo_done and "core_gate" in zones
+
+
+class CoreChamberChapter(Chapter):
+    scene = "CoreChamberScene"
+    next_scene = "RuinedArchiveScene"
+    dialogues = ("intro_dialogue", "choice_intro_dialogue", "ending_dialogue")
+
+    ENDINGS = {
+        "reset": "CORE_FINAL_CHOICE_ENDING_RESET",
+        "preserve": "CORE_FINAL_CHOICE_ENDING_PRESERVE",
+    }
+
+    def __init__(self, clock=None):
+        super().__init__(clock)
+
+        # Core center
+        self.core_rect = pygame.Rect(
+            settings.WIDTH // 2 - 40,
+            settings.HEIGHT // 2 - 60,
+            80,
+            120,
+        )
+
+        # Choice terminals
+        self.reset_rect = pygame.Rect(
+            settings.WIDTH // 2 - 200,
+            settings.HEIGHT // 2 + 60,
+            140,
+            50,
+        )
+        self.preserve_rect = pygame.Rect(
+            settings.WIDTH // 2 + 60,
+            settings.HEIGHT // 2 + 60,
+            140,
+            50,
+        )
+
+        # Dialogue phases (the ending's lines are picked by the choice)
+        self.intro_dialogue = self._dialogue("CORE_INTRO_DIALOGUE")
+        self.choice_intro_dialogue = self._dialogue("CORE_FINAL_CHOICE_INTRO")
+        self.ending_dialogue = self._dialogue(self.ENDINGS["reset"])
+
+        self.world = self._create_world(
+            (settings.WIDTH // 2, settings.HEIGHT - 120),
+            {"reset": self.reset_rect, "preserve": self.preserve_rect},
+        )
+        self.reset()
+
+    def reset(self):
+        super().reset()
+        self.reset_active = False
+        self.preserve_active = False
+
+        self.choice_started = False
+        self.ending_started = False
+
+        # Which ending selected
+        self.selected_ending = None
+
+    @property
+    def exit_in_sight(self):
+        # Build the next chapter while the ending dialogue plays
+        return self.ending_started
+
+    def _on_key(self, key):
+        if key not in (pygame.K_1, pygame.K_2):
+            return None
+        ending = "reset" if key == pygame.K_1 else "preserve"
+
+        # أول ضغطة 1 / 2 تفتح حوار المواجهة مع Seraph
+        if not self.choice_started:
+            self.choice_started = True
+            self.choice_intro_dialogue.start()
+            self.selected_ending = ending
+
+        # بعد حوار المواجهة، 1/2 تؤكد النهاية وتفتح حوار النهاية
+        elif not self.choice_intro_dialogue.active and not self.ending_dialogue.active:
+            self.selected_ending = ending
+            self.ending_started = True
+            self.ending_dialogue.set_lines(load_dialogue(self.ENDINGS[ending]))
+        return None
+
+    def step(self, keys, dt):
+        # لو أي حوار شغّال، ما فيش حركة
+        if self.active_dialogue() is not None:
+            return None
+
+        # لو حوار النهاية اتقفَل → مباشرة ننتقل للمرحلة اللي بعدها
+        if self.ending_started:
+            return self.next_scene
+        return super().step(keys, dt)
+
+    def _on_zones(self, zones, keys):
+        # Player stands near terminals (just for hints)
+        self.reset_active = "reset" in zones
+        self.preserve_active = "preserve" in zones
+
+
+class ArchiveChapter(Chapter):
+    """CH-07: Digital graveyard of failed branches."""
+
+    scene = "RuinedArchiveScene"
+    next_scene = "MirrorWalkScene"
+    dialogues = ("intro_dialogue", "log_echo_dialogue", "hidden_echo_dialogue")
+
+    def __init__(self, clock=None):
+        super().__init__(clock)
+
+        # Echo zones
+        self.log_echo_rect = pygame.Rect(
+            settings.WIDTH // 2 - 60,
+            settings.HEIGHT // 2 + 30,
+            120,
+            40,
+        )
+        self.hidden_echo_rect = pygame.Rect(
+            140,
+            settings.HEIGHT // 2 - 40,
+            100,
+            40,
+        )
+
+        # Gate to next chapter (Mirror Walk)
+        self.exit_rect = pygame.Rect(
+            settings.WIDTH // 2 - 40,
+            60,
+            80,
+            40,
+        )
+
+        self.intro_dialogue = self._dialogue("ARCHIVE_INTRO_DIALOGUE")
+        self.log_echo_dialogue = self._dialogue("ARCHIVE_LOG_ECHO_1")
+        self.hidden_echo_dialogue = self._dialogue("ARCHIVE_HIDDEN_ECHO")
+
+        # A few weak glitch enemies
+        y = settings.HEIGHT // 2 + 80
+        self.world = self._create_world(
+            (settings.WIDTH // 2, settings.HEIGHT - 120),
+            {"log_echo": self.log_echo_rect, "hidden_echo": self.hidden_echo_rect, "exit": self.exit_rect},
+            [
+                EnemyState(settings.WIDTH // 2 - 150, y, patrol_width=120, speed=1, max_health=40, clock=self.clock),
+                EnemyState(settings.WIDTH // 2 + 140, y, patrol_width=120, speed=1, max_health=40, clock=self.clock),
+            ],
+        )
+        self.reset()
+
+    def reset(self):
+        super().reset()
+        self.log_echo_active = False
+        self.hidden_echo_active = False
+        self.log_echo_done = False
+        self.hidden_echo_done = False
+
+        self.exit_active = False
+
+    @property
+    def exit_in_sight(self):
+        return self.exit_active
+
+    def _on_key(self, key):
+        target = None
+
+        # Travel to Mirror Walk
+        if key == pygame.K_f and self.exit_active:
+            target = self.next_scene
+
+        # Trigger log echo
+        if key == pygame.K_e and self.log_echo_active and not self.log_echo_done:
+            self.log_echo_done = True
+            self.log_echo_dialogue.start()
+
+        # Trigger hidden echo
+        if key == pygame.K_e and self.hidden_echo_active and not self.hidden_echo_done:
+            self.hidden_echo_done = True
+            self.hidden_echo_dialogue.start()
+        return target
+
+    def _on_zones(self, zones, keys):
+        self.log_echo_active = not self.log_echo_done and "log_echo" in zones
+        self.hidden_echo_active = not self.hidden_echo_done and "hidden_echo" in zones
+        self.exit_active = "exit" in zones
+
+
+class MirrorChapter(Chapter):
+    """CH-08: Corridor of reflective branches and a 'mirror' enemy."""
+
+    scene = "MirrorWalkScene"
+    next_scene = "SilentOrbitScene"
+    contact_damage = 18
+    dialogues = ("intro_dialogue", "duel_echo_dialogue", "resolution_dialogue")
+
+    def __init__(self, clock=None):
+        super().__init__(clock)
+
+        # Echo zone
+        self.duel_echo_rect = pygame.Rect(
+            settings.WIDTH // 2 - 60,
+            settings.HEIGHT // 2 + 60,
+            120,
+            40,
+        )
+
+        # Resolution echo (بعد قتل العدو أو تفعيل)
+        self.resolution_rect = pygame.Rect(
+            settings.WIDTH // 2 - 60,
+            120,
+            120,
+            40,
+        )
+
+        # Exit to Silent Orbit
+        self.exit_rect = pygame.Rect(
+            settings.WIDTH // 2 - 40,
+            60,
+            80,
+            30,
+        )
+
+        self.intro_dialogue = self._dialogue("MIRROR_INTRO_DIALOGUE")
+        self.duel_echo_dialogue = self._dialogue("MIRROR_DUEL_ECHO")
+        self.resolution_dialogue = self._dialogue("MIRROR_RESOLUTION_DIALOGUE")
+
+        # Single tougher enemy representing Mirror Ryn
+        self.mirror_enemy = EnemyState(settings.WIDTH // 2, settings.HEIGHT // 2, patrol_width=140, speed=2,
+                                       max_health=120, clock=self.clock)
+        self.world = self._create_world(
+            (settings.WIDTH // 2, settings.HEIGHT - 120),
+            {"duel_echo": self.duel_echo_rect, "resolution": self.resolution_rect, "exit": self.exit_rect},
+            [self.mirror_enemy],
+        )
+        self.reset()
+
+    def reset(self):
+        super().reset()
+        self.duel_echo_active = False
+        self.duel_echo_done = False
+
+        self.resolution_active = False
+        self.resolution_done = False
+
+        self.exit_active = False
+
+    @property
+    def exit_in_sight(self):
+        # Build the next chapter while the resolution dialogue plays
+        return self.resolution_done
+
+    def _on_key(self, key):
+        # Trigger duel echo (حوار قبل/أثناء القتال)
+        if key == pygame.K_e and self.duel_echo_active and not self.duel_echo_done:
+            self.duel_echo_done = True
+            self.duel_echo_dialogue.start()
+
+        # Trigger resolution echo (بعد هزيمة العدو)
+        if key == pygame.K_e and self.resolution_active and not self.resolution_done:
+            self.resolution_done = True
+            self.resolution_dialogue.start()
+
+        # Move to Silent Orbit
+        if key == pygame.K_f and self.exit_active:
+            return self.next_scene
+        return None
+
+    def _on_zones(self, zones, keys):
+        self.duel_echo_active = not self.duel_echo_done and "duel_echo" in zones
+
+        # Resolution zone active فقط بعد موت العدو
+        mirror_dead = not self.mirror_enemy.is_alive()
+        self.resolution_active = mirror_dead and not self.resolution_done and "resolution" in zones
+
+        # Exit active بعد حل الـ resolution echo
+        self.exit_active = mirror_dead and self.resolution_done and "exit" in zones
+
+
+class OrbitChapter(Chapter):
+    """CH-09: Quiet orbital facility – story-heavy, no enemies."""
+
+    scene = "SilentOrbitScene"
+    next_scene = "OriginCoreScene"
+    dialogues = ("intro_dialogue", "revelation_dialogue", "confront_dialogue")
+
+    def __init__(self, clock=None):
+        super().__init__(clock)
+
+        # Echo zones
+        self.revelation_rect = pygame.Rect(
+            settings.WIDTH // 2 - 80,
+            settings.HEIGHT // 2,
+            160,
+            40,
+        )
+        self.confront_rect = pygame.Rect(
+            settings.WIDTH // 2 - 80,
+            settings.HEIGHT // 2 - 80,
+            160,
+            40,
+        )
+
+        # Exit to Origin Core (فصل 10)
+        self.exit_rect = pygame.Rect(
+            settings.WIDTH // 2 - 40,
+            60,
+            80,
+            30,
+        )
+
+        self.intro_dialogue = self._dialogue("ORBIT_INTRO_DIALOGUE")
+        self.revelation_dialogue = self._dialogue("ORBIT_REVELATION_ECHO")
+        self.confront_dialogue = self._dialogue("ORBIT_LIRA_CONFRONT_DIALOGUE")
+
+        self.world = self._create_world(
+            (settings.WIDTH // 2, settings.HEIGHT - 120),
+            {"revelation": self.revelation_rect, "confront": self.confront_rect, "exit": self.exit_rect},
+        )
+        self.reset()
+
+    def reset(self):
+        super().reset()
+        self.revelation_active = False
+        self.revelation_done = False
+
+        self.confront_active = False
+        self.confront_done = False
+
+        self.exit_active = False
+
+    @property
+    def exit_in_sight(self):
+        # Build the next chapter while the last dialogue plays
+        return self.revelation_done and self.confront_done
+
+    def _on_key(self, key):
+        if key == pygame.K_e and self.revelation_active and not self.revelation_done:
+            self.revelation_done = True
+            self.revelation_dialogue.start()
+
+        if key == pygame.K_e and self.confront_active and not self.confront_done:
+            self.confront_done = True
+            self.confront_dialogue.start()
+
+        if key == pygame.K_f and self.exit_active:
+            return self.next_scene
+        return None
+
+    def _on_zones(self, zones, keys):
+        self.revelation_active = not self.revelation_done and "revelation" in zones
+        self.confront_active = not self.confront_done and "confront" in zones
+        self.exit_active = self.revelation_done and self.confront_done and "exit" in zones
+
+
+class OriginChapter(Chapter):
+    """CH-10: First Origin Core, final epilogue."""
+
+    scene = "OriginCoreScene"
+    dialogues = ("intro_dialogue", "setup_dialogue", "epilogue_dialogue")
+
+    def __init__(self, clock=None):
+        super().__init__(clock)
+
+        # Origin core
+        self.core_rect = pygame.Rect(
+            settings.WIDTH // 2 - 35,
+            settings.HEIGHT // 2 - 50,
+            70,
+            100,
+        )
+
+        # Dialogues in sequence: intro → setup → epilogue
+        self.intro_dialogue = self._dialogue("ORIGIN_INTRO_DIALOGUE")
+        self.setup_dialogue = self._dialogue("ORIGIN_CHOICE_SETUP")
+        self.epilogue_dialogue = self._dialogue("ORIGIN_EPILOGUE_OPEN_END")
+
+        self.world = self._create_world((settings.WIDTH // 2, settings.HEIGHT - 120), {})
+        self.reset()
+
+    def reset(self):
+        super().reset()
+        self.setup_started = False
+        self.epilogue_started = False
+        self.sequence_done = False
+
+    def _on_key(self, key):
+        # After all done: only the menu key (handled by Chapter)
+        if self.sequence_done:
+            return None
+
+        # Start setup dialogue بعد انتهاء الـ intro
+        if not self.setup_started:
+            self.setup_started = True
+            self.setup_dialogue.start()
+
+        # بعد انتهاء setup، أول ضغط أي زر يبدأ epilogue
+        elif not self.epilogue_started and not self.setup_dialogue.active:
+            self.epilogue_started = True
+            self.epilogue_dialogue.start()
+        return None
+
+    def step(self, keys, dt):
+        # لا توجد معارك هنا، لكن نسمح بالحركة الخفيفة إلا أثناء الحوار
+        if self.active_dialogue() is not None or self.sequence_done:
+            return None
+
+        if self.epilogue_started:
+            self.sequence_done = True
+            return None
+        return super().step(keys, dt)
+
+
+# Scene name -> chapter class (scenes.SCENES order)
+CHAPTERS = {
+    chapter.scene: chapter
+    for chapter in (
+        LabChapter,
+        AshfallChapter,
+        RiftChapter,
+        KeepersChapter,
+        SpireChapter,
+        CoreChamberChapter,
+        ArchiveChapter,
+        MirrorChapter,
+        OrbitChapter,
+        OriginChapter,
+        RiftSurgeChapter,
+    )
+}
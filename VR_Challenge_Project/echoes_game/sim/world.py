@@ -0,0 +1,116 @@
+# sim/world.py
+from core.spatial import SpatialHash
+
+
+class CombatWorld:
+    """
+    One combat arena as plain state: the player, the enemy roster and named
+    trigger zones, stepped once per tick from the key state. Nothing here
+    touches the display, fonts or Surfaces – scenes draw it, balance sweeps
+    and soaks just step it.
+    """
+
+    def __init__(self, player, enemies=(), zones=None, contact_damage=10):
+        """
+        player: sim.player.PlayerState (its spawn point is where it stands now)
+        enemies: EnemyState list – the roster, kept for reset()
+        zones: {name: Rect} trigger zones, reported by step()
+        contact_damage: ضرر اللاعب لكل لمسة عدو
+        """
+        self.player = player
+        self.player_start = player.rect.center
+        self.roster = list(enemies)
+        self.contact_damage = contact_damage
+
+        # Broadphase grid: enemies + trigger zones
+        self.space = SpatialHash()
+        for name, rect in (zones or {}).items():
+            self.space.insert(name, rect, "zone")
+
+        self.reset()
+
+    def reset(self):
+        self.player.reset(*self.player_start)
+        for enemy in self.roster:
+            enemy.reset()
+        self.enemies = list(self.roster)   # alive ones
+        self.space.sync(self.enemies, "enemy")
+        self.player_dead = False
+
+    # ------------- Step -------------
+    def step(self, keys):
+        """One tick of combat; returns the trigger zones the player is standing in."""
+        self.player.update(keys)
+        self.step_enemies()
+
+        # Check death
+        if not self.player.is_alive():
+            self.player_dead = True
+
+        return self.space.query(self.player.rect, "zone")
+
+    def step_enemies(self):
+        """Enemy patrols, contact damage and the player's melee hits."""
+        player = self.player
+        for enemy in self.enemies:
+            enemy.update()
+
+        # Broadphase: re-bucket moved enemies, drop killed ones
+        self.space.sync(self.enemies, "enemy")
+
+        # Enemy collision / damage (لا ضرر أثناء الـ Dash)
+        if player.is_alive():
+            hits = self.space.query(player.rect, "enemy")
+            if hits and not player.is_dashing:
+                player.take_damage(self.contact_damage)
+
+        # Player attack vs enemies
+        if player.is_attacking() and player.can_hit_this_swing():
+            attack_rect = player.get_attack_rect()
+            if attack_rect:
+                # أي عدو في الـ Hitbox يتضرب مرة واحدة في السوينج
+                for enemy in self.space.query(attack_rect, "enemy"):
+                    enemy.take_damage(player.attack_damage)
+                    player.register_attack_hit()
+                    if not enemy.is_alive():
+                        self.enemies.remove(enemy)
+                    break  # تضرب أول واحد وتخرج، تقدر تغير ده لو عايز Multi-hit
+
+    @property
+    def cleared(self) -> bool:
+        return not self.enemies
+
+
+class SwarmWorld(CombatWorld):
+    """CombatWorld whose enemies live in one EnemySwarm (NumPy arrays)."""
+
+    def __init__(self, player, swarm, zones=None, contact_damage=10):
+        self.swarm = swarm
+        super().__init__(player, (), zones, contact_damage)
+
+    def reset(self):
+        super().reset()
+        self.swarm.reset()
+
+    def step_enemies(self):
+        player = self.player
+        swarm = self.swarm
+        swarm.update()
+
+        # Contact damage (no damage during dash)
+        if player.is_alive():
+            if swarm.overlapping(player.rect).size and not player.is_dashing:
+                player.take_damage(self.contact_damage)
+
+        # Melee: first enemy in the hitbox takes the swing
+        if player.is_attacking() and player.can_hit_this_swing():
+            attack_rect = player.get_attack_rect()
+            if attack_rect:
+                hit = swarm.overlapping(attack_rect)
+                if hit.size:
+                    swarm.take_damage(hit[:1], player.attack_damage)
+                    player.register_attack_hit()
+
+    @property
+    def cleared(self) -> bool:
+        return len(self.swarm) == 0
@@ -0,0 +1,73 @@
+# story/build_bundles.py
+"""
+Compile a dialogue source module into per-chapter bundles (story/bundles.py).
+
+    python -m story.build_bundles                       # story.dialogues -> en
+    python -m story.build_bundles --source story.dialogues_ar --locale ar
+"""
+import argparse
+import importlib
+import json
+import os
+import sys
+
+from story.bundles import BUNDLE_DIR, MAGIC, HEADER_LEN, bundle_path, chapter_for
+
+
+def collect(module):
+    """{chapter: {KEY: [lines]}} from the module's UPPER_CASE list constants."""
+    chapters = {}
+    for key, value in vars(module).items():
+        if not key.isupper() or not isinstance(value, list):
+            continue
+        chapters.setdefault(chapter_for(key), {})[key] = [str(line) for line in value]
+    return chapters
+
+
+def encode_bundle(chapter, locale, entries):
+    blob = bytearray()
+    index = {}
+    for key, lines in entries.items():
+        spans = []
+        for line in lines:
+            data = line.encode("utf-8")
+            spans.append([len(blob), len(data)])
+            blob += data
+        index[key] = spans
+
+    header = json.dumps(
+        {"chapter": chapter, "locale": locale, "entries": index},
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+    return MAGIC + HEADER_LEN.pack(len(header)) + header + bytes(blob)
+
+
+def build(source="story.dialogues", locale="en", out_dir=None):
+    module = importlib.import_module(source)
+    written = []
+    for chapter, entries in sorted(collect(module).items()):
+        path = bundle_path(chapter, locale)
+        if out_dir:
+            path = os.path.join(out_dir, locale, chapter + ".dlg")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(encode_bundle(chapter, locale, entries))
+        written.append(path)
+    return written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build dialogue bundles")
+    parser.add_argument("--source", default="story.dialogues", help="dialogue module to compile")
+    parser.add_argument("--locale", default="en")
+    parser.add_argument("--out", help=f"output root (default {BUNDLE_DIR})")
+    args = parser.parse_args(argv)
+
+    for path in build(args.source, args.locale, args.out):
+        print(path)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+# story/bundles.py
+"""
+Compiled dialogue bundles (one file per chapter and locale).
+
+Layout of story/bundles/<locale>/<chapter>.dlg:
+
+    MAGIC (8 bytes) | header length (uint32 LE) | JSON header | UTF-8 blob
+
+The header maps each dialogue key to a list of [offset, length] pairs into the
+blob, one per line. The loader memory-maps the file and only decodes the lines
+a scene asks for. Bundles are built from story/dialogues.py with
+`python -m story.build_bundles`.
+"""
+import json
+import mmap
+import os
+import struct
+
+from config import settings
+
+MAGIC = b"ECHODLG1"
+HEADER_LEN = struct.Struct("<I")
+
+BUNDLE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bundles")
+
+# (locale, chapter) -> DialogueBundle
+_open_bundles = {}
+
+
+def chapter_for(key):
+    """RIFT_REVEAL_ECHO -> "rift" (chapters are the key prefixes)."""
+    return key.split("_", 1)[0].lower()
+
+
+def bundle_path(chapter, locale):
+    return os.path.join(BUNDLE_DIR, locale, chapter + ".dlg")
+
+
+class DialogueBundle:
+    """One memory-mapped chapter bundle."""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self._mm[:len(MAGIC)] != MAGIC:
+            self._mm.close()
+            raise ValueError(f"{path}: not a dialogue bundle")
+
+        start = len(MAGIC)
+        (header_len,) = HEADER_LEN.unpack_from(self._mm, start)
+        start += HEADER_LEN.size
+        header = json.loads(self._mm[start:start + header_len].decode("utf-8"))
+
+        self.chapter = header["chapter"]
+        self.locale = header["locale"]
+        self._entries = header["entries"]
+        self._blob_start = start + header_len
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def keys(self):
+        return self._entries.keys()
+
+    def line_count(self, key):
+        return len(self._entries[key])
+
+    def lines(self, key, start=0, stop=None):
+        """Decode lines [start:stop] of one entry."""
+        base = self._blob_start
+        mm = self._mm
+        return [
+            mm[base + offset:base + offset + length].decode("utf-8")
+            for offset, length in self._entries[key][start:stop]
+        ]
+
+    def close(self):
+        self._mm.close()
+
+
+def open_bundle(chapter, locale=None):
+    locale = locale or settings.LOCALE
+    bundle = _open_bundles.get((locale, chapter))
+    if bundle is None:
+        bundle = _open_bundles[(locale, chapter)] = DialogueBundle(bundle_path(chapter, locale))
+    return bundle
+
+
+def load_dialogue(key, locale=None, start=0, stop=None):
+    """
+    Lines of one dialogue entry (e.g. "RIFT_REVEAL_ECHO").
+
+    Falls back to the source module when the bundle hasn't been built yet
+    (fresh checkout) – released builds always ship the .dlg files.
+    """
+    chapter = chapter_for(key)
+    try:
+        bundle = open_bundle(chapter, locale)
+    except FileNotFoundError:
+        from story import dialogues
+        return list(getattr(dialogues, key))[start:stop]
+    return bundle.lines(key, start, stop)
+
+
+def close_all():
+    for bundle in _open_bundles.values():
+        bundle.close()
+    _open_bundles.clear()